@@ -166,6 +166,162 @@ class TestEnhancedJSONConfigParser:
                         assert isinstance(choice_config, str), f"Simple choice must be string in {config_file.name}"
 
 
+class TestEnhancedJsonConfigResolution:
+    """Test value and pattern resolution in EnhancedJsonConfig."""
+
+    def test_pattern_precedence_follows_configuration_order(self):
+        """Test the first configured matching pattern wins across wildcard kinds."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "patterns": {
+                "*/Address": "address",
+                "Customer*": "customer",
+                "*ID": "identifier",
+                "Pass*Name": "passenger"
+            }
+        })
+
+        assert config._match_patterns("CustomerID", "/Root/CustomerID") == "customer"
+        assert config._match_patterns("BookingID", "/Root/BookingID") == "identifier"
+        assert config._match_patterns("Address", "/Root/Address") == "address"
+        assert config._match_patterns("PassengerName", "/Root/PassengerName") == "passenger"
+        assert config._match_patterns("Amount", "/Root/Amount") is None
+
+    def test_pattern_literal_characters_are_escaped(self):
+        """Test only '*' acts as a wildcard; dots in patterns match literally."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "patterns": {
+                "v1.*Code": "versioned"
+            }
+        })
+
+        assert config._match_patterns("v1.TaxCode", "/Root/v1.TaxCode") == "versioned"
+        assert config._match_patterns("v10TaxCode", "/Root/v10TaxCode") is None
+
+    def test_attribute_pattern_matching(self):
+        """Test attribute patterns honour both element and attribute wildcards."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "patterns": {
+                "Price@Curr*": "EUR",
+                "*@*Code": "X1"
+            }
+        })
+
+        assert config._match_attribute_patterns("Currency", "/Booking/Price") == "EUR"
+        assert config._match_attribute_patterns("Currency", "/Booking/Fee") is None
+        assert config._match_attribute_patterns("CountryCode", "/Booking/Fee") == "X1"
+
+    def test_attribute_selectors(self):
+        """Test XPath-style attribute selectors from the attributes section."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "attributes": {
+                "//Price/@Code": "P1",
+                "//*[@Currency]": "USD",
+                "Code": "ignored"
+            }
+        })
+
+        assert config.resolve_attribute_value("/Booking/Price", "Code") == "P1"
+        assert config.resolve_attribute_value("/Booking/Fee", "Code") is None
+        assert config.resolve_attribute_value("/Booking/Fee", "Currency") == "USD"
+
+    def test_value_precedence_absolute_dot_simple(self):
+        """Test absolute paths beat dot notation, which beats simple names."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "values": {
+                "Name": "simple",
+                "Booking.Passenger.Name": "dotted",
+                "/Booking/Passenger/Name": "absolute",
+                "Booking.Agent.Name": "agent"
+            }
+        })
+
+        assert config.resolve_element_value("/Booking/Passenger/Name", "Name") == "absolute"
+        assert config.resolve_element_value("/Booking/Agent/Name", "Name") == "agent"
+        assert config.resolve_element_value("/Booking/Contact/Name", "Name") == "simple"
+        assert config.resolve_element_value("/Booking/Contact/Phone", "Phone") is None
+
+    def test_seeded_generators_are_reproducible(self):
+        """Test generators draw from the config seed and all generator types resolve."""
+        specs = ["generate:alpha:8", "generate:number:1:100000", "generate:currency:5:50"]
+        first = EnhancedJsonConfig({"schema": "1_test.xsd", "seed": 42})
+        second = EnhancedJsonConfig({"schema": "1_test.xsd", "seed": 42})
+
+        assert [first._resolve_value(spec) for spec in specs] == [second._resolve_value(spec) for spec in specs]
+
+        future_date = first._resolve_value("generate:date:future")
+        assert future_date != "generate:date:future"
+        assert len(future_date) == 10
+
+    def test_to_dict_view_and_deep_copy(self):
+        """Test to_dict returns a read-only view unless a deep copy is requested."""
+        config = EnhancedJsonConfig({"schema": "1_test.xsd", "values": {"Name": "A"}})
+
+        view = config.to_dict()
+        assert view["values"] == {"Name": "A"}
+        with pytest.raises(TypeError):
+            view["schema"] = "other.xsd"
+
+        snapshot = config.to_dict(deep_copy=True)
+        snapshot["values"]["Name"] = "B"
+        assert config.values["Name"] == "A"
+
+    def test_streaming_overrides_match_in_memory(self, tmp_path):
+        """Test streamed override application writes the same document as the in-memory path."""
+        base_xml = ('<Booking Ref="R1"><Passenger Code="A"><Name>x</Name></Passenger>'
+                    '<Passenger Code="B"><Name>y</Name></Passenger>tail</Booking>')
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "values": {"Name": "simple", "Passenger@Code": "PC"},
+            "patterns": {"Na*": "pattern"},
+            "attributes": {"//Booking/@Ref": "R2"}
+        })
+        source = tmp_path / "base.xml"
+        source.write_text(base_xml)
+        output = tmp_path / "enhanced.xml"
+
+        expected = XMLOverrideEngine(config).apply_overrides(base_xml)
+        XMLOverrideEngine(config).apply_overrides_streaming(source, output)
+
+        assert output.read_text() == expected
+
+    def test_any_element_attribute_selector(self, tmp_path):
+        """Test //*[@Attr] selectors update the attribute on every element, in memory and streamed."""
+        base_xml = ('<Booking><Payment><Amount Currency="EUR">10</Amount></Payment>'
+                    '<Refund Currency="EUR"/><Note>n</Note></Booking>')
+        config = EnhancedJsonConfig({"schema": "1_test.xsd", "attributes": {"//*[@Currency]": "USD"}})
+        assert config.resolve_attribute_value("Amount", "Currency") == "USD"
+        
+        in_memory = XMLOverrideEngine(config).apply_overrides(base_xml)
+        assert in_memory.count('Currency="USD"') == 2
+        assert 'EUR' not in in_memory
+        
+        source = tmp_path / "base.xml"
+        source.write_text(base_xml)
+        output = tmp_path / "enhanced.xml"
+        XMLOverrideEngine(config).apply_overrides_streaming(source, output)
+        assert output.read_text() == in_memory
+    
+    def test_override_summary_counts_unless_audited(self):
+        """Test the override summary holds counts by default and formatted records when auditing."""
+        base_xml = '<Booking Ref="R1"><Name>x</Name></Booking>'
+        config = EnhancedJsonConfig({"schema": "1_test.xsd", "values": {"/Booking@Ref": "R2"}, "patterns": {"Na*": "N"}})
+
+        engine = XMLOverrideEngine(config)
+        engine.apply_overrides(base_xml)
+        assert engine.get_override_summary() == {"values": 1, "patterns": 1, "templates": 0, "attributes": 0}
+
+        audited = XMLOverrideEngine(config, audit=True)
+        audited.apply_overrides(base_xml)
+        summary = audited.get_override_summary()
+        assert summary["values"] == ["/Booking@Ref = R2"]
+        assert summary["patterns"] == ["Booking/Name = N"]
+
+
 class TestTemplateEngine:
     """Test the template engine functionality."""
     
@@ -214,6 +370,20 @@ class TestTemplateEngine:
         assert template_engine is not None
         print("✅ Template engine initialization successful")
     
+    def test_template_summary_is_a_copy(self, template_engine):
+        """Test mutating a template summary leaves the cached summary and templates unchanged."""
+        summary = template_engine.get_template_summary()
+        for template_summary in summary['templates'].values():
+            template_summary['fields']['Injected'] = "Value"
+            template_summary['data_count'] = -1
+        summary['templates'].clear()
+        
+        fresh = template_engine.get_template_summary()
+        assert fresh['templates']
+        for template_summary in fresh['templates'].values():
+            assert 'Injected' not in template_summary['fields']
+            assert template_summary['data_count'] >= 0
+    
     def test_template_functionality(self, template_engine):
         """Test basic template functionality."""
         # Test that template engine works with the configuration
@@ -265,6 +435,163 @@ class TestChoiceResolver:
             # Allow failures during development
             assert True
 
+    def test_base_generator_choices_cache_invalidation(self, choice_resolver):
+        """Test cached base choices are refreshed when choices change."""
+        assert choice_resolver.get_base_generator_choices() == {"TravelBooking": "PickupLocation"}
+
+        # Returned dict is a copy, so mutating it must not poison the cache
+        choice_resolver.get_base_generator_choices()["Injected"] = "Value"
+        assert "Injected" not in choice_resolver.get_base_generator_choices()
+
+        choice_resolver._add_simple_choice("PaymentMethod", "CreditCard")
+        assert choice_resolver.get_base_generator_choices() == {
+            "TravelBooking": "PickupLocation",
+            "PaymentMethod": "CreditCard"
+        }
+        assert choice_resolver.get_choice_summary()['total_resolved'] == 2
+
+        summary = choice_resolver.get_choice_summary()
+        summary['resolved_choices']['PaymentMethod']['selected'] = "Cash"
+        summary['resolved_choices'].clear()
+        assert choice_resolver.get_choice_summary()['resolved_choices']['PaymentMethod']['selected'] == "CreditCard"
+
+    def test_apply_choices_skips_comments_in_lxml_trees(self, choice_resolver):
+        """Test choice removal walks lxml trees holding comments and processing instructions."""
+        from lxml import etree
+        
+        root = etree.fromstring(
+            "<Root><!-- note --><?pi data?><TravelBooking><DeliveryAddress/><PickupLocation/></TravelBooking></Root>"
+        )
+        choice_resolver.apply_choices_to_xml(etree.ElementTree(root))
+        
+        booking = root.find("TravelBooking")
+        assert [child.tag for child in booking] == ["PickupLocation"]
+        assert len(root) == 3
+    
+    def test_conditional_choice_evaluation(self):
+        """Test numeric and string conditions evaluate against XML values."""
+        import xml.etree.ElementTree as ET
+
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "choices": {
+                "Payment": {
+                    "conditions": [
+                        {"if": "TotalAmount > 1000", "choose": "Invoice"},
+                        {"if": "CustomerType == 'Business'", "choose": "Account"},
+                        {"if": "Currency < 5", "choose": "Never"}
+                    ],
+                    "default": "CreditCard"
+                }
+            }
+        })
+        resolver = ChoiceResolver(config)
+        xml_tree = ET.ElementTree(ET.fromstring(
+            "<Booking><TotalAmount>1500.50</TotalAmount>"
+            "<CustomerType>Business</CustomerType><Currency>EUR</Currency></Booking>"
+        ))
+
+        resolved = resolver.resolve_choices_for_xml(xml_tree)
+        assert resolved["TotalAmount"] == "Invoice"
+        assert resolved["CustomerType"] == "Account"
+        # Non-numeric values never satisfy ordering operators
+        assert "Currency" not in resolved
+
+    def test_condition_parsing_operators(self, choice_resolver):
+        """Test each condition form is routed to the right operator."""
+        parse = choice_resolver._parse_condition
+
+        condition = parse("TotalAmount >= 500", "Invoice", "Payment")
+        assert (condition.operator, condition.value, condition.numeric_value) == ('>=', '500', 500.0)
+
+        condition = parse("Country in ['US', 'CA']", "Domestic", "Shipping")
+        assert condition.operator == 'in'
+        assert set(condition.value) == {'US', 'CA'}
+
+        condition = parse("Code matches ^A<1", "Special", "Handling")
+        assert (condition.operator, condition.value) == ('matches', '^A<1')
+
+        assert parse("not a condition", "X", "Y") is None
+
+    def test_streamed_element_values_match_tree_walk(self):
+        """Test iterparse streaming collects the same values as the tree walk."""
+        import io
+        import xml.etree.ElementTree as ET
+
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "choices": {
+                "Payment": {"conditions": [{"if": "Amount > 10", "choose": "Invoice"}]}
+            }
+        })
+        resolver = ChoiceResolver(config)
+        xml_bytes = (b"<Booking id='B1'><Amount>20</Amount>"
+                     b"<Passenger type='ADT'><Name>Ann</Name></Passenger></Booking>")
+
+        from_tree = resolver.resolve_choices_for_xml(ET.ElementTree(ET.fromstring(xml_bytes)))
+        tree_values = dict(resolver.element_values)
+
+        from_stream = resolver.resolve_choices_for_xml(None, source=io.BytesIO(xml_bytes))
+        assert resolver.element_values == tree_values
+        assert from_stream == from_tree == {"Amount": "Invoice"}
+
+    def test_streamed_siblings_are_released(self, monkeypatch):
+        """Test processed siblings are removed from their parent while streaming."""
+        import io
+        import xml.etree.ElementTree as ET
+
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "choices": {
+                "Payment": {"conditions": [{"if": "Amount > 10", "choose": "Invoice"}]}
+            }
+        })
+        resolver = ChoiceResolver(config)
+        xml_bytes = b"<Booking>" + b"<Amount>20</Amount>" * 50 + b"<Passenger><Name>Ann</Name></Passenger></Booking>"
+
+        children_at_end = {}
+        iterparse = ET.iterparse
+
+        def recording_iterparse(source, events=None):
+            for event, element in iterparse(source, events=events):
+                if event == 'end':
+                    children_at_end[element.tag] = len(element)
+                yield event, element
+
+        monkeypatch.setattr(ET, "iterparse", recording_iterparse)
+        assert resolver.resolve_choices_for_xml(None, source=io.BytesIO(xml_bytes)) == {"Amount": "Invoice"}
+        assert children_at_end["Booking"] == 0 and children_at_end["Passenger"] == 0
+        assert resolver.element_values["Booking/Passenger/Name"] == "Ann"
+
+    def test_batch_condition_evaluation(self):
+        """Test batch evaluation agrees with per-document condition semantics."""
+        config = EnhancedJsonConfig({
+            "schema": "1_test.xsd",
+            "choices": {
+                "Payment": {
+                    "conditions": [
+                        {"if": "Amount > 10", "choose": "Invoice"},
+                        {"if": "Type == 'B'", "choose": "Account"},
+                        {"if": "Code >= 3", "choose": "Priority"},
+                        {"if": "Missing < 1", "choose": "Never"}
+                    ]
+                }
+            }
+        })
+        resolver = ChoiceResolver(config)
+
+        matrix = resolver.evaluate_conditions_batch({
+            "Amount": ["20", "5", None],
+            "Type": ["B", "A", "B"],
+            "Code": ["n/a", "4", "3"]
+        })
+
+        assert [list(map(bool, row)) for row in matrix] == [
+            [True, True, False, False],
+            [False, False, True, False],
+            [False, True, True, False]
+        ]
+
 
 class TestXPathResolver:
     """Test XPath resolution functionality."""
@@ -298,7 +625,47 @@ class TestXPathResolver:
         result = xpath_resolver.match_pattern("FirstName", "*ID")
         assert result is False
         
+        # Only '*' is a wildcard; other regex characters match literally
+        assert xpath_resolver.match_pattern("v1.Code", "v1.*Code") is True
+        assert xpath_resolver.match_pattern("v10Code", "v1.*Code") is False
+        
         print("✅ Pattern matching test successful")
+    
+    def test_path_normalization(self, xpath_resolver):
+        """Test indices stay on their own component and other forms keep their text."""
+        assert xpath_resolver.normalize_path("/Booking/Passenger[2]/Name@lang") == "/Booking/Passenger[2]/Name@lang"
+        assert xpath_resolver.normalize_path("Booking.Passenger[1].Name") == "Booking.Passenger.Name"
+        assert xpath_resolver.normalize_path("Passenger[2]") == "Passenger[2]"
+        assert xpath_resolver.normalize_path("Passenger@Code") == "Passenger@Code"
+    
+    def test_absolute_path_sees_tree_edits(self, xpath_resolver):
+        """Test absolute paths resolve against the current children after a child is replaced."""
+        import xml.etree.ElementTree as ET
+        
+        root = ET.fromstring("<R><A/><B/></R>")
+        tree = ET.ElementTree(root)
+        assert len(xpath_resolver.resolve_path(tree, "/R/A")) == 1
+        
+        root.remove(root[0])
+        ET.SubElement(root, "C")
+        assert xpath_resolver.resolve_path(tree, "/R/A") == []
+        assert xpath_resolver.resolve_path(tree, "/R/C") == [root[1]]
+    
+    def test_path_precedence(self, xpath_resolver):
+        """Test sorting by precedence key orders paths exactly as their scores rank them."""
+        paths = ["*ID", "Passenger", "Booking.Passenger", "/Booking/Passenger"]
+        assert sorted(paths, key=xpath_resolver.precedence_key, reverse=True) == list(reversed(paths))
+        
+        # A long dot path outscores a short absolute one, so the key must rank it first too
+        assert xpath_resolver.get_path_precedence("/A") == 1050
+        assert xpath_resolver.get_path_precedence("B.C.D.E.F.G") == 1100
+        assert sorted(["/A", "B.C.D.E.F.G"], key=xpath_resolver.precedence_key, reverse=True) == ["B.C.D.E.F.G", "/A"]
+        
+        mixed = ["/A", "B.C.D.E.F.G", "Passenger@Code", "{urn:x}Name", "/Booking[2]/Passenger", "*ID", ""]
+        by_key = sorted(mixed, key=xpath_resolver.precedence_key)
+        assert [xpath_resolver.get_path_precedence(path) for path in by_key] == \
+            sorted(xpath_resolver.get_path_precedence(path) for path in mixed)
+        assert xpath_resolver.precedence_key("") == 0
 
 
 class TestEnhancedXMLGeneration:
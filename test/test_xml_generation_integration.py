@@ -7,6 +7,7 @@ validating that all components work together correctly.
 """
 
 import pytest
+import io
 import json
 import os
 import tempfile
@@ -386,6 +387,83 @@ class TestXMLGenerationIntegration:
         
         print(f"✅ Large config performance test successful: {generation_time:.2f}s")
 
+    def test_batch_generation_matches_single_shot(self, test_schema_path):
+        """Test that batch generation returns one result per request, in order."""
+        if not os.path.exists(test_schema_path):
+            pytest.skip(f"Test schema not found: {test_schema_path}")
+
+        generator = EnhancedXMLGenerator(test_schema_path)
+        params_list = [("complete", None, None), ("minimal", None, None), ("complete", None, None)]
+
+        results = generator.generate_batch(params_list, processes=2)
+
+        assert len(results) == len(params_list)
+        for (mode, _, _), result in zip(params_list, results):
+            assert result.metadata['mode'] == mode
+            assert '<TravelBooking' in result.xml_content
+
+        print("✅ Batch generation successful")
+
+    def test_generate_xml_to_stream(self, test_schema_path, config_directory):
+        """Test that streamed output equals the string result for the same config and seed."""
+        if not os.path.exists(test_schema_path):
+            pytest.skip(f"Test schema not found: {test_schema_path}")
+
+        business_config_path = config_directory / "1_xsd_travel_booking_business_config.json"
+        if not business_config_path.exists():
+            pytest.skip("Business config not found")
+
+        generator = EnhancedXMLGenerator(test_schema_path, business_config_path)
+        buffer = io.BytesIO()
+        metadata = generator.generate_xml_to_stream(buffer)
+
+        xml_bytes = buffer.getvalue()
+        assert xml_bytes.startswith(b'<?xml')
+        root = etree.fromstring(xml_bytes)
+        assert etree.QName(root).localname == 'TravelBooking'
+        assert metadata['generation_type'] == 'enhanced'
+
+        # A fresh generator starts from the same seed, so the string result must match byte for byte
+        result = EnhancedXMLGenerator(test_schema_path, business_config_path).generate_xml()
+        assert xml_bytes == result.xml_content.encode('utf-8')
+
+        print("✅ Streamed XML generation successful")
+
+    def test_generate_xml_async(self, test_schema_path):
+        """Test that queued generations resolve in order on the worker thread."""
+        if not os.path.exists(test_schema_path):
+            pytest.skip(f"Test schema not found: {test_schema_path}")
+
+        generator = EnhancedXMLGenerator(test_schema_path)
+        try:
+            futures = [generator.generate_xml_async(mode) for mode in ("complete", "minimal")]
+            results = [future.result(timeout=60) for future in futures]
+        finally:
+            generator.close()
+
+        assert [result.metadata['mode'] for result in results] == ["complete", "minimal"]
+        assert all('<TravelBooking' in result.xml_content for result in results)
+
+        print("✅ Async XML generation successful")
+
+    def test_generators_share_parsed_schema_only(self, test_schema_path, tmp_path):
+        """Test that generators reuse the parsed schema until its file changes, but never a base generator."""
+        if not os.path.exists(test_schema_path):
+            pytest.skip(f"Test schema not found: {test_schema_path}")
+
+        schema_path = tmp_path / "schema.xsd"
+        schema_path.write_bytes(Path(test_schema_path).read_bytes())
+
+        first = EnhancedXMLGenerator(schema_path)
+        second = EnhancedXMLGenerator(schema_path)
+        assert first.base_generator is not second.base_generator
+        assert first.base_generator.schema is second.base_generator.schema
+
+        mtime = schema_path.stat().st_mtime
+        os.utime(schema_path, (mtime + 10, mtime + 10))
+        third = EnhancedXMLGenerator(schema_path)
+        assert third.base_generator.schema is not first.base_generator.schema
+
 
 class TestConfigToXMLConsistency:
     """Test consistency between config settings and generated XML."""
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for XPath Resolver.
+
+Tests for streamed file resolution, compiled selectors, namespace-qualified
+lookups, and path precedence ordering.
+"""
+
+import pytest
+import xml.etree.ElementTree as ET
+from utils.xpath_resolver import XPathResolver
+
+
+NESTED_XML = (
+    '<Root>'
+    '<Group><Item id="1"><Item id="2"><Value>x</Value></Item></Item><Other><Value>y</Value></Other></Group>'
+    '<Item id="3"/>'
+    '</Root>'
+)
+
+NAMESPACED_XML = (
+    '<Root xmlns:t="urn:travel" xmlns:o="urn:other">'
+    '<t:Name>travel</t:Name><o:Name>other</o:Name><Name>plain</Name>'
+    '</Root>'
+)
+
+
+class TestResolveInFile:
+    """Test path resolution while streaming an XML file."""
+
+    @pytest.fixture
+    def resolver(self):
+        """Provide XPathResolver instance."""
+        return XPathResolver()
+
+    @pytest.fixture
+    def nested_file(self, tmp_path):
+        """Write a document with nested matches under a non-matching ancestor."""
+        path = tmp_path / "nested.xml"
+        path.write_text(NESTED_XML)
+        return path
+
+    def test_nested_matches_in_document_order(self, resolver, nested_file):
+        """Test matches nested in other matches are all returned, in document order."""
+        matches = resolver.resolve_in_file(str(nested_file), "Item")
+        assert [element.get("id") for element in matches] == ["1", "2", "3"]
+
+    def test_matches_survive_cleared_ancestors(self, resolver, nested_file):
+        """Test matches keep their whole subtree although their ancestors are cleared."""
+        outer, inner, _ = resolver.resolve_in_file(str(nested_file), "Item")
+        assert list(outer) == [inner]
+        assert inner.find("Value").text == "x"
+
+    def test_non_matching_subtrees_are_cleared(self, resolver, nested_file, monkeypatch):
+        """Test ancestors and subtrees without open matches are cleared while streaming."""
+        parsed = {}
+        iterparse = ET.iterparse
+
+        def recording_iterparse(source, events=None):
+            for event, element in iterparse(source, events=events):
+                parsed.setdefault(element.tag, []).append(element)
+                yield event, element
+
+        monkeypatch.setattr(ET, "iterparse", recording_iterparse)
+        matches = resolver.resolve_in_file(str(nested_file), "Item")
+
+        root, group, other = parsed["Root"][0], parsed["Group"][0], parsed["Other"][0]
+        assert len(root) == 0 and len(group) == 0 and len(other) == 0
+        assert matches[0].find("Item/Value").text == "x"
+
+    def test_pattern_matches_agree_with_resolve_path(self, resolver, nested_file):
+        """Test streamed pattern matches equal the in-memory resolution."""
+        tree = ET.parse(nested_file)
+        expected = [element.tag for element in resolver.resolve_path(tree, "*e*")]
+        assert [element.tag for element in resolver.resolve_in_file(str(nested_file), "*e*")] == expected
+
+
+class TestNamespaceResolution:
+    """Test namespace-qualified paths match only the exact namespace."""
+
+    @pytest.fixture
+    def resolver(self):
+        """Provide XPathResolver with a prefix mapped to a namespace URI."""
+        return XPathResolver(namespace_map={"t": "urn:travel"})
+
+    @pytest.fixture
+    def tree(self):
+        """Provide a tree with the same local name in several namespaces."""
+        return ET.ElementTree(ET.fromstring(NAMESPACED_XML))
+
+    def test_prefix_from_namespace_map(self, resolver, tree):
+        """Test a mapped prefix resolves to its URI."""
+        assert [element.text for element in resolver.resolve_path(tree, "{t}Name")] == ["travel"]
+
+    def test_literal_namespace_uri(self, resolver, tree):
+        """Test braces may also hold the namespace URI itself."""
+        assert [element.text for element in resolver.resolve_path(tree, "{urn:other}Name")] == ["other"]
+
+    def test_unknown_namespace_matches_nothing(self, resolver, tree):
+        """Test an unmapped prefix no longer matches the local name in any namespace."""
+        assert resolver.resolve_path(tree, "{x}Name") == []
+
+    def test_streamed_namespace_matches(self, resolver, tmp_path):
+        """Test resolve_in_file applies the same namespace rules."""
+        path = tmp_path / "namespaced.xml"
+        path.write_text(NAMESPACED_XML)
+        assert [element.text for element in resolver.resolve_in_file(str(path), "{t}Name")] == ["travel"]
+        assert resolver.resolve_in_file(str(path), "{x}Name") == []
+
+
+class TestCompiledSelectors:
+    """Test compiled selectors are cached and resolve like resolve_path."""
+
+    @pytest.fixture
+    def resolver(self):
+        """Provide XPathResolver instance."""
+        return XPathResolver()
+
+    def test_selector_is_cached_per_path(self, resolver):
+        """Test compiling the same path twice returns the same selector."""
+        assert resolver.compile("Root.Group.Item") is resolver.compile("Root.Group.Item")
+
+    @pytest.mark.parametrize("path", ["/Root/Group/Item", "Root.Group.Item", "Item", "*tem", "Value"])
+    def test_selector_matches_resolve_path(self, resolver, path):
+        """Test each path type selects the same elements through compile and resolve_path."""
+        tree = ET.ElementTree(ET.fromstring(NESTED_XML))
+        assert resolver.compile(path)(tree) == resolver.resolve_path(tree, path)
+
+
+class TestPathPrecedence:
+    """Test precedence keys order paths exactly as their scores do."""
+
+    def test_sorted_by_key_matches_scores(self):
+        """Test sorting by precedence_key gives the ordering of get_path_precedence."""
+        resolver = XPathResolver()
+        paths = ["/A", "B.C.D.E.F.G", "Passenger@Code", "{urn:x}Name", "/Booking[2]/Passenger", "*ID", "Name", ""]
+
+        by_key = sorted(paths, key=resolver.precedence_key, reverse=True)
+        scores = [resolver.get_path_precedence(path) for path in by_key]
+        assert scores == sorted(scores, reverse=True)
+        assert by_key.index("B.C.D.E.F.G") < by_key.index("/A")
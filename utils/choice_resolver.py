@@ -21,14 +21,22 @@ Architecture:
 """
 
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple, Set
+from typing import Dict, List, Optional, Any, Union, IO, Sequence
+from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
+from operator import gt, lt, ge, le
 import re
 import logging
 
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 from .enhanced_json_config import EnhancedJsonConfig
-from .xpath_resolver import XPathResolver, PathExpression
+from .xpath_resolver import XPathResolver, PathExpression, PathType
 
 
 class ChoiceType(Enum):
@@ -39,6 +47,15 @@ class ChoiceType(Enum):
     NESTED = "nested"           # Multiple choice levels
 
 
+# Conditional choice expressions (two-character operators listed first)
+_CONDITION_COMPARISON = re.compile(r'(\S+)\s*(>=|<=|==|!=|>|<)\s*(.+)')  # Comparison operators
+_CONDITION_IN = re.compile(r'(\S+)\s+in\s+\[(.+)\]')                 # In operator
+_CONDITION_MATCHES = re.compile(r'(\S+)\s+matches\s+(.+)')            # Pattern matching
+
+# Ordering operators; the same callables compare scalars and NumPy arrays
+_ORDERING_OPERATORS = {'>': gt, '<': lt, '>=': ge, '<=': le}
+
+
 @dataclass
 class ChoiceSelection:
     """Represents a choice selection with context."""
@@ -57,6 +74,8 @@ class ChoiceCondition:
     operator: str
     value: Any
     choice_selection: str
+    numeric_value: Optional[float] = None  # Pre-parsed value for ordering operators
+    choice_element: Optional[str] = None   # Element name derived from field_path
 
 
 class ChoiceResolverError(Exception):
@@ -88,15 +107,26 @@ class ChoiceResolver:
         
         # Choice resolution state
         self.resolved_choices: Dict[str, ChoiceSelection] = {}
+        self._selectable_choices: Dict[str, ChoiceSelection] = {}  # SIMPLE and PATH_SPECIFIC entries
         self.conditional_choices: List[ChoiceCondition] = []
         self.nested_choices: Dict[str, List[str]] = {}
+        self._has_conditionals = False
+        
+        # Cached views over resolved_choices (invalidated when choices change)
+        self._base_choices_cache: Optional[Dict[str, str]] = None
+        self._choice_summary_cache: Optional[Dict[str, Any]] = None
+        
+        # Parsed path expressions reused across choice applications
+        self._compiled_paths: Dict[str, PathExpression] = {}
         
         # XML context for conditional evaluation
         self.xml_context: Optional[ET.ElementTree] = None
         self.element_values: Dict[str, str] = {}
+        self._numeric_values: Dict[str, float] = {}  # Lazily parsed float forms of element_values
         
         # Parse choice configuration
         self._parse_choice_configuration()
+        self._precompile_choice_paths()
     
     def _parse_choice_configuration(self) -> None:
         """Parse choice configuration from enhanced config."""
@@ -132,6 +162,8 @@ class ChoiceResolver:
         )
         
         self.resolved_choices[choice_path] = choice_selection
+        self._selectable_choices[choice_path] = choice_selection
+        self._invalidate_choice_caches()
     
     def _add_conditional_choice(self, choice_path: str, choice_config: Dict) -> None:
         """Add a conditional choice with evaluation rules."""
@@ -148,6 +180,8 @@ class ChoiceResolver:
                 if choice_condition:
                     self.conditional_choices.append(choice_condition)
         
+        self._has_conditionals = bool(self.conditional_choices)
+        
         # Add default choice if specified
         if default_choice:
             choice_selection = ChoiceSelection(
@@ -158,41 +192,66 @@ class ChoiceResolver:
                 condition={'type': 'default'}
             )
             self.resolved_choices[f"{choice_path}_default"] = choice_selection
+        
+        self._invalidate_choice_caches()
+    
+    def _precompile_choice_paths(self) -> None:
+        """Parse every configured choice path up front so applying choices never re-parses."""
+        paths = set()
+        for choice_selection in self.resolved_choices.values():
+            if choice_selection.choice_type == ChoiceType.PATH_SPECIFIC:
+                paths.add(choice_selection.choice_path)
+            else:
+                paths.add(choice_selection.choice_element)
+        paths.update(condition.field_path for condition in self.conditional_choices)
+        
+        for path in paths:
+            try:
+                self._get_path_expression(path)
+            except Exception as e:
+                # Left unparsed; the error is reported when the choice is applied
+                self.logger.debug("Could not precompile choice path %s: %s", path, e)
+    
+    def _invalidate_choice_caches(self) -> None:
+        """Drop cached choice views after resolved choices change."""
+        self._base_choices_cache = None
+        self._choice_summary_cache = None
     
     def _parse_condition(self, if_clause: str, choose_clause: str, choice_path: str) -> Optional[ChoiceCondition]:
         """Parse a conditional choice rule."""
         try:
             # Parse condition: "TotalAmount > 1000", "CustomerType == 'Business'"
-            condition_patterns = [
-                r'(\S+)\s*(>|<|>=|<=|==|!=)\s*(.+)',  # Comparison operators
-                r'(\S+)\s+in\s+\[(.+)\]',             # In operator
-                r'(\S+)\s+matches\s+(.+)'             # Pattern matching
-            ]
+            # Route on the operator keyword so only one pattern is tried
+            clause = if_clause.strip()
             
-            for pattern in condition_patterns:
-                match = re.match(pattern, if_clause.strip())
+            if ' matches ' in clause:
+                match = _CONDITION_MATCHES.match(clause)
                 if match:
-                    if '>' in if_clause or '<' in if_clause or '==' in if_clause or '!=' in if_clause:
-                        field_path = match.group(1)
-                        operator = match.group(2)
-                        value = match.group(3).strip('\'"')
-                    elif ' in ' in if_clause:
-                        field_path = match.group(1)
-                        operator = 'in'
-                        value = [v.strip('\'" ') for v in match.group(2).split(',')]
-                    elif ' matches ' in if_clause:
-                        field_path = match.group(1)
-                        operator = 'matches'
-                        value = match.group(2).strip('\'"')
-                    else:
-                        continue
-                    
-                    return ChoiceCondition(
-                        field_path=field_path,
-                        operator=operator,
-                        value=value,
-                        choice_selection=choose_clause
-                    )
+                    field_path = match.group(1)
+                    operator = 'matches'
+                    value = match.group(2).strip('\'"')
+            elif ' in ' in clause and clause.endswith(']'):
+                match = _CONDITION_IN.match(clause)
+                if match:
+                    field_path = match.group(1)
+                    operator = 'in'
+                    value = frozenset(v.strip('\'" ') for v in match.group(2).split(','))
+            else:
+                match = _CONDITION_COMPARISON.match(clause)
+                if match:
+                    field_path = match.group(1)
+                    operator = match.group(2)
+                    value = match.group(3).strip('\'"')
+            
+            if match:
+                return ChoiceCondition(
+                    field_path=field_path,
+                    operator=operator,
+                    value=value,
+                    choice_selection=choose_clause,
+                    numeric_value=self._parse_numeric(value) if operator in ('>', '<', '>=', '<=') else None,
+                    choice_element=self._extract_choice_element(field_path)
+                )
             
             self.logger.warning(f"Could not parse condition: {if_clause}")
             return None
@@ -211,30 +270,40 @@ class ChoiceResolver:
             # Simple element name
             return choice_path
     
-    def resolve_choices_for_xml(self, xml_tree: ET.ElementTree) -> Dict[str, str]:
+    def resolve_choices_for_xml(self, xml_tree: Optional[ET.ElementTree],
+                                source: Optional[Union[str, Path, IO[bytes]]] = None) -> Dict[str, str]:
         """
         Resolve all choices for the given XML tree.
         
         Args:
             xml_tree: XML tree to resolve choices for
+            source: Optional XML file path or binary file object. When given,
+                element values are streamed from it with iterparse instead of
+                walking xml_tree, which keeps memory bounded for very large
+                documents (xml_tree may then be None).
             
         Returns:
             Dictionary of resolved choices for base XMLGenerator
         """
         self.xml_context = xml_tree
-        self._extract_element_values()
+        
+        # Element values are only needed to evaluate conditional choices
+        if self._has_conditionals:
+            if source is not None:
+                self._stream_element_values(source)
+            else:
+                self._extract_element_values()
         
         resolved = {}
         
         # Process simple choices first
-        for choice_path, choice_selection in self.resolved_choices.items():
-            if choice_selection.choice_type in [ChoiceType.SIMPLE, ChoiceType.PATH_SPECIFIC]:
-                resolved[choice_selection.choice_element] = choice_selection.selected_option
+        for choice_selection in self._selectable_choices.values():
+            resolved[choice_selection.choice_element] = choice_selection.selected_option
         
         # Process conditional choices
         for condition in self.conditional_choices:
             if self._evaluate_condition(condition):
-                choice_element = self._extract_choice_element(condition.field_path)
+                choice_element = condition.choice_element or self._extract_choice_element(condition.field_path)
                 resolved[choice_element] = condition.choice_selection
         
         return resolved
@@ -251,10 +320,13 @@ class ChoiceResolver:
         """
         self.xml_context = xml_tree
         
+        # Collect targets of all simple-name choices in one tree walk instead of one walk per choice
+        elements_by_name = self._collect_simple_choice_targets(xml_tree)
+        
         # Find and remove unselected choice elements
         for choice_path, choice_selection in self.resolved_choices.items():
             try:
-                self._apply_single_choice(xml_tree, choice_selection)
+                self._apply_single_choice(xml_tree, choice_selection, elements_by_name)
             except Exception as e:
                 self.logger.error(f"Failed to apply choice {choice_path}: {e}")
         
@@ -268,13 +340,41 @@ class ChoiceResolver:
         
         return xml_tree
     
-    def _apply_single_choice(self, xml_tree: ET.ElementTree, choice_selection: ChoiceSelection) -> None:
+    def _collect_simple_choice_targets(self, xml_tree: ET.ElementTree) -> Dict[str, List[ET.Element]]:
+        """Bucket elements by local name for every choice addressed by a simple element name."""
+        elements_by_name: Dict[str, List[ET.Element]] = {}
+        for choice_selection in self.resolved_choices.values():
+            if choice_selection.choice_type == ChoiceType.PATH_SPECIFIC:
+                continue
+            try:
+                path_expr = self._get_path_expression(choice_selection.choice_element)
+            except Exception:
+                continue  # Reported when the choice itself is applied
+            if path_expr.path_type == PathType.SIMPLE and not path_expr.has_index:
+                elements_by_name[choice_selection.choice_element] = []
+        
+        if not elements_by_name:
+            return elements_by_name
+        
+        for element in xml_tree.getroot().iter():
+            if not isinstance(element.tag, str):
+                continue  # Comments and processing instructions in lxml trees
+            bucket = elements_by_name.get(self._get_local_name(element.tag))
+            if bucket is not None:
+                bucket.append(element)
+        
+        return elements_by_name
+    
+    def _apply_single_choice(self, xml_tree: ET.ElementTree, choice_selection: ChoiceSelection,
+                             elements_by_name: Optional[Dict[str, List[ET.Element]]] = None) -> None:
         """Apply a single choice selection to XML tree."""
         # Find choice elements in the tree
         if choice_selection.choice_type == ChoiceType.PATH_SPECIFIC:
-            choice_elements = self.xpath_resolver.resolve_path(xml_tree, choice_selection.choice_path)
+            choice_elements = self._resolve_choice_path(xml_tree, choice_selection.choice_path)
+        elif elements_by_name is not None and choice_selection.choice_element in elements_by_name:
+            choice_elements = elements_by_name[choice_selection.choice_element]
         else:
-            choice_elements = self.xpath_resolver.resolve_path(xml_tree, choice_selection.choice_element)
+            choice_elements = self._resolve_choice_path(xml_tree, choice_selection.choice_element)
         
         for choice_element in choice_elements:
             # Find parent element containing the choice
@@ -287,13 +387,25 @@ class ChoiceResolver:
         """Apply a conditional choice selection."""
         # This is a simplified implementation
         # Full conditional choice application would require more sophisticated logic
-        choice_elements = self.xpath_resolver.resolve_path(xml_tree, condition.field_path)
+        choice_elements = self._resolve_choice_path(xml_tree, condition.field_path)
         
         for choice_element in choice_elements:
             parent = self._find_choice_parent(choice_element)
             if parent is not None:
                 self._remove_unselected_options(parent, condition.choice_selection)
     
+    def _get_path_expression(self, path: str) -> PathExpression:
+        """Parse a choice path, parsing each distinct path expression only once."""
+        path_expr = self._compiled_paths.get(path)
+        if path_expr is None:
+            path_expr = self.xpath_resolver.parse_path(path)
+            self._compiled_paths[path] = path_expr
+        return path_expr
+    
+    def _resolve_choice_path(self, xml_tree: ET.ElementTree, path: str) -> List[ET.Element]:
+        """Resolve a choice path using its cached parsed expression."""
+        return self.xpath_resolver.find_elements(xml_tree, self._get_path_expression(path))
+    
     def _find_choice_parent(self, element: ET.Element) -> Optional[ET.Element]:
         """Find the parent element that contains choice options."""
         # This would need to traverse up the tree to find the choice container
@@ -302,14 +414,12 @@ class ChoiceResolver:
     
     def _remove_unselected_options(self, parent: ET.Element, selected_option: str) -> None:
         """Remove unselected choice options from parent element."""
-        children_to_remove = []
-        
-        for child in parent:
-            child_name = self._get_local_name(child.tag)
-            if child_name != selected_option:
-                # Check if this child is part of a choice group
-                # This is simplified - full implementation would need XSD analysis
-                children_to_remove.append(child)
+        # Check if each child is part of a choice group
+        # This is simplified - full implementation would need XSD analysis
+        children_to_remove = [child for child in parent
+                              if isinstance(child.tag, str) and self._get_local_name(child.tag) != selected_option]
+        if not children_to_remove:
+            return
         
         # Remove unselected children
         for child in children_to_remove:
@@ -324,67 +434,173 @@ class ChoiceResolver:
             return
         
         self.element_values = {}
+        self._numeric_values = {}
         
         def extract_recursive(element, path_components):
             element_name = self._get_local_name(element.tag)
             current_path = '/'.join(path_components + [element_name])
-            
-            # Store element text value
-            if element.text and element.text.strip():
-                self.element_values[current_path] = element.text.strip()
-                self.element_values[element_name] = element.text.strip()  # Simple name too
-            
-            # Store attribute values
-            for attr_name, attr_value in element.attrib.items():
-                attr_path = f"{current_path}@{attr_name}"
-                self.element_values[attr_path] = attr_value
-                self.element_values[f"{element_name}@{attr_name}"] = attr_value
+            self._store_element_values(element, element_name, current_path)
             
             # Recurse to children
             for child in element:
-                extract_recursive(child, path_components + [element_name])
+                if isinstance(child.tag, str):
+                    extract_recursive(child, path_components + [element_name])
         
         root = self.xml_context.getroot()
-        root_name = self._get_local_name(root.tag)
         extract_recursive(root, [])
     
+    def _stream_element_values(self, source: Union[str, Path, IO[bytes]]) -> None:
+        """Extract element values by streaming the XML source with iterparse."""
+        self.element_values = {}
+        self._numeric_values = {}
+        
+        path_components: List[str] = []
+        open_elements: List[ET.Element] = []
+        for event, element in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                path_components.append(self._get_local_name(element.tag))
+                open_elements.append(element)
+                continue
+            
+            # Text is only complete at the end event
+            self._store_element_values(element, path_components[-1], '/'.join(path_components))
+            path_components.pop()
+            open_elements.pop()
+            
+            # Release the processed subtree and detach it from its parent so
+            # finished siblings do not accumulate under the root
+            element.clear()
+            if open_elements:
+                open_elements[-1].remove(element)
+    
+    def _store_element_values(self, element: ET.Element, element_name: str, current_path: str) -> None:
+        """Record an element's text and attribute values by path and simple name."""
+        # Store element text value
+        if element.text and element.text.strip():
+            self.element_values[current_path] = element.text.strip()
+            self.element_values[element_name] = element.text.strip()  # Simple name too
+        
+        # Store attribute values
+        for attr_name, attr_value in element.attrib.items():
+            attr_path = f"{current_path}@{attr_name}"
+            self.element_values[attr_path] = attr_value
+            self.element_values[f"{element_name}@{attr_name}"] = attr_value
+    
     def _evaluate_condition(self, condition: ChoiceCondition) -> bool:
         """Evaluate a conditional choice condition."""
         try:
             # Get value for the field
-            field_value = self.element_values.get(condition.field_path)
+            field_key = condition.field_path
+            field_value = self.element_values.get(field_key)
             if field_value is None:
                 # Try simple field name
-                simple_name = condition.field_path.split('/')[-1]
-                field_value = self.element_values.get(simple_name)
+                field_key = condition.field_path.split('/')[-1]
+                field_value = self.element_values.get(field_key)
             
             if field_value is None:
                 return False
             
             # Evaluate condition based on operator
-            if condition.operator == '==':
-                return str(field_value) == str(condition.value)
-            elif condition.operator == '!=':
-                return str(field_value) != str(condition.value)
-            elif condition.operator == '>':
-                return float(field_value) > float(condition.value)
-            elif condition.operator == '<':
-                return float(field_value) < float(condition.value)
-            elif condition.operator == '>=':
-                return float(field_value) >= float(condition.value)
-            elif condition.operator == '<=':
-                return float(field_value) <= float(condition.value)
-            elif condition.operator == 'in':
-                return str(field_value) in condition.value
-            elif condition.operator == 'matches':
-                return bool(re.search(condition.value, str(field_value)))
-            
-            return False
+            return self._compare_value(condition, field_value, field_key)
             
         except Exception as e:
             self.logger.error(f"Failed to evaluate condition {condition.field_path} {condition.operator} {condition.value}: {e}")
             return False
     
+    def _compare_value(self, condition: ChoiceCondition, field_value: str, field_key: Optional[str] = None) -> bool:
+        """Apply a condition's operator to a single field value."""
+        operator = condition.operator
+        if operator == '==':
+            return field_value == condition.value
+        elif operator == '!=':
+            return field_value != condition.value
+        elif operator in _ORDERING_OPERATORS:
+            if field_key is not None:
+                number = self._get_numeric_value(field_key, field_value)
+            else:
+                number = float(field_value)
+            threshold = condition.numeric_value
+            if threshold is None:
+                threshold = float(condition.value)
+            return _ORDERING_OPERATORS[operator](number, threshold)
+        elif operator == 'in':
+            return field_value in condition.value
+        elif operator == 'matches':
+            return bool(re.search(condition.value, field_value))
+        
+        return False
+    
+    def evaluate_conditions_batch(self, values_by_field: Dict[str, Sequence[Any]]) -> Any:
+        """
+        Evaluate all conditional choices against many rows of field values.
+        
+        Ordering conditions (>, <, >=, <=) on numeric columns are evaluated as
+        vectorized NumPy comparisons. Other operators, and columns that cannot
+        be converted to floats, are evaluated row by row.
+        
+        Args:
+            values_by_field: Field path or simple name -> per-row values (equal lengths)
+            
+        Returns:
+            Boolean matrix of rows x conditions (NumPy array when NumPy is
+            available, otherwise a list of row lists)
+        """
+        row_count = len(next(iter(values_by_field.values()), ()))
+        columns = []
+        
+        for condition in self.conditional_choices:
+            values = values_by_field.get(condition.field_path)
+            if values is None:
+                values = values_by_field.get(condition.field_path.split('/')[-1])
+            
+            if values is None:
+                columns.append([False] * row_count)
+                continue
+            
+            compare = _ORDERING_OPERATORS.get(condition.operator)
+            if numpy_available and compare and condition.numeric_value is not None:
+                try:
+                    numbers = np.asarray(values, dtype=float)
+                except (TypeError, ValueError):
+                    pass  # Non-numeric column, evaluate row by row
+                else:
+                    columns.append(compare(numbers, condition.numeric_value))
+                    continue
+            
+            columns.append([self._evaluate_batch_value(condition, value) for value in values])
+        
+        if numpy_available:
+            if not columns:
+                return np.zeros((row_count, 0), dtype=bool)
+            return np.column_stack(columns).astype(bool)
+        
+        return [list(row) for row in zip(*columns)] if columns else [[] for _ in range(row_count)]
+    
+    def _evaluate_batch_value(self, condition: ChoiceCondition, value: Any) -> bool:
+        """Evaluate one batch cell; unparseable values simply do not match."""
+        if value is None:
+            return False
+        try:
+            return self._compare_value(condition, str(value))
+        except (TypeError, ValueError, re.error):
+            return False
+    
+    def _get_numeric_value(self, field_key: str, field_value: str) -> float:
+        """Get float form of an element value, parsing each value only once per XML context."""
+        number = self._numeric_values.get(field_key)
+        if number is None:
+            number = float(field_value)
+            self._numeric_values[field_key] = number
+        return number
+    
+    @staticmethod
+    def _parse_numeric(value: Any) -> Optional[float]:
+        """Parse a condition operand as float, or None if it is not numeric."""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    
     def _get_local_name(self, tag: str) -> str:
         """Extract local name from potentially namespaced tag."""
         if '}' in tag:
@@ -419,35 +635,43 @@ class ChoiceResolver:
     
     def get_choice_summary(self) -> Dict[str, Any]:
         """Get summary of resolved choices for debugging."""
-        return {
-            'simple_choices': len([c for c in self.resolved_choices.values() 
-                                 if c.choice_type in [ChoiceType.SIMPLE, ChoiceType.PATH_SPECIFIC]]),
-            'conditional_choices': len(self.conditional_choices),
-            'total_resolved': len(self.resolved_choices),
-            'resolved_choices': {
-                path: {
-                    'element': choice.choice_element,
-                    'selected': choice.selected_option,
-                    'type': choice.choice_type.value
+        if self._choice_summary_cache is None:
+            self._choice_summary_cache = {
+                'simple_choices': len(self._selectable_choices),
+                'conditional_choices': len(self.conditional_choices),
+                'total_resolved': len(self.resolved_choices),
+                'resolved_choices': {
+                    path: {
+                        'element': choice.choice_element,
+                        'selected': choice.selected_option,
+                        'type': choice.choice_type.value
+                    }
+                    for path, choice in self.resolved_choices.items()
                 }
-                for path, choice in self.resolved_choices.items()
             }
-        }
+        
+        # Fresh nested containers, so callers cannot modify the cached summary
+        summary = dict(self._choice_summary_cache)
+        summary['resolved_choices'] = {path: dict(choice) for path, choice in summary['resolved_choices'].items()}
+        return summary
     
     def get_base_generator_choices(self) -> Dict[str, str]:
         """
         Get choices in format expected by base XMLGenerator.
         
+        The result is computed once and cached until the resolved choices
+        change; a fresh copy is returned so callers may modify it freely.
+        
         Returns:
             Dictionary of choice selections for base generator
         """
-        base_choices = {}
-        
-        for choice_selection in self.resolved_choices.values():
-            if choice_selection.choice_type in [ChoiceType.SIMPLE, ChoiceType.PATH_SPECIFIC]:
-                base_choices[choice_selection.choice_element] = choice_selection.selected_option
+        if self._base_choices_cache is None:
+            self._base_choices_cache = {
+                choice_selection.choice_element: choice_selection.selected_option
+                for choice_selection in self._selectable_choices.values()
+            }
         
-        return base_choices
+        return dict(self._base_choices_cache)
     
     def __repr__(self) -> str:
         """String representation of choice resolver."""
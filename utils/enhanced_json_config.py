@@ -11,11 +11,139 @@ Architecture:
 - Support for enterprise features: namespaces, complex choices, template cycling
 """
 
+import copy
 import json
+import mmap
+import os
+import random
 import re
-from typing import Dict, List, Optional, Any, Union
+import string
+import uuid
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Mapping
 from pathlib import Path
 
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+
+# Path and reference syntax, compiled once at import (used with fullmatch)
+_ABS_PATH_RE = re.compile(r'/[\w\[\]/@{}\.:-]+')             # /Root/Element/Child
+_DOT_PATH_RE = re.compile(r'[\w@{}]+(?:\.[\w\[\]@{}]+)*')    # Parent.Child.Element
+_SIMPLE_PATH_RE = re.compile(r'[\w@{}\[\]]+')                 # Element or Element@attribute
+# Any values key: the three forms above in one alternation. The branches are
+# disjoint ('/' only in the first, '.' only in the first two), so this accepts
+# exactly what dispatching on the leading '/' or a '.' would.
+_VALUE_PATH_RE = re.compile(r'/[\w\[\]/@{}\.:-]+|[\w@{}]+(?:\.[\w\[\]@{}]+)*|[\w@{}\[\]]+')
+_PATTERN_RE = re.compile(r'[\*\w/@{}\.:-]+')                  # *ID, Customer*, */Address
+_TEMPLATE_ARRAY_RE = re.compile(r'(\w+)\[(\d+)\]')            # template_name[1]
+_PREFIX_WILDCARD_RE = re.compile(r'(\w+)\*')                    # Customer*
+_SUFFIX_WILDCARD_RE = re.compile(r'\*(\w+)')                    # *ID
+
+
+def _loads_json(data: Union[str, bytes]) -> Any:
+    """Decode JSON text, using orjson when it is installed."""
+    if orjson_available:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj: Any) -> str:
+    """Encode JSON with two-space indentation, using orjson when it is installed."""
+    if orjson_available:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def parse_attribute_selector(selector: str) -> Optional[Tuple[Optional[str], str]]:
+    """
+    Split an attribute selector into (element name or None for any, attribute name).
+    
+    XPath-style selectors: //*[@AttributeName], //Element/@Attribute.
+    Returns None for selectors that can never match. Shared by the config
+    lookups and the override engine so both read selectors the same way.
+    """
+    if selector.startswith('//') and '@' in selector:
+        parts = selector.split('@')
+        if len(parts) == 2:
+            element_part = parts[0].strip('/').rstrip('[')
+            attr_part = parts[1].strip('[]')
+            if element_part == '*' or not element_part:
+                return None, attr_part
+            return element_part, attr_part
+    
+    return None
+
+
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _wildcard_to_regex(pattern: str) -> str:
+    """Translate a '*' wildcard pattern into a regex body, escaping everything else."""
+    return '.*'.join(re.escape(part) for part in pattern.split('*'))
+
+
+@lru_cache(maxsize=8192)
+def _xpath_to_dot_notation(xpath: str) -> Optional[str]:
+    """Convert XPath to dot notation (memoized, element paths repeat heavily)."""
+    if not xpath.startswith('/'):
+        return None
+    
+    # Remove leading slash and convert slashes to dots
+    # /Root/Element/Child -> Root.Element.Child
+    parts = xpath.strip('/').split('/')
+    return '.'.join(parts) if parts else None
+
+
+@lru_cache(maxsize=8192)
+def _element_name_from_path(xpath: str) -> str:
+    """Extract element name from XPath (memoized)."""
+    parts = xpath.strip('/').split('/')
+    return parts[-1] if parts else xpath
+
+
+@lru_cache(maxsize=1024)
+def _parse_generator_spec(generator_spec: str) -> Optional[Tuple[Callable, Tuple[str, ...]]]:
+    """Split a generator spec into (implementation, params) once per distinct spec."""
+    parts = generator_spec.split(':')
+    if len(parts) < 2:
+        return None
+    
+    generator = EnhancedJsonConfig._GENERATORS.get(parts[1])
+    if generator is None:
+        return None
+    
+    return generator, tuple(parts[2:])
+
+
+@lru_cache(maxsize=1024)
+def _parse_template_ref(template_ref: str) -> Optional[Tuple]:
+    """
+    Parse a template reference (without the @ prefix) once per distinct string.
+    
+    Returns:
+        ('array', name, position) for template_name[1] (1-based position),
+        ('field', name, field) for template_name.field,
+        ('simple', name) for template_name, or None if malformed
+    """
+    if '[' in template_ref and ']' in template_ref:
+        match = _TEMPLATE_ARRAY_RE.fullmatch(template_ref)
+        if match:
+            return ('array', match.group(1), int(match.group(2)))
+        return None
+    
+    if '.' in template_ref:
+        template_name, field_path = template_ref.split('.', 1)
+        return ('field', template_name, field_path)
+    
+    return ('simple', template_ref)
+
 
 class ConfigValidationError(Exception):
     """Raised when JSON configuration validation fails"""
@@ -36,6 +164,16 @@ class EnhancedJsonConfig:
     - Namespaces: Multi-namespace schema support
     """
     
+    __slots__ = (
+        'config_dict', 'schema', 'mode', 'seed', '_rng',
+        'values', 'patterns', 'choices', 'templates', 'repeats', 'attributes', 'namespaces',
+        'conditional', 'validation',
+        '_compiled_patterns', '_pattern_values', '_literal_patterns', '_pattern_union',
+        '_attr_patterns', '_attr_selectors', '_value_index', '_has_dot_keys',
+        '_template_str_cache', '_namespace_prefixes',
+        '_has_values', '_has_patterns',
+    )
+    
     def __init__(self, config_data: Union[Dict, str, Path]):
         """
         Initialize enhanced JSON configuration.
@@ -54,6 +192,7 @@ class EnhancedJsonConfig:
         self.schema = self.config_dict.get('schema')
         self.mode = self.config_dict.get('mode', 'complete')
         self.seed = self.config_dict.get('seed')
+        self._rng = random.Random(self.seed)  # Seeded source for value generators
         
         # Main configuration sections
         self.values = self.config_dict.get('values', {})
@@ -70,6 +209,14 @@ class EnhancedJsonConfig:
         
         # Internal state
         self._compiled_patterns = None
+        self._pattern_values: List[Any] = []           # Pattern values in configuration order
+        self._literal_patterns: List[tuple] = []        # (index, kind, text) for prefix/suffix/any wildcards
+        self._pattern_union: Optional[re.Pattern] = None  # Alternation of the remaining wildcard regexes
+        self._attr_patterns: List[tuple] = []           # (element regex or None, attribute regex, value)
+        self._attr_selectors: List[tuple] = []          # (element name or None, attribute name, value)
+        self._value_index: Dict[str, tuple] = {}        # Classified values plus absolute-path aliases of dot keys
+        self._has_dot_keys = False                      # Whether any values key uses dot notation
+        self._template_str_cache: Dict[Tuple[str, int], str] = {}  # Serialized template entries
         self._namespace_prefixes = {}
         
         # Validate configuration on initialization
@@ -78,8 +225,13 @@ class EnhancedJsonConfig:
     def _load_from_file(self, file_path: Union[str, Path]) -> Dict:
         """Load configuration from JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                # orjson decodes straight from the mapped pages; json needs a str/bytes copy anyway
+                if orjson_available and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            return orjson.loads(view)
+                return _loads_json(f.read())
         except FileNotFoundError:
             raise ConfigValidationError(f"Configuration file not found: {file_path}")
         except json.JSONDecodeError as e:
@@ -116,11 +268,19 @@ class EnhancedJsonConfig:
         # Set up internal state after validation
         self._setup_namespace_prefixes()
         self._compile_patterns()
+        self._compile_attribute_selectors()
+        self._template_str_cache = {}
+        self._build_value_index()
+        
+        # Flags for skipping lookups against empty sections
+        self._has_values = bool(self.values)
+        self._has_patterns = bool(self._compiled_patterns)
     
     def _validate_value_paths(self) -> None:
         """Validate path syntax in values section."""
-        for path in self.values.keys():
-            if not self._is_valid_path(path):
+        match = _VALUE_PATH_RE.fullmatch
+        for path in self.values:
+            if match(path) is None:
                 raise ConfigValidationError(f"Invalid path syntax: '{path}'")
     
     def _validate_patterns(self) -> None:
@@ -131,10 +291,11 @@ class EnhancedJsonConfig:
     
     def _validate_template_references(self) -> None:
         """Validate template references in values."""
+        templates = self.templates
         for value in self.values.values():
             if isinstance(value, str) and value.startswith('@'):
-                template_ref = value[1:]  # Remove @ prefix
-                if not self._is_valid_template_reference(template_ref):
+                parsed = _parse_template_ref(value[1:])  # Remove @ prefix
+                if parsed is None or parsed[1] not in templates:
                     raise ConfigValidationError(f"Invalid template reference: '{value}'")
     
     def _validate_namespaces(self) -> None:
@@ -152,40 +313,25 @@ class EnhancedJsonConfig:
         """Check if path syntax is valid."""
         # Absolute path: /Root/Element/Child
         if path.startswith('/'):
-            return bool(re.match(r'^/[\w\[\]/@{}\.:-]+$', path))
+            return _ABS_PATH_RE.fullmatch(path) is not None
         
         # Dot notation: Parent.Child.Element
         if '.' in path:
-            return bool(re.match(r'^[\w@{}]+(?:\.[\w\[\]@{}]+)*$', path))
+            return _DOT_PATH_RE.fullmatch(path) is not None
         
         # Simple element: Element or Element@attribute
-        return bool(re.match(r'^[\w@{}\[\]]+$', path))
+        return _SIMPLE_PATH_RE.fullmatch(path) is not None
     
     def _is_valid_pattern(self, pattern: str) -> bool:
         """Check if pattern syntax is valid."""
         # Wildcard patterns: *ID, Customer*, */Address
-        return bool(re.match(r'^[\*\w/@{}\.:-]+$', pattern))
+        return _PATTERN_RE.fullmatch(pattern) is not None
     
     def _is_valid_template_reference(self, template_ref: str) -> bool:
         """Check if template reference is valid."""
-        # Format: template_name[index] or template_name.field
-        if '[' in template_ref and ']' in template_ref:
-            # Array-style reference: template_name[1]
-            match = re.match(r'^(\w+)\[(\d+)\]$', template_ref)
-            if match:
-                template_name = match.group(1)
-                return template_name in self.templates
-        elif '.' in template_ref:
-            # Field-style reference: template_name.field
-            parts = template_ref.split('.')
-            if len(parts) >= 2:
-                template_name = parts[0]
-                return template_name in self.templates
-        else:
-            # Simple reference: template_name
-            return template_ref in self.templates
-        
-        return False
+        # Format: template_name[index], template_name.field or template_name
+        parsed = _parse_template_ref(template_ref)
+        return parsed is not None and parsed[1] in self.templates
     
     def _setup_namespace_prefixes(self) -> None:
         """Set up namespace prefix mappings."""
@@ -195,11 +341,97 @@ class EnhancedJsonConfig:
     def _compile_patterns(self) -> None:
         """Compile patterns for efficient matching."""
         self._compiled_patterns = {}
-        for pattern, value in self.patterns.items():
+        self._pattern_values = []
+        self._literal_patterns = []
+        self._attr_patterns = []
+        union_parts = []
+        
+        for index, (pattern, value) in enumerate(self.patterns.items()):
+            # Attribute patterns: *@*ID, *@Currency
+            if '@' in pattern:
+                element_pattern, attr_pattern = pattern.split('@', 1)
+                attr_regex = re.compile(_wildcard_to_regex(attr_pattern), re.DOTALL)
+                element_regex = None
+                if element_pattern and element_pattern != '*':
+                    element_regex = re.compile(_wildcard_to_regex(element_pattern), re.DOTALL)
+                self._attr_patterns.append((element_regex, attr_regex, value))
+            
             # Convert wildcard pattern to regex
-            regex_pattern = pattern.replace('*', '.*')
-            regex_pattern = f'^{regex_pattern}$'
-            self._compiled_patterns[re.compile(regex_pattern)] = value
+            regex_body = _wildcard_to_regex(pattern)
+            self._compiled_patterns[re.compile(regex_body, re.DOTALL)] = value
+            self._pattern_values.append(value)
+            
+            # Plain prefix/suffix wildcards are matched with string methods
+            prefix_match = _PREFIX_WILDCARD_RE.fullmatch(pattern)
+            suffix_match = _SUFFIX_WILDCARD_RE.fullmatch(pattern)
+            if pattern == '*':
+                self._literal_patterns.append((index, 'any', ''))
+            elif prefix_match:
+                self._literal_patterns.append((index, 'prefix', prefix_match.group(1)))
+            elif suffix_match:
+                self._literal_patterns.append((index, 'suffix', suffix_match.group(1)))
+            else:
+                union_parts.append(f'(?P<p{index}>{regex_body})')
+        
+        # Alternatives are tried in configuration order, so the first matching
+        # group is the pattern that a sequential scan would have picked
+        self._pattern_union = re.compile('|'.join(union_parts), re.DOTALL) if union_parts else None
+    
+    def _compile_attribute_selectors(self) -> None:
+        """Parse attribute selectors once, keeping configuration order."""
+        self._attr_selectors = []
+        for selector, value in self.attributes.items():
+            parsed = parse_attribute_selector(selector)
+            if parsed is not None:
+                self._attr_selectors.append((parsed[0], parsed[1], value))
+    
+    def _build_value_index(self) -> None:
+        """
+        Index classified values so an element path resolves with a single lookup.
+        
+        Every values key is stored under itself, and each dot-notation key is
+        also stored under its absolute-path form (Parent.Child -> /Parent/Child)
+        unless that absolute path is configured explicitly, which keeps the
+        absolute > dot notation precedence. Entries are pre-classified by
+        _classify_value so resolution is a tag dispatch.
+        """
+        self._value_index = {}
+        self._has_dot_keys = False
+        for path, value in self.values.items():
+            self._value_index[path] = self._classify_value(value)
+        for path in self.values:
+            if '.' in path and not path.startswith('/'):
+                self._value_index.setdefault('/' + path.replace('.', '/'), self._value_index[path])
+                self._has_dot_keys = True
+    
+    @staticmethod
+    def _classify_value(value: Any) -> Tuple[str, Any]:
+        """
+        Classify a raw value the way _resolve_value would treat it.
+        
+        Returns:
+            ('p', text) for plain values, ('t', reference) for template references,
+            ('g', (generator, params, spec)) for parseable generator specs
+        """
+        if isinstance(value, str):
+            if value.startswith('@'):
+                return ('t', value)
+            if value.startswith('generate:'):
+                parsed = _parse_generator_spec(value)
+                if parsed is not None:
+                    return ('g', (parsed[0], parsed[1], value))
+        return ('p', str(value))
+    
+    def _resolve_entry(self, entry: Tuple[str, Any]) -> str:
+        """Resolve a value index entry produced by _classify_value."""
+        tag, payload = entry
+        if tag == 'p':
+            return payload
+        if tag == 't':
+            return self._resolve_template_reference(payload)
+        generator, params, spec = payload
+        value = generator(self, params)
+        return value if value is not None else spec
     
     def resolve_element_value(self, element_path: str, element_name: str, current_context: Optional[Dict] = None) -> Optional[str]:
         """
@@ -220,23 +452,26 @@ class EnhancedJsonConfig:
         Returns:
             Resolved value or None if no match found
         """
-        # 1. Check absolute path match
-        if element_path in self.values:
-            return self._resolve_value(self.values[element_path])
-        
-        # 2. Check dot notation matches (convert XPath to dot notation)
-        dot_notation = self._xpath_to_dot_notation(element_path)
-        if dot_notation and dot_notation in self.values:
-            return self._resolve_value(self.values[dot_notation])
-        
-        # 3. Check simple element name
-        if element_name in self.values:
-            return self._resolve_value(self.values[element_name])
+        if self._has_values:
+            # 1-2. Check absolute path and dot notation matches in one lookup
+            index = self._value_index
+            entry = index.get(element_path)
+            if entry is None and self._has_dot_keys and '.' in element_path and element_path.startswith('/'):
+                # Element names containing dots have no absolute alias, convert instead
+                entry = index.get(self._xpath_to_dot_notation(element_path))
+            if entry is not None:
+                return self._resolve_entry(entry)
+            
+            # 3. Check simple element name (never contains '/', so never hits an alias)
+            entry = index.get(element_name)
+            if entry is not None:
+                return self._resolve_entry(entry)
         
         # 4. Check pattern matches
-        pattern_value = self._match_patterns(element_name, element_path)
-        if pattern_value:
-            return self._resolve_value(pattern_value)
+        if self._has_patterns:
+            pattern_value = self._match_patterns(element_name, element_path)
+            if pattern_value:
+                return self._resolve_value(pattern_value)
         
         # 5. No match found
         return None
@@ -285,25 +520,35 @@ class EnhancedJsonConfig:
         Returns:
             Resolved attribute value or None
         """
-        # Try element@attribute syntax in values
-        attr_path = f"{element_path}@{attribute_name}"
-        if attr_path in self.values:
-            return self._resolve_value(self.values[attr_path])
-        
-        # Try simple element@attribute
-        simple_attr = f"{self._get_element_name_from_path(element_path)}@{attribute_name}"
-        if simple_attr in self.values:
-            return self._resolve_value(self.values[simple_attr])
+        if self._has_values:
+            # Try element@attribute syntax in values
+            attr_path = f"{element_path}@{attribute_name}"
+            if attr_path in self.values:
+                return self._resolve_value(self.values[attr_path])
+            
+            # Try simple element@attribute
+            simple_attr = f"{self._get_element_name_from_path(element_path)}@{attribute_name}"
+            if simple_attr in self.values:
+                return self._resolve_value(self.values[simple_attr])
         
         # Check dedicated attributes section
-        for attr_selector, value in self.attributes.items():
-            if self._attribute_selector_matches(attr_selector, element_path, attribute_name):
+        if self._attr_selectors:
+            element_name = None
+            for element_part, attr_part, value in self._attr_selectors:
+                if attr_part != attribute_name:
+                    continue
+                if element_part is not None:
+                    if element_name is None:
+                        element_name = self._get_element_name_from_path(element_path)
+                    if element_part != element_name:
+                        continue
                 return self._resolve_value(value)
         
         # Check patterns for attributes
-        attr_pattern_value = self._match_attribute_patterns(attribute_name, element_path)
-        if attr_pattern_value:
-            return self._resolve_value(attr_pattern_value)
+        if self._attr_patterns:
+            attr_pattern_value = self._match_attribute_patterns(attribute_name, element_path)
+            if attr_pattern_value:
+                return self._resolve_value(attr_pattern_value)
         
         return None
     
@@ -328,32 +573,35 @@ class EnhancedJsonConfig:
         
         return str(value)
     
+    @staticmethod
+    def _value_is_generated(value: Any) -> bool:
+        """Whether resolving value can give a different result on each call (generator specs)."""
+        return isinstance(value, str) and value.startswith('generate:')
+    
     def _resolve_template_reference(self, template_ref: str) -> str:
         """Resolve template reference to actual value."""
         # Remove @ prefix
-        ref = template_ref[1:]
+        parsed = _parse_template_ref(template_ref[1:])
         
         # Handle array-style: template_name[1]
-        if '[' in ref and ']' in ref:
-            match = re.match(r'^(\w+)\[(\d+)\]$', ref)
-            if match:
-                template_name = match.group(1)
-                index = int(match.group(2)) - 1  # Convert to 0-based
-                
-                if template_name in self.templates:
-                    template_data = self.templates[template_name]
-                    if isinstance(template_data, list) and 0 <= index < len(template_data):
-                        return json.dumps(template_data[index])
-        
-        # Handle field-style: template_name.field
-        elif '.' in ref:
-            parts = ref.split('.', 1)
-            template_name = parts[0]
-            field_path = parts[1]
+        if parsed and parsed[0] == 'array':
+            _, template_name, position = parsed
+            index = position - 1  # Convert to 0-based
+            
+            cache_key = (template_name, index)
+            cached = self._template_str_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
             if template_name in self.templates:
-                # This would need more complex field resolution
-                pass
+                template_data = self.templates[template_name]
+                if isinstance(template_data, list) and 0 <= index < len(template_data):
+                    serialized = json.dumps(template_data[index])
+                    self._template_str_cache[cache_key] = serialized
+                    return serialized
+        
+        # Field-style references (template_name.field) would need more
+        # complex field resolution
         
         # Return original reference if can't resolve
         return template_ref
@@ -361,125 +609,109 @@ class EnhancedJsonConfig:
     def _resolve_generator(self, generator_spec: str) -> str:
         """Resolve generator specification to actual value."""
         # Parse generator specification: generate:type:param1:param2
-        parts = generator_spec.split(':')
-        if len(parts) < 2:
+        parsed = _parse_generator_spec(generator_spec)
+        if parsed is None:
             return generator_spec
         
-        generator_type = parts[1]
-        params = parts[2:] if len(parts) > 2 else []
-        
-        # Implement basic generators (can be extended)
-        if generator_type == 'uuid':
-            import uuid
-            if params and params[0] == 'short':
-                return str(uuid.uuid4()).split('-')[0]
-            return str(uuid.uuid4())
-        
-        elif generator_type == 'alpha':
-            import string
-            import random
-            length = int(params[0]) if params else 6
-            return ''.join(random.choices(string.ascii_uppercase, k=length))
-        
-        elif generator_type == 'number':
-            import random
-            min_val = int(params[0]) if len(params) > 0 else 1
-            max_val = int(params[1]) if len(params) > 1 else 1000
-            return str(random.randint(min_val, max_val))
-        
-        elif generator_type == 'currency':
-            import random
-            min_val = float(params[0]) if len(params) > 0 else 10.0
-            max_val = float(params[1]) if len(params) > 1 else 1000.0
-            return f"{random.uniform(min_val, max_val):.2f}"
-        
-        elif generator_type == 'date':
-            from datetime import datetime, timedelta
-            if params and params[0] == 'today':
-                return datetime.now().strftime('%Y-%m-%d')
-            elif params and params[0] == 'future':
-                future_date = datetime.now() + timedelta(days=random.randint(1, 365))
-                return future_date.strftime('%Y-%m-%d')
+        generator, params = parsed
+        value = generator(self, params)
         
         # Return original if can't resolve
-        return generator_spec
+        return value if value is not None else generator_spec
+    
+    def _gen_uuid(self, params: Tuple[str, ...]) -> str:
+        """generate:uuid[:short]"""
+        if params and params[0] == 'short':
+            return str(uuid.uuid4()).split('-')[0]
+        return str(uuid.uuid4())
+    
+    def _gen_alpha(self, params: Tuple[str, ...]) -> str:
+        """generate:alpha[:length]"""
+        length = int(params[0]) if params else 6
+        return ''.join(self._rng.choices(string.ascii_uppercase, k=length))
+    
+    def _gen_number(self, params: Tuple[str, ...]) -> str:
+        """generate:number[:min[:max]]"""
+        min_val = int(params[0]) if len(params) > 0 else 1
+        max_val = int(params[1]) if len(params) > 1 else 1000
+        return str(self._rng.randint(min_val, max_val))
+    
+    def _gen_currency(self, params: Tuple[str, ...]) -> str:
+        """generate:currency[:min[:max]]"""
+        min_val = float(params[0]) if len(params) > 0 else 10.0
+        max_val = float(params[1]) if len(params) > 1 else 1000.0
+        return f"{self._rng.uniform(min_val, max_val):.2f}"
+    
+    def _gen_date(self, params: Tuple[str, ...]) -> Optional[str]:
+        """generate:date:today or generate:date:future"""
+        if params and params[0] == 'today':
+            return datetime.now().strftime('%Y-%m-%d')
+        elif params and params[0] == 'future':
+            future_date = datetime.now() + timedelta(days=self._rng.randint(1, 365))
+            return future_date.strftime('%Y-%m-%d')
+        return None
+    
+    # Generator type -> implementation, used by _resolve_generator
+    _GENERATORS = {
+        'uuid': _gen_uuid,
+        'alpha': _gen_alpha,
+        'number': _gen_number,
+        'currency': _gen_currency,
+        'date': _gen_date,
+    }
     
     def _xpath_to_dot_notation(self, xpath: str) -> Optional[str]:
         """Convert XPath to dot notation."""
-        if not xpath.startswith('/'):
-            return None
-        
-        # Remove leading slash and convert slashes to dots
-        # /Root/Element/Child -> Root.Element.Child
-        parts = xpath.strip('/').split('/')
-        return '.'.join(parts) if parts else None
+        return _xpath_to_dot_notation(xpath)
     
     def _get_element_name_from_path(self, xpath: str) -> str:
         """Extract element name from XPath."""
-        parts = xpath.strip('/').split('/')
-        return parts[-1] if parts else xpath
+        return _element_name_from_path(xpath)
     
     def _match_patterns(self, element_name: str, element_path: str) -> Optional[str]:
         """Match element against compiled patterns."""
         if not self._compiled_patterns:
             return None
         
-        for pattern_regex, value in self._compiled_patterns.items():
-            # Try matching against element name
-            if pattern_regex.match(element_name):
-                return value
+        # Earliest configured pattern matching either the element name or its path wins
+        best_index = None
+        for index, kind, text in self._literal_patterns:
+            if kind == 'prefix':
+                matched = element_name.startswith(text) or element_path.startswith(text)
+            elif kind == 'suffix':
+                matched = element_name.endswith(text) or element_path.endswith(text)
+            else:
+                matched = True
             
-            # Try matching against path components
-            if pattern_regex.match(element_path):
-                return value
-        
-        return None
+            if matched:
+                best_index = index
+                break
+        
+        if self._pattern_union is not None:
+            for candidate in (element_name, element_path):
+                match = self._pattern_union.fullmatch(candidate)
+                if match:
+                    index = int(match.lastgroup[1:])
+                    if best_index is None or index < best_index:
+                        best_index = index
+        
+        return self._pattern_values[best_index] if best_index is not None else None
     
     def _match_attribute_patterns(self, attribute_name: str, element_path: str) -> Optional[str]:
         """Match attribute against patterns."""
-        for pattern, value in self.patterns.items():
-            # Attribute patterns: *@*ID, *@Currency
-            if '@' in pattern:
-                element_pattern, attr_pattern = pattern.split('@', 1)
+        for element_regex, attr_regex, value in self._attr_patterns:
+            # Check if attribute pattern matches
+            if attr_regex.fullmatch(attribute_name):
+                # Check element pattern if specified
+                if element_regex is None:
+                    return value
                 
-                # Check if attribute pattern matches
-                attr_regex = attr_pattern.replace('*', '.*')
-                if re.match(f'^{attr_regex}$', attribute_name):
-                    # Check element pattern if specified
-                    if element_pattern == '*' or not element_pattern:
-                        return value
-                    
-                    element_regex = element_pattern.replace('*', '.*')
-                    element_name = self._get_element_name_from_path(element_path)
-                    if re.match(f'^{element_regex}$', element_name):
-                        return value
+                element_name = self._get_element_name_from_path(element_path)
+                if element_regex.fullmatch(element_name):
+                    return value
         
         return None
     
-    def _attribute_selector_matches(self, selector: str, element_path: str, attribute_name: str) -> bool:
-        """Check if attribute selector matches the given element and attribute."""
-        # XPath-style selectors: //*[@AttributeName], //Element/@Attribute
-        if selector.startswith('//'):
-            if '@' in selector:
-                # //Element/@Attribute or //*[@Attribute]
-                parts = selector.split('@')
-                if len(parts) == 2:
-                    element_part = parts[0].strip('/')
-                    attr_part = parts[1].strip('[]')
-                    
-                    # Check attribute name match
-                    if attr_part != attribute_name:
-                        return False
-                    
-                    # Check element match
-                    if element_part == '*' or not element_part:
-                        return True
-                    
-                    element_name = self._get_element_name_from_path(element_path)
-                    return element_part == element_name
-        
-        return False
-    
     def get_base_choices(self) -> Dict[str, str]:
         """
         Extract choices in format expected by base XMLGenerator.
@@ -498,14 +730,24 @@ class EnhancedJsonConfig:
         """
         return self.repeats.copy()
     
-    def to_dict(self) -> Dict:
-        """Convert configuration back to dictionary format."""
-        return self.config_dict.copy()
+    def to_dict(self, deep_copy: bool = False) -> Mapping[str, Any]:
+        """
+        Convert configuration back to dictionary format.
+        
+        Args:
+            deep_copy: Return an independent deep copy instead of a read-only view
+            
+        Returns:
+            Read-only view of the configuration, or a deep-copied dictionary
+        """
+        if deep_copy:
+            return copy.deepcopy(self.config_dict)
+        return MappingProxyType(self.config_dict)
     
     def save_to_file(self, file_path: Union[str, Path]) -> None:
         """Save configuration to JSON file."""
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config_dict, f, indent=2, ensure_ascii=False)
+            f.write(_dumps_json(self.config_dict))
     
     def __repr__(self) -> str:
         """String representation of configuration."""
@@ -20,22 +20,77 @@ Integration Flow:
 5. Return enhanced XML with comprehensive metadata
 """
 
+import io
 import logging
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Any, Sequence, Union, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
 from datetime import datetime
 
+import xmlschema
+from lxml import etree as ET
+
 # Import existing base components
 from .xml_generator import XMLGenerator
-from .type_generators import TypeGeneratorFactory
 
-# Import new enhanced components
-from .enhanced_json_config import EnhancedJsonConfig, ConfigValidationError
-from .xml_override_engine import XMLOverrideEngine, XMLOverrideEngineError
-from .xpath_resolver import XPathResolver, XPathResolverError
-from .choice_resolver import ChoiceResolver, ChoiceResolverError
-from .template_engine import TemplateEngine, TemplateEngineError
+# Enhanced components are imported lazily so base-only generation stays cheap
+if TYPE_CHECKING:
+    from .enhanced_json_config import EnhancedJsonConfig
+    from .xml_override_engine import XMLOverrideEngine
+    from .xpath_resolver import XPathResolver
+    from .choice_resolver import ChoiceResolver
+    from .template_engine import TemplateEngine
+
+
+# Parsed schemas shared between generators, with the mtime of every file each was built from:
+# xsd path -> ({dependency path: mtime}, schema). Generators themselves are per instance,
+# since generation rewrites their state.
+_SCHEMA_CACHE_SIZE = 32
+_SCHEMA_CACHE: Dict[str, Tuple[Dict[str, float], xmlschema.XMLSchema]] = {}
+
+# Serializes cache misses so concurrent constructors parse a schema only once
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def _schema_file_mtimes(schema: xmlschema.XMLSchema) -> Dict[str, float]:
+    """Modification times of the schema file and every local file it imports or includes."""
+    mtimes = {}
+    for component in schema.maps.iter_schemas():
+        parts = urlsplit(component.url or '')
+        if parts.scheme in ('', 'file'):
+            path = url2pathname(parts.path)
+            mtimes[path] = os.stat(path).st_mtime
+    return mtimes
+
+
+def _files_unchanged(mtimes: Dict[str, float]) -> bool:
+    """Whether every recorded file still exists with the recorded modification time."""
+    try:
+        return all(os.stat(path).st_mtime == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def _new_base_generator(xsd_path: str) -> XMLGenerator:
+    """Create a base generator, reusing the parsed schema while none of its files changed."""
+    with _SCHEMA_CACHE_LOCK:
+        cached = _SCHEMA_CACHE.get(xsd_path)
+        if cached is not None and _files_unchanged(cached[0]):
+            return XMLGenerator(xsd_path, schema=cached[1])
+        
+        generator = XMLGenerator(xsd_path)
+        _SCHEMA_CACHE.pop(xsd_path, None)
+        if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_SIZE:
+            del _SCHEMA_CACHE[next(iter(_SCHEMA_CACHE))]  # Oldest entry
+        _SCHEMA_CACHE[xsd_path] = (_schema_file_mtimes(generator.schema), generator.schema)
+        return generator
 
 
 class EnhancedXMLGeneratorError(Exception):
@@ -46,20 +101,37 @@ class EnhancedXMLGeneratorError(Exception):
 class GenerationResult:
     """Container for generation results with metadata."""
     
+    # No per-instance __dict__; batches can hold many results
+    __slots__ = ('xml_content', 'metadata', 'timestamp', '_line_count')
+    
     def __init__(self, xml_content: str, metadata: Dict[str, Any]):
         self.xml_content = xml_content
         self.metadata = metadata
         self.timestamp = datetime.now()
+        self._line_count: Optional[int] = None
     
     def __str__(self) -> str:
         return self.xml_content
     
+    @property
+    def xml_length(self) -> int:
+        """Length of the generated XML."""
+        return len(self.xml_content)
+    
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the generated XML, counted once without splitting the string."""
+        if self._line_count is None:
+            content = self.xml_content
+            self._line_count = content.count('\n') + (not content.endswith('\n')) if content else 0
+        return self._line_count
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get generation summary."""
         return {
             'timestamp': self.timestamp.isoformat(),
-            'xml_length': len(self.xml_content),
-            'lines': len(self.xml_content.splitlines()),
+            'xml_length': self.xml_length,
+            'lines': self.line_count,
             'metadata': self.metadata
         }
 
@@ -81,6 +153,21 @@ class EnhancedXMLGenerator:
     - Detailed generation metadata and debugging info
     """
     
+    # Key layout shared by every enhanced metadata dict; copied and filled per generation
+    _ENHANCED_META_TEMPLATE: Dict[str, Any] = {
+        'generation_type': 'enhanced',
+        'mode': None,
+        'schema': None,
+        'config_schema': None,
+        'generation_time_ms': None,
+        'fallback_used': None,
+        'errors': None,
+        'choices': None,
+        'templates': None,
+        'overrides': None,
+        'base': None,
+    }
+    
     def __init__(self, xsd_path: Union[str, Path], json_config_data: Optional[Union[Dict, str, Path]] = None):
         """
         Initialize Enhanced XML Generator.
@@ -93,33 +180,52 @@ class EnhancedXMLGenerator:
             EnhancedXMLGeneratorError: If initialization fails
         """
         self.xsd_path = Path(xsd_path)
+        self._schema_str = str(self.xsd_path)
+        self.json_config_data = json_config_data
         self.logger = logging.getLogger(__name__)
         
         # Initialize base generator (always works)
         try:
-            self.base_generator = XMLGenerator(str(self.xsd_path))
+            self.base_generator = _new_base_generator(str(self.xsd_path))
             self.logger.info(f"Base XMLGenerator initialized for {self.xsd_path.name}")
         except Exception as e:
             raise EnhancedXMLGeneratorError(f"Failed to initialize base generator: {e}") from e
         
         # Initialize enhanced components (optional)
-        self.enhanced_config: Optional[EnhancedJsonConfig] = None
-        self.xpath_resolver: Optional[XPathResolver] = None
-        self.choice_resolver: Optional[ChoiceResolver] = None
-        self.template_engine: Optional[TemplateEngine] = None
-        self.override_engine: Optional[XMLOverrideEngine] = None
+        self.enhanced_config: Optional['EnhancedJsonConfig'] = None
+        self.xpath_resolver: Optional['XPathResolver'] = None
+        self.choice_resolver: Optional['ChoiceResolver'] = None
+        self.template_engine: Optional['TemplateEngine'] = None
+        self.override_engine: Optional['XMLOverrideEngine'] = None
+        
+        # Config-derived choices/repeats, resolved on first use (see refresh())
+        self._cached_config_choices: Optional[Dict[str, str]] = None
+        self._cached_config_repeats: Optional[Dict[str, int]] = None
+        self._has_choice_overrides = False
         
         # Generation state
         self.last_result: Optional[GenerationResult] = None
         self.generation_errors: List[str] = []
         self.fallback_used = False
         
+        # Background worker for generate_xml_async (started on first use)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_requests: Optional[queue.SimpleQueue] = None
+        self._worker_lock = threading.Lock()
+        self._generation_lock = threading.Lock()
+        
         # Initialize enhanced configuration if provided
         if json_config_data:
             self._initialize_enhanced_config(json_config_data)
     
     def _initialize_enhanced_config(self, json_config_data: Union[Dict, str, Path]) -> None:
         """Initialize enhanced configuration components."""
+        from .enhanced_json_config import EnhancedJsonConfig, ConfigValidationError
+        from .xml_override_engine import XMLOverrideEngine
+        from .xpath_resolver import XPathResolver
+        from .choice_resolver import ChoiceResolver
+        from .template_engine import TemplateEngine
+        
         try:
             # Parse enhanced JSON configuration
             self.enhanced_config = EnhancedJsonConfig(json_config_data)
@@ -142,6 +248,7 @@ class EnhancedXMLGenerator:
             self.override_engine = XMLOverrideEngine(
                 enhanced_config=self.enhanced_config
             )
+            self.refresh()
             
             self.logger.info("Enhanced configuration components initialized successfully")
             
@@ -162,6 +269,18 @@ class EnhancedXMLGenerator:
         self.choice_resolver = None
         self.template_engine = None
         self.override_engine = None
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Drop cached config-derived choices and repeats after the config changes."""
+        self._cached_config_choices = None
+        self._cached_config_repeats = None
+        
+        # Choice removal only has work to do when simple or conditional choices are configured
+        self._has_choice_overrides = bool(
+            self.choice_resolver and
+            (self.choice_resolver.resolved_choices or self.choice_resolver.conditional_choices)
+        )
     
     def generate_xml(self, 
                     mode: Optional[str] = None,
@@ -181,37 +300,195 @@ class EnhancedXMLGenerator:
         Raises:
             EnhancedXMLGeneratorError: If generation fails completely
         """
-        self.generation_errors.clear()
-        self.fallback_used = False
-        
-        try:
-            if self.enhanced_config and self.override_engine:
-                # Enhanced generation path
-                return self._generate_enhanced_xml(mode, additional_choices, additional_repeats)
-            else:
-                # Base generation path
-                return self._generate_base_xml(mode, additional_choices, additional_repeats)
+        # Generation rewrites this generator's state, so calls run one at a time
+        with self._generation_lock:
+            self.generation_errors.clear()
+            self.fallback_used = False
+            
+            try:
+                if self.enhanced_config and self.override_engine:
+                    # Enhanced generation path
+                    return self._generate_enhanced_xml(mode, additional_choices, additional_repeats)
+                else:
+                    # Base generation path
+                    return self._generate_base_xml(mode, additional_choices, additional_repeats)
+                    
+            except Exception as e:
+                self.logger.error(f"XML generation failed: {e}")
                 
-        except Exception as e:
-            self.logger.error(f"XML generation failed: {e}")
+                # Try fallback to base generation
+                if not self.fallback_used and self.enhanced_config:
+                    self.logger.info("Attempting fallback to base generation")
+                    try:
+                        return self._generate_base_xml(mode, additional_choices, additional_repeats)
+                    except Exception as fallback_error:
+                        self.logger.error(f"Fallback generation also failed: {fallback_error}")
+                        raise EnhancedXMLGeneratorError(f"Both enhanced and fallback generation failed: {e}") from e
+                else:
+                    raise EnhancedXMLGeneratorError(f"XML generation failed: {e}") from e
+    
+    def generate_xml_async(self,
+                           mode: Optional[str] = None,
+                           additional_choices: Optional[Dict[str, str]] = None,
+                           additional_repeats: Optional[Dict[str, int]] = None) -> Future:
+        """
+        Queue an XML generation on this generator's background worker thread.
+        
+        Requests run one at a time in submission order; like direct
+        generate_xml calls, each holds the generator for its whole run.
+        
+        Args:
+            mode: Generation mode override ('complete', 'minimal', 'custom')
+            additional_choices: Additional choice selections (UI overrides)
+            additional_repeats: Additional repeat counts (UI overrides)
+            
+        Returns:
+            Future resolving to the GenerationResult (or raising EnhancedXMLGeneratorError)
+        """
+        future: Future = Future()
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker_requests = queue.SimpleQueue()
+                self._worker = threading.Thread(
+                    target=self._run_worker_loop,
+                    args=(self._worker_requests,),
+                    name=f"EnhancedXMLGenerator-{self.xsd_path.name}",
+                    daemon=True
+                )
+                self._worker.start()
+            self._worker_requests.put(((mode, additional_choices, additional_repeats), future))
+        return future
+    
+    def close(self) -> None:
+        """Stop the background worker after it finishes already queued requests."""
+        with self._worker_lock:
+            if self._worker is None:
+                return
+            self._worker_requests.put(None)
+            self._worker = None
+            self._worker_requests = None
+    
+    def _run_worker_loop(self, requests: queue.SimpleQueue) -> None:
+        """Serve queued generate_xml_async requests until close() is called."""
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            params, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.generate_xml(*params))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def generate_xml_to_stream(self,
+                               fp: BinaryIO,
+                               mode: Optional[str] = None,
+                               additional_choices: Optional[Dict[str, str]] = None,
+                               additional_repeats: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Generate XML and write it as UTF-8 directly to a binary stream.
+        
+        The enhanced tree is serialized straight into ``fp`` instead of being
+        built into an intermediate string first.
+        
+        Args:
+            fp: Writable binary file-like object (e.g. open(path, 'wb') or io.BytesIO)
+            mode: Generation mode override ('complete', 'minimal', 'custom')
+            additional_choices: Additional choice selections (UI overrides)
+            additional_repeats: Additional repeat counts (UI overrides)
+            
+        Returns:
+            Generation metadata
             
-            # Try fallback to base generation
-            if not self.fallback_used and self.enhanced_config:
-                self.logger.info("Attempting fallback to base generation")
+        Raises:
+            EnhancedXMLGeneratorError: If generation fails completely
+        """
+        # Generation rewrites this generator's state, so calls run one at a time
+        with self._generation_lock:
+            self.generation_errors.clear()
+            self.fallback_used = False
+            
+            if self.enhanced_config and self.override_engine:
                 try:
-                    return self._generate_base_xml(mode, additional_choices, additional_repeats)
-                except Exception as fallback_error:
-                    self.logger.error(f"Fallback generation also failed: {fallback_error}")
-                    raise EnhancedXMLGeneratorError(f"Both enhanced and fallback generation failed: {e}") from e
-            else:
+                    start_ns = time.perf_counter_ns()
+                    effective_mode = mode or self.enhanced_config.mode
+                    base_choices = self._resolve_base_choices(additional_choices)
+                    base_repeats = self._resolve_base_repeats(additional_repeats)
+                    xml_tree, base_xml = self._build_enhanced_tree(effective_mode, base_choices, base_repeats)
+                    
+                    if xml_tree is not None:
+                        xml_tree.write(fp, encoding='utf-8', xml_declaration=True)
+                    else:
+                        fp.write(base_xml.encode('utf-8'))
+                    
+                    generation_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                    return self._create_enhanced_metadata(
+                        mode=effective_mode,
+                        base_choices=base_choices,
+                        base_repeats=base_repeats,
+                        generation_time_ms=generation_time_ms
+                    )
+                except Exception as e:
+                    self.logger.error(f"XML generation failed: {e}")
+                    self.logger.info("Attempting fallback to base generation")
+            
+            try:
+                result = self._generate_base_xml(mode, additional_choices, additional_repeats)
+            except Exception as e:
                 raise EnhancedXMLGeneratorError(f"XML generation failed: {e}") from e
+            fp.write(result.xml_content.encode('utf-8'))
+            return result.metadata
+    
+    def generate_batch(self,
+                       params_list: List[Tuple[Optional[str], Optional[Dict[str, str]], Optional[Dict[str, int]]]],
+                       processes: Optional[int] = None) -> List[GenerationResult]:
+        """
+        Generate many XML documents for this schema in parallel worker processes.
+        
+        Each worker builds one generator for the schema and configuration and
+        renders its share of the batch through ``generate_xml``.
+        
+        Args:
+            params_list: (mode, additional_choices, additional_repeats) tuples, one per document
+            processes: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            GenerationResult objects in the same order as params_list
+            
+        Raises:
+            EnhancedXMLGeneratorError: If generation of any document fails
+        """
+        params_list = list(params_list)
+        processes = min(processes or os.cpu_count() or 1, len(params_list))
+        
+        # Worker start-up costs more than a tiny batch, so render it in-process
+        if processes <= 1:
+            return [self.generate_xml(*params) for params in params_list]
+        
+        context = None
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+        
+        chunksize = max(1, len(params_list) // (4 * processes))
+        self.logger.info("Generating batch of %d documents with %d processes", len(params_list), processes)
+        with ProcessPoolExecutor(max_workers=processes,
+                                 mp_context=context,
+                                 initializer=_init_batch_worker,
+                                 initargs=(str(self.xsd_path), self.json_config_data)) as executor:
+            results = list(executor.map(_generate_batch_item, params_list, chunksize=chunksize))
+        
+        if results:
+            self.last_result = results[-1]
+        return results
     
     def _generate_enhanced_xml(self, 
                               mode: Optional[str],
                               additional_choices: Optional[Dict[str, str]],
                               additional_repeats: Optional[Dict[str, int]]) -> GenerationResult:
         """Generate XML using enhanced configuration."""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Determine generation mode
         effective_mode = mode or self.enhanced_config.mode
@@ -222,6 +499,41 @@ class EnhancedXMLGenerator:
         # Step 2: Resolve repeat counts for base generator
         base_repeats = self._resolve_base_repeats(additional_repeats)
         
+        # Steps 3-5: Generate base XML, apply overrides and choice removal
+        xml_tree, base_xml = self._build_enhanced_tree(effective_mode, base_choices, base_repeats)
+        if xml_tree is not None:
+            # Written exactly as generate_xml_to_stream writes it, with or without choice removal
+            buffer = io.BytesIO()
+            xml_tree.write(buffer, encoding='utf-8', xml_declaration=True)
+            enhanced_xml = buffer.getvalue().decode('utf-8')
+        else:
+            enhanced_xml = base_xml
+        
+        # Step 6: Create result with metadata
+        generation_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        metadata = self._create_enhanced_metadata(
+            mode=effective_mode,
+            base_choices=base_choices,
+            base_repeats=base_repeats,
+            generation_time_ms=generation_time_ms
+        )
+        
+        result = GenerationResult(enhanced_xml, metadata)
+        self.last_result = result
+        
+        return result
+    
+    def _build_enhanced_tree(self,
+                             effective_mode: str,
+                             base_choices: Dict[str, str],
+                             base_repeats: Dict[str, int]) -> Tuple[Optional[ET.ElementTree], str]:
+        """
+        Run base generation, overrides and choice removal, keeping the result as a tree.
+        
+        Returns:
+            Tuple of (enhanced tree, or None if neither overrides nor choices
+            could be applied, and the base XML string)
+        """
         # Step 3: Generate base XML using proven XMLGenerator
         try:
             base_xml = self.base_generator.generate_dummy_xml_with_options(
@@ -233,39 +545,38 @@ class EnhancedXMLGenerator:
         except Exception as e:
             raise EnhancedXMLGeneratorError(f"Base XML generation failed: {e}") from e
         
-        # Step 4: Apply enhanced overrides
+        from .xml_override_engine import XMLOverrideEngineError
+        
+        # Choice removal is skipped entirely when no choices are configured
+        choice_resolver = self.choice_resolver if self._has_choice_overrides else None
+        
+        # Steps 4-5: Apply enhanced overrides and choice-based removal on one tree
         try:
-            enhanced_xml = self.override_engine.apply_overrides(base_xml)
+            xml_tree = self.override_engine.apply_overrides_and_choices(base_xml, choice_resolver)
             self.logger.info("Enhanced overrides applied successfully")
+            if choice_resolver is not None:
+                self.logger.info("Choice-based element removal applied")
+            return xml_tree, base_xml
         except XMLOverrideEngineError as e:
-            self.logger.warning(f"Override application failed, using base XML: {e}")
+            self.logger.warning("Override application failed, using base XML: %s", e)
             self.generation_errors.append(f"Override application: {e}")
-            enhanced_xml = base_xml
+        except Exception as e:
+            # Overrides succeeded; keep the overridden tree without choice removal
+            self.logger.warning("Choice application failed: %s", e)
+            self.generation_errors.append(f"Choice application: {e}")
+            return self.override_engine.xml_tree, base_xml
         
-        # Step 5: Apply choice-based element removal
+        # Overrides failed: apply choices to the unmodified base XML
         try:
-            if self.choice_resolver:
-                xml_tree = ET.fromstring(enhanced_xml)
-                xml_tree_with_choices = self.choice_resolver.apply_choices_to_xml(ET.ElementTree(xml_tree))
-                enhanced_xml = ET.tostring(xml_tree_with_choices.getroot(), encoding='unicode')
+            if choice_resolver is not None:
+                xml_tree = choice_resolver.apply_choices_to_xml(ET.ElementTree(ET.fromstring(base_xml.encode('utf-8'))))
                 self.logger.info("Choice-based element removal applied")
+                return xml_tree, base_xml
         except Exception as e:
-            self.logger.warning(f"Choice application failed: {e}")
+            self.logger.warning("Choice application failed: %s", e)
             self.generation_errors.append(f"Choice application: {e}")
         
-        # Step 6: Create result with metadata
-        generation_time = datetime.now() - start_time
-        metadata = self._create_enhanced_metadata(
-            mode=effective_mode,
-            base_choices=base_choices,
-            base_repeats=base_repeats,
-            generation_time=generation_time
-        )
-        
-        result = GenerationResult(enhanced_xml, metadata)
-        self.last_result = result
-        
-        return result
+        return None, base_xml
     
     def _generate_base_xml(self,
                           mode: Optional[str],
@@ -273,7 +584,7 @@ class EnhancedXMLGenerator:
                           additional_repeats: Optional[Dict[str, int]]) -> GenerationResult:
         """Generate XML using base generator only."""
         self.fallback_used = True
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Use provided choices and repeats or defaults
         choices = additional_choices or {}
@@ -291,12 +602,12 @@ class EnhancedXMLGenerator:
             raise EnhancedXMLGeneratorError(f"Base XML generation failed: {e}") from e
         
         # Create result with basic metadata
-        generation_time = datetime.now() - start_time
+        generation_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
         metadata = self._create_base_metadata(
             mode=effective_mode,
             choices=choices,
             repeats=repeats,
-            generation_time=generation_time
+            generation_time_ms=generation_time_ms
         )
         
         result = GenerationResult(xml_content, metadata)
@@ -306,39 +617,42 @@ class EnhancedXMLGenerator:
     
     def _resolve_base_choices(self, additional_choices: Optional[Dict[str, str]]) -> Dict[str, str]:
         """Resolve choices for base XMLGenerator."""
-        choices = {}
-        
-        # Add choices from enhanced config
-        if self.choice_resolver:
+        # Start from a copy of the config choices (or an empty dict without config)
+        if self.choice_resolver and self._cached_config_choices is None:
             try:
-                config_choices = self.choice_resolver.get_base_generator_choices()
-                choices.update(config_choices)
-                self.logger.debug(f"Added {len(config_choices)} choices from config")
+                self._cached_config_choices = dict(self.choice_resolver.get_base_generator_choices())
             except Exception as e:
-                self.logger.warning(f"Failed to resolve config choices: {e}")
+                self.logger.warning("Failed to resolve config choices: %s", e)
                 self.generation_errors.append(f"Choice resolution: {e}")
         
+        if self.choice_resolver and self._cached_config_choices is not None:
+            choices = self._cached_config_choices.copy()
+            self.logger.debug("Added %d choices from config", len(choices))
+        else:
+            choices = {}
+        
         # Add additional choices (UI overrides)
         if additional_choices:
-            choices.update(additional_choices)
-            self.logger.debug(f"Added {len(additional_choices)} additional choices")
+            choices |= additional_choices
+            self.logger.debug("Added %d additional choices", len(additional_choices))
         
         return choices
     
     def _resolve_base_repeats(self, additional_repeats: Optional[Dict[str, int]]) -> Dict[str, int]:
         """Resolve repeat counts for base XMLGenerator."""
-        repeats = {}
-        
-        # Add repeats from enhanced config
+        # Start from a copy of the config repeats (or an empty dict without config)
         if self.enhanced_config:
-            config_repeats = self.enhanced_config.get_base_repeat_counts()
-            repeats.update(config_repeats)
-            self.logger.debug(f"Added {len(config_repeats)} repeat counts from config")
+            if self._cached_config_repeats is None:
+                self._cached_config_repeats = dict(self.enhanced_config.get_base_repeat_counts())
+            repeats = self._cached_config_repeats.copy()
+            self.logger.debug("Added %d repeat counts from config", len(repeats))
+        else:
+            repeats = {}
         
         # Add additional repeats (UI overrides)
         if additional_repeats:
-            repeats.update(additional_repeats)
-            self.logger.debug(f"Added {len(additional_repeats)} additional repeat counts")
+            repeats |= additional_repeats
+            self.logger.debug("Added %d additional repeat counts", len(additional_repeats))
         
         return repeats
     
@@ -346,38 +660,36 @@ class EnhancedXMLGenerator:
                                  mode: str,
                                  base_choices: Dict[str, str],
                                  base_repeats: Dict[str, int],
-                                 generation_time) -> Dict[str, Any]:
+                                 generation_time_ms: float) -> Dict[str, Any]:
         """Create comprehensive metadata for enhanced generation."""
-        metadata = {
-            'generation_type': 'enhanced',
-            'mode': mode,
-            'schema': str(self.xsd_path),
-            'config_schema': self.enhanced_config.schema if self.enhanced_config else None,
-            'generation_time_ms': generation_time.total_seconds() * 1000,
-            'fallback_used': self.fallback_used,
-            'errors': self.generation_errors.copy(),
-            
-            # Choice information
-            'choices': {
-                'base_choices': base_choices,
-                'choice_summary': self.choice_resolver.get_choice_summary() if self.choice_resolver else {}
-            },
-            
-            # Template information
-            'templates': {
-                'template_summary': self.template_engine.get_template_summary() if self.template_engine else {}
-            },
-            
-            # Override information
-            'overrides': {
-                'override_summary': self.override_engine.get_override_summary() if self.override_engine else {}
-            },
-            
-            # Base generator information
-            'base': {
-                'choices_used': base_choices,
-                'repeats_used': base_repeats
-            }
+        metadata = self._ENHANCED_META_TEMPLATE.copy()
+        metadata['mode'] = mode
+        metadata['schema'] = self._schema_str
+        metadata['config_schema'] = self.enhanced_config.schema if self.enhanced_config else None
+        metadata['generation_time_ms'] = generation_time_ms
+        metadata['fallback_used'] = self.fallback_used
+        metadata['errors'] = tuple(self.generation_errors)
+        
+        # Choice information
+        metadata['choices'] = {
+            'base_choices': base_choices,
+            'choice_summary': self.choice_resolver.get_choice_summary() if self.choice_resolver else {}
+        }
+        
+        # Template information
+        metadata['templates'] = {
+            'template_summary': self.template_engine.get_template_summary() if self.template_engine else {}
+        }
+        
+        # Override information
+        metadata['overrides'] = {
+            'override_summary': self.override_engine.get_override_summary() if self.override_engine else {}
+        }
+        
+        # Base generator information
+        metadata['base'] = {
+            'choices_used': base_choices,
+            'repeats_used': base_repeats
         }
         
         return metadata
@@ -386,28 +698,37 @@ class EnhancedXMLGenerator:
                              mode: str,
                              choices: Dict[str, str],
                              repeats: Dict[str, int],
-                             generation_time) -> Dict[str, Any]:
+                             generation_time_ms: float) -> Dict[str, Any]:
         """Create basic metadata for base generation."""
         return {
             'generation_type': 'base',
             'mode': mode,
-            'schema': str(self.xsd_path),
-            'generation_time_ms': generation_time.total_seconds() * 1000,
+            'schema': self._schema_str,
+            'generation_time_ms': generation_time_ms,
             'fallback_used': self.fallback_used,
-            'errors': self.generation_errors.copy(),
+            'errors': tuple(self.generation_errors),
             'base': {
                 'choices_used': choices,
                 'repeats_used': repeats
             }
         }
     
-    def validate_configuration(self) -> Dict[str, List[str]]:
+    def validate_configuration(self) -> Dict[str, Sequence[str]]:
         """
         Validate the enhanced configuration.
         
         Returns:
-            Dictionary of validation results by component
+            Dictionary of validation results by component (tuples when no
+            enhanced configuration is loaded)
         """
+        if not self.enhanced_config:
+            return {
+                'config': (),
+                'choices': (),
+                'templates': (),
+                'overall': ("No enhanced configuration loaded",)
+            }
+        
         validation_results = {
             'config': [],
             'choices': [],
@@ -415,9 +736,7 @@ class EnhancedXMLGenerator:
             'overall': []
         }
         
-        if not self.enhanced_config:
-            validation_results['overall'].append("No enhanced configuration loaded")
-            return validation_results
+        from .enhanced_json_config import ConfigValidationError
         
         try:
             # Validate enhanced config
@@ -444,8 +763,8 @@ class EnhancedXMLGenerator:
                 validation_results['choices'].append("No choices configured")
         
         # Overall status
-        error_count = sum(len(errors) for errors in validation_results.values() 
-                         if any('error' in error.lower() for error in errors))
+        error_count = sum(1 for messages in validation_results.values()
+                          for message in messages if 'error' in message.lower())
         if error_count == 0:
             validation_results['overall'].append("Configuration validation successful")
         else:
@@ -484,4 +803,20 @@ class EnhancedXMLGenerator:
     def __repr__(self) -> str:
         """String representation of enhanced generator."""
         enhanced_status = "enabled" if self.enhanced_config else "disabled"
-        return f"EnhancedXMLGenerator(schema='{self.xsd_path.name}', enhanced={enhanced_status})"
\ No newline at end of file
+        return f"EnhancedXMLGenerator(schema='{self.xsd_path.name}', enhanced={enhanced_status})"
+
+
+# Per-process generator used by generate_batch workers
+_BATCH_WORKER_GENERATOR: Optional[EnhancedXMLGenerator] = None
+
+
+def _init_batch_worker(xsd_path: str, json_config_data: Optional[Union[Dict, str, Path]]) -> None:
+    """Build the generator each batch worker process reuses for its chunks."""
+    global _BATCH_WORKER_GENERATOR
+    _BATCH_WORKER_GENERATOR = EnhancedXMLGenerator(xsd_path, json_config_data)
+
+
+def _generate_batch_item(params: Tuple[Optional[str], Optional[Dict[str, str]], Optional[Dict[str, int]]]) -> GenerationResult:
+    """Render one batch entry with the worker's generator."""
+    mode, additional_choices, additional_repeats = params
+    return _BATCH_WORKER_GENERATOR.generate_xml(mode, additional_choices, additional_repeats)
@@ -24,16 +24,150 @@ Architecture:
 import json
 import random
 import re
+import sys
+from collections import deque
+from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple, Set
+from typing import Callable, Deque, Dict, List, Optional, Any, Union, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
-from copy import deepcopy
+from functools import lru_cache
 import logging
 
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 from .enhanced_json_config import EnhancedJsonConfig
 
 
+# Formula and reference patterns, compiled once at import
+_FIELD_INPUT_RE = re.compile(r'\b([A-Z][a-zA-Z]*(?:Time|Date|Amount|Name|ID|Code))\b')  # Field references
+_ARRAY_REF_RE = re.compile(r'^(\w+)\[(\d+)\]$')                                        # template_name[1]
+_CONCAT_RE = re.compile(r'concat\((.*)\)', re.IGNORECASE)
+_SUM_RE = re.compile(r'sum\((.*)\)', re.IGNORECASE)
+_HOUR_RE = re.compile(r'(\d+)h')
+_MINUTE_RE = re.compile(r'(\d+)m')
+
+# Slotted dataclasses drop the per-instance __dict__ (dataclass(slots=...) needs Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Distinct template references kept parsed before the cache is cleared
+_REFERENCE_CACHE_SIZE = 4096
+
+# Indices drawn per refill for RANDOM cycling when NumPy is available
+_RANDOM_BATCH_SIZE = 4096
+
+# Below this many rows, per-row evaluation beats building NumPy columns
+_VECTORIZE_MIN_ROWS = 64
+
+
+def _sum_columns_py(columns: Any) -> Any:
+    """Row-wise left-to-right sum of a (fields x rows) float64 array."""
+    out = np.empty(columns.shape[1])
+    for i in range(columns.shape[1]):
+        total = 0.0
+        for j in range(columns.shape[0]):
+            total += columns[j, i]
+        out[i] = total
+    return out
+
+
+_sum_columns_kernel: Optional[Callable[[Any], Any]] = None
+_sum_columns_kernel_loaded = False
+
+
+def _get_sum_columns_kernel() -> Optional[Callable[[Any], Any]]:
+    """
+    Return the Numba-compiled sum kernel, or None without Numba.
+    
+    Numba is imported on first use rather than at module import, since
+    importing it is slow and most templates never reach the vectorized path.
+    The loop is only worth running compiled; without Numba, columns are
+    added with ufuncs instead.
+    """
+    global _sum_columns_kernel, _sum_columns_kernel_loaded
+    if not _sum_columns_kernel_loaded:
+        try:
+            from numba import njit
+            _sum_columns_kernel = njit(cache=True)(_sum_columns_py)
+        except ImportError:
+            _sum_columns_kernel = None
+        _sum_columns_kernel_loaded = True
+    return _sum_columns_kernel
+
+
+def _as_float_column(values: List[Any]) -> Optional[Any]:
+    """Convert a column to a float64 array, or None if any value needs per-row handling."""
+    if not all(type(value) in (str, int, float) for value in values):
+        return None
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_cached_number(value: Any) -> str:
+    return str(value)
+
+
+def _format_number(value: Any) -> str:
+    """
+    Stringify a numeric formula result, sharing one string per distinct value.
+    
+    Zero bypasses the cache because 0.0 and -0.0 compare equal but print differently.
+    """
+    if value == 0:
+        return str(value)
+    return _format_cached_number(value)
+
+
+@lru_cache(maxsize=2048)
+def _offset_time(base_time: str, duration: str) -> str:
+    """
+    Add a duration like "2h30m" to an ISO datetime or YYYY-MM-DD date string.
+    
+    Cached because cycling templates repeat the same timestamps; failures
+    raise and are not cached.
+    """
+    # Parse base time (assume ISO format)
+    if 'T' in base_time:
+        base_dt = datetime.fromisoformat(base_time.replace('Z', '+00:00'))
+    else:
+        base_dt = datetime.strptime(base_time, '%Y-%m-%d')
+    
+    # Parse duration (e.g., "2h30m", "1h", "45m")
+    hours = 0
+    minutes = 0
+    
+    hour_match = _HOUR_RE.search(duration)
+    if hour_match:
+        hours = int(hour_match.group(1))
+    
+    minute_match = _MINUTE_RE.search(duration)
+    if minute_match:
+        minutes = int(minute_match.group(1))
+    
+    # Add duration
+    result_dt = base_dt + timedelta(hours=hours, minutes=minutes)
+    
+    # Return in same format as input
+    if 'T' in base_time:
+        return result_dt.isoformat()
+    else:
+        return result_dt.strftime('%Y-%m-%d')
+
+
+@lru_cache(maxsize=512)
+def _extract_field_inputs(formula: str) -> Tuple[str, ...]:
+    """Extract field names referenced in formula, in first-seen order."""
+    # Simple extraction - look for field references
+    return tuple(dict.fromkeys(_FIELD_INPUT_RE.findall(formula)))
+
+
 class CyclingStrategy(Enum):
     """Template data cycling strategies."""
     SEQUENTIAL = "sequential"   # Cycle through data in order
@@ -42,7 +176,7 @@ class CyclingStrategy(Enum):
     INFINITE = "infinite"      # Repeat infinitely
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TemplateData:
     """Container for template data with metadata."""
     name: str
@@ -54,14 +188,24 @@ class TemplateData:
     current_index: int = 0
     used_indices: Set[int] = field(default_factory=set)
     max_uses: Optional[int] = None
+    remaining: Deque[int] = field(default_factory=deque)  # Unused indices for ONCE cycling
+    compiled_fields: List['ComputedField'] = field(default_factory=list)  # Parsed computed fields in order
+    random_indices: List[int] = field(default_factory=list)  # Pre-drawn indices for RANDOM cycling
+    random_position: int = 0
+    random_source: Any = None  # NumPy Generator that refills random_indices
     
     def __post_init__(self):
         """Initialize template data after creation."""
         if isinstance(self.cycling, str):
             self.cycling = CyclingStrategy(self.cycling)
+        self.reset_remaining()
+    
+    def reset_remaining(self) -> None:
+        """Refill the unused-index queue from the current data."""
+        self.remaining = deque(i for i in range(len(self.data)) if i not in self.used_indices)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ComputedField:
     """Represents a computed field definition."""
     name: str
@@ -69,6 +213,9 @@ class ComputedField:
     inputs: List[str]
     params: Dict[str, Any] = field(default_factory=dict)
     output_format: Optional[str] = None
+    compiled: Optional[Callable[[Dict[str, Any]], Any]] = None  # Formula parsed once into a row function
+    numeric_kind: Optional[str] = None  # 'sum' or 'subtract' when the formula can be evaluated per column
+    operands: Tuple[str, ...] = ()      # Field names the numeric formula reads
 
 
 class TemplateEngineError(Exception):
@@ -103,6 +250,8 @@ class TemplateEngine:
         # Template resolution state
         self.resolved_templates: Dict[str, List[Dict]] = {}
         self.template_usage: Dict[str, int] = {}
+        self._summary_cache: Optional[Dict[str, Any]] = None  # Dropped whenever cycling state changes
+        self._reference_cache: Dict[str, Tuple[Optional[str], str, Any]] = {}  # Parsed template references
         
         # Random seed for deterministic generation
         if enhanced_config.seed:
@@ -112,6 +261,7 @@ class TemplateEngine:
         self._parse_templates()
         self._resolve_inheritance()
         self._setup_computed_fields()
+        self._precompute_resolved_rows()
     
     def _parse_templates(self) -> None:
         """Parse template configuration from enhanced config."""
@@ -134,7 +284,7 @@ class TemplateEngine:
             
             # Auto-detect fields from data
             if template_config:
-                template_data.fields = {key: "string" for key in template_config[0].keys()}
+                template_data.fields = dict.fromkeys(template_config[0], "string")
         
         elif isinstance(template_config, dict):
             # Complex format with metadata
@@ -163,7 +313,7 @@ class TemplateEngine:
             
             # Auto-detect fields if not specified
             if not template_data.fields and data:
-                template_data.fields = {key: "string" for key in data[0].keys()}
+                template_data.fields = dict.fromkeys(data[0], "string")
         
         else:
             raise TemplateEngineError(f"Invalid template format for {template_name}")
@@ -181,28 +331,31 @@ class TemplateEngine:
                 self._apply_inheritance(template)
     
     def _get_inheritance_order(self) -> List[str]:
-        """Get template resolution order based on inheritance."""
-        order = []
-        visited = set()
-        visiting = set()
+        """Get template resolution order based on inheritance (parents before children)."""
+        # Kahn's algorithm: each template has at most one parent, so in-degree is 0 or 1
+        in_degree: Dict[str, int] = {}
+        children: Dict[str, List[str]] = {}
+        for template_name, template in self.templates.items():
+            parent = template.inheritance
+            if parent and parent in self.templates:
+                in_degree[template_name] = 1
+                children.setdefault(parent, []).append(template_name)
+            else:
+                in_degree[template_name] = 0  # No parent, or a missing one reported later
         
-        def visit(template_name: str):
-            if template_name in visiting:
-                raise TemplateEngineError(f"Circular inheritance detected: {template_name}")
-            if template_name in visited:
-                return
-            
-            visiting.add(template_name)
-            template = self.templates.get(template_name)
-            if template and template.inheritance:
-                visit(template.inheritance)
-            
-            visiting.remove(template_name)
-            visited.add(template_name)
+        order = []
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
+        while queue:
+            template_name = queue.popleft()
             order.append(template_name)
+            for child_name in children.get(template_name, ()):
+                in_degree[child_name] -= 1
+                if in_degree[child_name] == 0:
+                    queue.append(child_name)
         
-        for template_name in self.templates.keys():
-            visit(template_name)
+        if len(order) != len(self.templates):
+            cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+            raise TemplateEngineError(f"Circular inheritance detected: {', '.join(cyclic)}")
         
         return order
     
@@ -214,18 +367,19 @@ class TemplateEngine:
             return
         
         # Merge fields (child overrides parent)
-        merged_fields = parent_template.fields.copy()
-        merged_fields.update(template.fields)
-        template.fields = merged_fields
+        template.fields = parent_template.fields | template.fields
         
         # Merge computed fields
-        merged_computed = parent_template.computed_fields.copy()
-        merged_computed.update(template.computed_fields)
-        template.computed_fields = merged_computed
+        template.computed_fields = parent_template.computed_fields | template.computed_fields
         
-        # Inherit data if child has no data
+        # Inherit data if child has no data. Flat rows are copied when resolved, so the
+        # list can be shared; nested values are deep-copied to keep the templates independent
         if not template.data and parent_template.data:
-            template.data = deepcopy(parent_template.data)
+            if any(isinstance(value, (dict, list)) for value in parent_template.data[0].values()):
+                template.data = deepcopy(parent_template.data)
+            else:
+                template.data = list(parent_template.data)
+            template.reset_remaining()
     
     def _setup_computed_fields(self) -> None:
         """Set up computed field processors for all templates."""
@@ -234,9 +388,120 @@ class TemplateEngine:
                 try:
                     computed_field = self._parse_computed_field(field_name, field_config)
                     self.computed_processors[f"{template.name}.{field_name}"] = computed_field
+                    # Fields without a formula never produce a value, so rows skip them
+                    if computed_field.compiled is not None:
+                        template.compiled_fields.append(computed_field)
                 except Exception as e:
                     self.logger.error(f"Failed to setup computed field {template.name}.{field_name}: {e}")
     
+    def _precompute_resolved_rows(self) -> None:
+        """
+        Materialize every template row with its computed fields applied, once.
+        
+        All supported formulas depend only on their own row, so lookups never
+        re-apply them. Templates without computed fields share their raw rows.
+        """
+        for template_name, template in self.templates.items():
+            if not template.compiled_fields:
+                self.resolved_templates[template_name] = template.data
+                continue
+            
+            # Evaluate field by field over all rows; fields read only their own row,
+            # so this matches row-by-row order while letting numeric formulas vectorize
+            rows = [data_item.copy() for data_item in template.data]
+            for computed_field in template.compiled_fields:
+                for row, computed_value in zip(rows, self._evaluate_column(computed_field, rows)):
+                    if computed_value is not None:
+                        row[computed_field.name] = computed_value
+            self.resolved_templates[template_name] = rows
+    
+    def _evaluate_column(self, computed_field: ComputedField, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Evaluate a computed field for every row, vectorized with NumPy where possible."""
+        if numpy_available and computed_field.numeric_kind and len(rows) >= _VECTORIZE_MIN_ROWS:
+            values = self._evaluate_numeric_column(computed_field, rows)
+            if values is not None:
+                return values
+        return self._evaluate_rows(computed_field, rows)
+    
+    def _evaluate_rows(self, computed_field: ComputedField, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Evaluate a computed field row by row.
+        
+        A row whose evaluation raises is logged and yields None. The handler
+        sits around the whole loop rather than each call, and evaluation
+        resumes after the failing row.
+        """
+        compiled = computed_field.compiled
+        values: List[Any] = []
+        append = values.append
+        pending = rows
+        while True:
+            try:
+                for row in pending:
+                    append(compiled(row))
+                return values
+            except Exception as e:
+                self.logger.error("Failed to evaluate formula '%s': %s", computed_field.formula, e)
+                append(None)
+                pending = rows[len(values):]
+    
+    def _evaluate_numeric_column(self, computed_field: ComputedField,
+                                 rows: List[Dict[str, Any]]) -> Optional[List[Any]]:
+        """
+        Evaluate a sum/subtract formula over whole columns.
+        
+        Returns None when a column holds values the row-by-row path would
+        treat specially (None, non-numeric types, unparseable strings), so
+        the caller can fall back to it with identical results.
+        """
+        if computed_field.numeric_kind == 'sum':
+            columns = []
+            for field_name in computed_field.operands:
+                numbers = _as_float_column([row.get(field_name, 0) for row in rows])
+                if numbers is None:
+                    return None
+                columns.append(numbers)
+            
+            sum_columns = _get_sum_columns_kernel()
+            if sum_columns is not None:
+                total = sum_columns(np.vstack(columns))
+            else:
+                total = np.zeros(len(rows))
+                for numbers in columns:
+                    total += numbers
+            return [_format_number(value) for value in total.tolist()]
+        
+        if computed_field.numeric_kind == 'subtract':
+            field1, field2 = computed_field.operands
+            present = [i for i, row in enumerate(rows) if row.get(field1) and row.get(field2)]
+            minuends = _as_float_column([rows[i][field1] for i in present])
+            subtrahends = _as_float_column([rows[i][field2] for i in present])
+            if minuends is None or subtrahends is None:
+                return None
+            values: List[Any] = [None] * len(rows)
+            for i, difference in zip(present, (minuends - subtrahends).tolist()):
+                values[i] = _format_number(difference)
+            return values
+        
+        return None
+    
+    def _numeric_formula_operands(self, formula: str) -> Dict[str, Any]:
+        """Classify formulas that can be evaluated per column (same dispatch as _compile_formula)."""
+        if ' + ' in formula:
+            return {}
+        if ' - ' in formula:
+            parts = formula.split(' - ')
+            if len(parts) == 2:
+                return {'numeric_kind': 'subtract', 'operands': (parts[0].strip(), parts[1].strip())}
+            return {}
+        if 'concat(' in formula.lower():
+            return {}
+        if 'sum(' in formula.lower():
+            match = _SUM_RE.search(formula)
+            if match:
+                return {'numeric_kind': 'sum', 'operands': tuple(f.strip() for f in match.group(1).split(','))}
+        return {}
+    
     def _parse_computed_field(self, field_name: str, field_config: Union[str, Dict]) -> ComputedField:
         """Parse computed field configuration."""
         if isinstance(field_config, str):
@@ -244,32 +509,32 @@ class TemplateEngine:
             return ComputedField(
                 name=field_name,
                 formula=field_config,
-                inputs=self._extract_field_inputs(field_config)
+                inputs=list(_extract_field_inputs(field_config)),
+                compiled=self._compile_formula(field_config),
+                **self._numeric_formula_operands(field_config)
             )
         
         elif isinstance(field_config, dict):
             # Complex configuration
             formula = field_config.get('formula', '')
-            inputs = field_config.get('inputs', self._extract_field_inputs(formula))
+            if 'inputs' in field_config:
+                inputs = field_config['inputs']
+            else:
+                inputs = list(_extract_field_inputs(formula))
             
             return ComputedField(
                 name=field_name,
                 formula=formula,
                 inputs=inputs,
                 params=field_config.get('params', {}),
-                output_format=field_config.get('output_format')
+                output_format=field_config.get('output_format'),
+                compiled=self._compile_formula(formula) if formula else None,
+                **(self._numeric_formula_operands(formula) if formula else {})
             )
         
         else:
             raise TemplateEngineError(f"Invalid computed field config for {field_name}")
     
-    def _extract_field_inputs(self, formula: str) -> List[str]:
-        """Extract field names referenced in formula."""
-        # Simple extraction - look for field references
-        field_pattern = r'\b([A-Z][a-zA-Z]*(?:Time|Date|Amount|Name|ID|Code))\b'
-        matches = re.findall(field_pattern, formula)
-        return list(set(matches))
-    
     def get_template_data(self, template_reference: str) -> Optional[Dict[str, Any]]:
         """
         Get data from template using reference format.
@@ -280,40 +545,72 @@ class TemplateEngine:
         Returns:
             Template data or None if not found
         """
+        kind, template_data = self._lookup_template_reference(template_reference)
+        if kind == 'field':
+            return template_data
+        return self._copy_row(template_data)
+    
+    def _lookup_template_reference(self, template_reference: str) -> Tuple[Optional[str], Any]:
+        """Resolve a reference to (kind, data), returning shared resolved rows uncopied."""
         try:
-            # Parse reference format
-            if '[' in template_reference and ']' in template_reference:
-                # Array-style: template_name[1]
-                match = re.match(r'^(\w+)\[(\d+)\]$', template_reference)
-                if match:
-                    template_name = match.group(1)
-                    index = int(match.group(2)) - 1  # Convert to 0-based
-                    return self._get_template_data_by_index(template_name, index)
+            kind, template_name, argument = self._parse_template_reference(template_reference)
             
-            elif '.' in template_reference:
+            if kind == 'index':
+                return kind, self._get_template_data_by_index(template_name, argument)
+            elif kind == 'field':
+                return kind, self._get_template_field_data(template_name, argument)
+            elif kind == 'next':
+                return kind, self._get_next_template_data(template_name)
+            return None, None
+        
+        except Exception as e:
+            self.logger.error("Failed to get template data for '%s': %s", template_reference, e)
+            return None, None
+    
+    def _parse_template_reference(self, template_reference: str) -> Tuple[Optional[str], str, Any]:
+        """
+        Split a reference into (kind, template name, index or field path), memoized per reference.
+        
+        kind is 'index', 'field', 'next', or None for malformed array references.
+        """
+        parsed = self._reference_cache.get(template_reference)
+        if parsed is not None:
+            return parsed
+        
+        if template_reference.find('[') != -1 and template_reference.find(']') != -1:
+            # Array-style: template_name[1]
+            match = _ARRAY_REF_RE.match(template_reference)
+            if match:
+                parsed = ('index', match.group(1), int(match.group(2)) - 1)  # Convert to 0-based
+            else:
+                parsed = (None, template_reference, None)
+        else:
+            dot = template_reference.find('.')
+            if dot != -1:
                 # Field-style: template_name.field
-                parts = template_reference.split('.', 1)
-                template_name = parts[0]
-                field_path = parts[1]
-                return self._get_template_field_data(template_name, field_path)
-            
+                parsed = ('field', template_reference[:dot], template_reference[dot + 1:])
             else:
                 # Simple template name - get next data
-                return self._get_next_template_data(template_reference)
+                parsed = ('next', template_reference, None)
         
-        except Exception as e:
-            self.logger.error(f"Failed to get template data for '{template_reference}': {e}")
-            return None
+        if len(self._reference_cache) >= _REFERENCE_CACHE_SIZE:
+            self._reference_cache.clear()
+        self._reference_cache[template_reference] = parsed
+        return parsed
+    
+    @staticmethod
+    def _copy_row(row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Shallow-copy a shared resolved row before handing it to callers that may mutate it."""
+        return row.copy() if row is not None else None
     
     def _get_template_data_by_index(self, template_name: str, index: int) -> Optional[Dict[str, Any]]:
-        """Get template data by specific index."""
-        template = self.templates.get(template_name)
-        if not template or not template.data:
+        """Get the shared resolved row at a specific index."""
+        rows = self.resolved_templates.get(template_name)
+        if not rows:
             return None
         
-        if 0 <= index < len(template.data):
-            data = template.data[index].copy()
-            return self._apply_computed_fields(template, data)
+        if 0 <= index < len(rows):
+            return rows[index]
         
         return None
     
@@ -325,198 +622,174 @@ class TemplateEngine:
         return None
     
     def _get_next_template_data(self, template_name: str) -> Optional[Dict[str, Any]]:
-        """Get next data item from template based on cycling strategy."""
+        """Get the next shared resolved row from template based on cycling strategy."""
         template = self.templates.get(template_name)
-        if not template or not template.data:
+        rows = self.resolved_templates.get(template_name)
+        if not template or not rows:
             return None
         
         data_item = None
+        self._summary_cache = None  # Cycling position is part of the summary
         
         if template.cycling == CyclingStrategy.SEQUENTIAL:
-            data_item = template.data[template.current_index]
-            template.current_index = (template.current_index + 1) % len(template.data)
+            data_item = rows[template.current_index]
+            template.current_index = (template.current_index + 1) % len(rows)
         
         elif template.cycling == CyclingStrategy.RANDOM:
-            data_item = random.choice(template.data)
+            data_item = rows[self._next_random_index(template, len(rows))]
         
         elif template.cycling == CyclingStrategy.ONCE:
-            available_indices = [i for i in range(len(template.data)) if i not in template.used_indices]
-            if available_indices:
-                index = available_indices[0]
-                data_item = template.data[index]
+            if template.remaining:
+                index = template.remaining.popleft()
+                data_item = rows[index]
                 template.used_indices.add(index)
             else:
                 return None  # All items used
         
         elif template.cycling == CyclingStrategy.INFINITE:
-            data_item = template.data[template.current_index]
-            template.current_index = (template.current_index + 1) % len(template.data)
+            data_item = rows[template.current_index]
+            template.current_index = (template.current_index + 1) % len(rows)
         
-        if data_item:
-            # Apply computed fields
-            data_copy = data_item.copy()
-            return self._apply_computed_fields(template, data_copy)
-        
-        return None
+        return data_item or None
     
-    def _apply_computed_fields(self, template: TemplateData, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply computed field calculations to data."""
-        for field_name, field_config in template.computed_fields.items():
-            try:
-                computed_value = self._compute_field_value(field_config, data)
-                if computed_value is not None:
-                    data[field_name] = computed_value
-            except Exception as e:
-                self.logger.error(f"Failed to compute field {field_name}: {e}")
+    def _next_random_index(self, template: TemplateData, size: int) -> int:
+        """
+        Pick a random row index, drawing indices from NumPy in batches when available.
         
-        return data
+        The template's Generator is seeded from the random module on first use,
+        so random.seed() still makes the picks reproducible.
+        """
+        if not numpy_available:
+            return random.randrange(size)
+        
+        if template.random_position >= len(template.random_indices):
+            if template.random_source is None:
+                template.random_source = np.random.default_rng(random.getrandbits(64))
+            template.random_indices = template.random_source.integers(0, size, size=_RANDOM_BATCH_SIZE).tolist()
+            template.random_position = 0
+        
+        index = template.random_indices[template.random_position]
+        template.random_position += 1
+        return index
     
-    def _compute_field_value(self, field_config: Union[str, Dict], data: Dict[str, Any]) -> Any:
-        """Compute value for a computed field."""
-        if isinstance(field_config, str):
-            return self._evaluate_formula(field_config, data)
+    def _compile_formula(self, formula: str) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Parse a formula once into a function of a data row.
         
-        elif isinstance(field_config, dict):
-            formula = field_config.get('formula', '')
-            if formula:
-                return self._evaluate_formula(formula, data)
+        The formula kind and its operands are worked out here, so evaluating
+        a row does no string scanning. The returned function may raise;
+        _evaluate_rows handles that.
+        """
+        # Handle common formula patterns
+        if ' + ' in formula:
+            evaluate = self._compile_addition_formula(formula)
+        elif ' - ' in formula:
+            evaluate = self._compile_subtraction_formula(formula)
+        elif 'concat(' in formula.lower():
+            evaluate = self._compile_concat_formula(formula)
+        elif 'sum(' in formula.lower():
+            evaluate = self._compile_sum_formula(formula)
+        else:
+            # Simple field reference
+            evaluate = lambda data: data.get(formula, formula)
         
-        return None
+        return evaluate
     
-    def _evaluate_formula(self, formula: str, data: Dict[str, Any]) -> Any:
-        """Evaluate a formula with available data."""
-        try:
-            # Handle common formula patterns
-            if ' + ' in formula:
-                return self._evaluate_addition_formula(formula, data)
-            elif ' - ' in formula:
-                return self._evaluate_subtraction_formula(formula, data)
-            elif 'concat(' in formula.lower():
-                return self._evaluate_concat_formula(formula, data)
-            elif 'sum(' in formula.lower():
-                return self._evaluate_sum_formula(formula, data)
-            else:
-                # Simple field reference
-                return data.get(formula, formula)
-        
-        except Exception as e:
-            self.logger.error(f"Failed to evaluate formula '{formula}': {e}")
-            return None
-    
-    def _evaluate_addition_formula(self, formula: str, data: Dict[str, Any]) -> Any:
-        """Evaluate addition formula like 'DepartureTime + 2h30m'."""
+    def _compile_addition_formula(self, formula: str) -> Callable[[Dict[str, Any]], Any]:
+        """Compile addition formula like 'DepartureTime + 2h30m'."""
         parts = formula.split(' + ')
         if len(parts) != 2:
-            return None
+            return lambda data: None
         
         base_field = parts[0].strip()
         addition_part = parts[1].strip()
         
-        base_value = data.get(base_field)
-        if not base_value:
-            return None
-        
         # Handle time duration addition
         if 'h' in addition_part or 'm' in addition_part:
-            return self._add_time_duration(str(base_value), addition_part)
+            def add_duration(data: Dict[str, Any]) -> Any:
+                base_value = data.get(base_field)
+                if not base_value:
+                    return None
+                return self._add_time_duration(str(base_value), addition_part)
+            return add_duration
         
         # Handle numeric addition
         try:
-            base_num = float(base_value)
             add_num = float(addition_part)
-            return str(base_num + add_num)
         except ValueError:
-            return None
+            return lambda data: None
+        
+        def add_number(data: Dict[str, Any]) -> Any:
+            base_value = data.get(base_field)
+            if not base_value:
+                return None
+            try:
+                return _format_number(float(base_value) + add_num)
+            except ValueError:
+                return None
+        return add_number
     
-    def _evaluate_subtraction_formula(self, formula: str, data: Dict[str, Any]) -> Any:
-        """Evaluate subtraction formula."""
+    def _compile_subtraction_formula(self, formula: str) -> Callable[[Dict[str, Any]], Any]:
+        """Compile subtraction formula."""
         parts = formula.split(' - ')
         if len(parts) != 2:
-            return None
+            return lambda data: None
         
         field1 = parts[0].strip()
         field2 = parts[1].strip()
         
-        value1 = data.get(field1)
-        value2 = data.get(field2)
-        
-        if value1 and value2:
-            try:
-                return str(float(value1) - float(value2))
-            except ValueError:
-                return None
-        
-        return None
+        def subtract(data: Dict[str, Any]) -> Any:
+            value1 = data.get(field1)
+            value2 = data.get(field2)
+            
+            if value1 and value2:
+                try:
+                    return _format_number(float(value1) - float(value2))
+                except ValueError:
+                    return None
+            
+            return None
+        return subtract
     
-    def _evaluate_concat_formula(self, formula: str, data: Dict[str, Any]) -> str:
-        """Evaluate concatenation formula like 'concat(FirstName, " ", LastName)'."""
+    def _compile_concat_formula(self, formula: str) -> Callable[[Dict[str, Any]], str]:
+        """Compile concatenation formula like 'concat(FirstName, " ", LastName)'."""
         # Extract content between parentheses
-        match = re.search(r'concat\((.*)\)', formula, re.IGNORECASE)
+        match = _CONCAT_RE.search(formula)
         if not match:
-            return formula
+            return lambda data: formula
         
         content = match.group(1)
-        parts = [part.strip().strip('"\'') for part in content.split(',')]
-        
-        result_parts = []
-        for part in parts:
-            if part in data:
-                result_parts.append(str(data[part]))
-            else:
-                result_parts.append(part)
+        parts = tuple(part.strip().strip('"\'') for part in content.split(','))
         
-        return ''.join(result_parts)
+        # A part present in the row is replaced by its value; any other part is
+        # literal text, which is its own default in a single lookup
+        def concat(data: Dict[str, Any]) -> str:
+            return ''.join([str(data.get(part, part)) for part in parts])
+        return concat
     
-    def _evaluate_sum_formula(self, formula: str, data: Dict[str, Any]) -> str:
-        """Evaluate sum formula."""
+    def _compile_sum_formula(self, formula: str) -> Callable[[Dict[str, Any]], str]:
+        """Compile sum formula."""
         # Simplified sum implementation
-        match = re.search(r'sum\((.*)\)', formula, re.IGNORECASE)
+        match = _SUM_RE.search(formula)
         if not match:
-            return formula
+            return lambda data: formula
         
-        content = match.group(1)
-        fields = [field.strip() for field in content.split(',')]
-        
-        total = 0
-        for field in fields:
-            value = data.get(field, 0)
-            try:
-                total += float(value)
-            except (ValueError, TypeError):
-                continue
+        fields = [field_name.strip() for field_name in match.group(1).split(',')]
         
-        return str(total)
+        def total(data: Dict[str, Any]) -> str:
+            result = 0
+            for field_name in fields:
+                try:
+                    result += float(data.get(field_name, 0))
+                except (ValueError, TypeError):
+                    continue
+            return _format_number(result)
+        return total
     
     def _add_time_duration(self, base_time: str, duration: str) -> str:
         """Add duration to time string."""
         try:
-            # Parse base time (assume ISO format)
-            if 'T' in base_time:
-                base_dt = datetime.fromisoformat(base_time.replace('Z', '+00:00'))
-            else:
-                base_dt = datetime.strptime(base_time, '%Y-%m-%d')
-            
-            # Parse duration (e.g., "2h30m", "1h", "45m")
-            hours = 0
-            minutes = 0
-            
-            hour_match = re.search(r'(\d+)h', duration)
-            if hour_match:
-                hours = int(hour_match.group(1))
-            
-            minute_match = re.search(r'(\d+)m', duration)
-            if minute_match:
-                minutes = int(minute_match.group(1))
-            
-            # Add duration
-            result_dt = base_dt + timedelta(hours=hours, minutes=minutes)
-            
-            # Return in same format as input
-            if 'T' in base_time:
-                return result_dt.isoformat()
-            else:
-                return result_dt.strftime('%Y-%m-%d')
-        
+            return _offset_time(base_time, duration)
         except Exception as e:
             self.logger.error(f"Failed to add duration '{duration}' to time '{base_time}': {e}")
             return base_time
@@ -532,45 +805,61 @@ class TemplateEngine:
             Map of element_path -> resolved_value
         """
         resolved_values = {}
+        encoded_by_id: Dict[int, str] = {}  # Resolved rows are shared, so each is encoded once
         
         for element_path, template_ref in element_template_map.items():
-            template_data = self.get_template_data(template_ref)
+            _, template_data = self._lookup_template_reference(template_ref)
             if template_data:
                 # For now, convert to JSON string
                 # Full implementation would need more sophisticated mapping
-                resolved_values[element_path] = json.dumps(template_data)
+                encoded = encoded_by_id.get(id(template_data))
+                if encoded is None:
+                    encoded = encoded_by_id[id(template_data)] = json.dumps(template_data)
+                resolved_values[element_path] = encoded
         
         return resolved_values
     
     def get_template_summary(self) -> Dict[str, Any]:
         """Get summary of template configuration for debugging."""
-        return {
-            'templates': {
-                name: {
-                    'fields': template.fields,
-                    'data_count': len(template.data),
-                    'cycling': template.cycling.value,
-                    'computed_fields': len(template.computed_fields),
-                    'current_index': template.current_index,
-                    'used_count': len(template.used_indices)
-                }
-                for name, template in self.templates.items()
-            },
-            'computed_processors': len(self.computed_processors),
-            'total_templates': len(self.templates)
+        if self._summary_cache is None:
+            self._summary_cache = {
+                'templates': {
+                    name: {
+                        'fields': template.fields,
+                        'data_count': len(template.data),
+                        'cycling': template.cycling.value,
+                        'computed_fields': len(template.computed_fields),
+                        'current_index': template.current_index,
+                        'used_count': len(template.used_indices)
+                    }
+                    for name, template in self.templates.items()
+                },
+                'computed_processors': len(self.computed_processors),
+                'total_templates': len(self.templates)
+            }
+        
+        # Fresh nested containers, so callers cannot modify the cached summary or the templates
+        summary = dict(self._summary_cache)
+        summary['templates'] = {
+            name: {**template_summary, 'fields': dict(template_summary['fields'])}
+            for name, template_summary in summary['templates'].items()
         }
+        return summary
     
     def reset_template_state(self, template_name: Optional[str] = None) -> None:
         """Reset template cycling state."""
+        self._summary_cache = None
         if template_name:
             template = self.templates.get(template_name)
             if template:
                 template.current_index = 0
                 template.used_indices.clear()
+                template.reset_remaining()
         else:
             for template in self.templates.values():
                 template.current_index = 0
                 template.used_indices.clear()
+                template.reset_remaining()
     
     def validate_templates(self) -> List[str]:
         """Validate template configurations."""
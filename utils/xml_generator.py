@@ -182,7 +182,8 @@ class IterativeConstraintExtractor:
 class XMLGenerator:
     """Universal class for generating dummy XML files from any XSD schema with deep recursive parsing."""
     
-    def __init__(self, xsd_path: str, config_instance=None, config_data: Dict[str, Any] = None):
+    def __init__(self, xsd_path: str, config_instance=None, config_data: Dict[str, Any] = None,
+                 schema: Optional[xmlschema.XMLSchema] = None):
         """
         Initialize the universal XML generator.
         
@@ -190,9 +191,10 @@ class XMLGenerator:
             xsd_path: Path to the XSD schema file
             config_instance: Configuration instance (uses global config if None)
             config_data: Enhanced configuration data with new features
+            schema: Already-built schema for xsd_path; loaded from the file if None
         """
         self.xsd_path = xsd_path
-        self.schema = None
+        self.schema = schema
         self.processed_types = set()  # Track processed types to prevent infinite recursion
         self.config = config_instance or get_config()
         self.type_factory = TypeGeneratorFactory(self.config)  # Initialize type generator factory
@@ -222,6 +224,12 @@ class XMLGenerator:
     
     def _load_schema(self) -> None:
         """Load the XSD schema from the file with dependency resolution."""
+        if self.schema is not None:
+            # Schema supplied by the caller; only the per-generator helpers are built
+            self.constraint_extractor = IterativeConstraintExtractor(self.schema)
+            self.type_resolver = UniversalXSDTypeResolver(self.schema)
+            return
+        
         if not self.xsd_path:
             raise ValueError("XSD path cannot be empty")
             
@@ -12,13 +12,114 @@ Architecture:
 - Handles namespaces, XPath resolution, and complex data types
 """
 
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any, Union, Tuple
+from lxml import etree as ET
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
 import re
 import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-from .enhanced_json_config import EnhancedJsonConfig
+from .enhanced_json_config import EnhancedJsonConfig, parse_attribute_selector
+
+if TYPE_CHECKING:
+    from .choice_resolver import ChoiceResolver
+
+
+@lru_cache(maxsize=512)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a wildcard pattern where '*' matches any run of characters and all else is literal."""
+    return re.compile('^' + re.escape(pattern).replace(r'\*', '.*') + '$')
+
+
+@lru_cache(maxsize=512)
+def _glob_tester(pattern: str) -> Callable[[str], Any]:
+    """Return a match test for a wildcard pattern, using plain string checks for the common shapes."""
+    if '*' not in pattern:
+        return pattern.__eq__
+    if not pattern.strip('*'):
+        return lambda name: True
+    if pattern.count('*') == 1:
+        if pattern.endswith('*'):
+            prefix = pattern[:-1]
+            return lambda name: name.startswith(prefix)
+        if pattern.startswith('*'):
+            suffix = pattern[1:]
+            return lambda name: name.endswith(suffix)
+    return _compile_glob(pattern).match
+
+
+@dataclass
+class _OverrideMatchers:
+    """
+    Value and pattern overrides compiled into lookups for the index walk.
+    
+    Entries are referred to by position in value_entries / pattern_entries,
+    so matches can be applied back in configuration order.
+    """
+    value_entries: List[Tuple[str, Optional[str], Any]] = field(default_factory=list)  # (path, attribute name, value)
+    template_entries: List[int] = field(default_factory=list)            # value entries holding "@template" references
+    exact_paths: Dict[str, List[int]] = field(default_factory=dict)      # path -> value entries
+    exact_indexed: Dict[Tuple[str, int], List[int]] = field(default_factory=dict)  # (path, position) -> value entries
+    names: Dict[str, List[int]] = field(default_factory=dict)            # local name -> value entries
+    suffixes: List[Tuple[str, int]] = field(default_factory=list)        # multi-step names like "A/B"
+    pattern_entries: List[Tuple[str, Any, Optional[Callable[[str], Any]]]] = field(default_factory=list)  # (pattern, value, attribute test)
+    tag_patterns: Dict[str, List[int]] = field(default_factory=dict)     # exact element name -> pattern entries
+    wildcard_patterns: List[Tuple[Callable[[str], Any], int]] = field(default_factory=list)
+    universal_patterns: List[int] = field(default_factory=list)          # patterns with no element part
+
+
+@lru_cache(maxsize=4096)
+def _local_name(tag: str) -> str:
+    """Extract local name from potentially namespaced tag (a document has few distinct tags)."""
+    brace = tag.find('}')
+    return tag[brace + 1:] if brace >= 0 else tag
+
+
+# Index keys with a sibling position, e.g. "Root/A/B[2]"
+_INDEXED_PATH_RE = re.compile(r'^(.*)\[([1-9]\d*)\]$')
+
+
+class _StreamingResolvers:
+    """Per-entry value resolvers and template data for one streaming run, created on first use."""
+    
+    def __init__(self, engine: 'XMLOverrideEngine'):
+        self._engine = engine
+        self._values: Dict[int, Callable[[], str]] = {}
+        self._patterns: Dict[int, Callable[[], str]] = {}
+        self._templates: Dict[int, Optional[str]] = {}
+        self._template_entries = set(engine._matchers.template_entries)
+        
+        # Selectors are tested per element (element None matches any); unparseable ones
+        # match nothing, as with XPath
+        self.attributes: List[Tuple[Optional[str], str, Callable[[], str]]] = []
+        for selector, value in engine.config.attributes.items():
+            parsed = parse_attribute_selector(selector)
+            if parsed is not None:
+                self.attributes.append((*parsed, engine._value_resolver(value)))
+    
+    def value(self, entry: int) -> Callable[[], str]:
+        resolve = self._values.get(entry)
+        if resolve is None:
+            resolve = self._values[entry] = self._engine._value_resolver(self._engine._matchers.value_entries[entry][2])
+        return resolve
+    
+    def pattern(self, entry: int) -> Callable[[], str]:
+        resolve = self._patterns.get(entry)
+        if resolve is None:
+            resolve = self._patterns[entry] = self._engine._value_resolver(self._engine._matchers.pattern_entries[entry][1])
+        return resolve
+    
+    def template(self, entry: int) -> Optional[str]:
+        """Template data to set for a value entry, or None when it is not an applicable template."""
+        if entry not in self._template_entries:
+            return None
+        if entry not in self._templates:
+            value = self._engine._matchers.value_entries[entry][2]
+            template_data = self._engine.config._resolve_template_reference(value)
+            self._templates[entry] = template_data if template_data and template_data != value else None
+        return self._templates[entry]
 
 
 class XMLOverrideEngineError(Exception):
@@ -41,12 +142,13 @@ class XMLOverrideEngine:
     - Maintains attribute and element text content
     """
     
-    def __init__(self, enhanced_config: EnhancedJsonConfig):
+    def __init__(self, enhanced_config: EnhancedJsonConfig, audit: bool = False):
         """
         Initialize XML Override Engine.
         
         Args:
             enhanced_config: Enhanced JSON configuration instance
+            audit: Record every applied override for get_override_summary (default: counts only)
         """
         self.config = enhanced_config
         self.logger = logging.getLogger(__name__)
@@ -55,15 +157,24 @@ class XMLOverrideEngine:
         self.xml_tree = None
         self.root = None
         self.namespace_map = {}
-        self.element_index = {}  # For indexed element access
-        
-        # Override tracking
-        self.applied_overrides = {
-            'values': [],
-            'patterns': [],
-            'templates': [],
-            'attributes': []
-        }
+        self._sibling_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._element_to_path: Dict[ET._Element, str] = {}  # element -> its (unindexed) path
+        
+        # Parse like xml.etree did: comments and PIs dropped, entities left unexpanded
+        self._parser = ET.XMLParser(remove_comments=True, remove_pis=True, resolve_entities=False)
+        
+        # Value and pattern overrides compiled once per config; the index walk fills in their matches
+        self._matchers = self._compile_matchers()
+        self._matched_values: List[List[ET._Element]] = []
+        self._matched_patterns: List[List[Tuple[ET._Element, str]]] = []  # (element, path)
+        
+        # Attribute selectors compiled to XPath once per selector string
+        self._xpath_cache: Dict[str, Tuple[ET.XPath, Dict[str, str]]] = {}
+        
+        # Override tracking: counts always, (path, attribute, value) records only when auditing
+        self._audit = audit
+        self.override_counts: Dict[str, int] = dict.fromkeys(('values', 'patterns', 'templates', 'attributes'), 0)
+        self._applied_raw: Dict[str, List[Tuple[str, Optional[str], str]]] = {kind: [] for kind in self.override_counts}
     
     def apply_overrides(self, base_xml: Union[str, ET.Element, ET.ElementTree]) -> str:
         """
@@ -75,6 +186,29 @@ class XMLOverrideEngine:
         Returns:
             Enhanced XML as string
             
+        Raises:
+            XMLOverrideEngineError: If override application fails
+        """
+        self.apply_overrides_tree(base_xml)
+        
+        try:
+            # Convert back to string
+            return self._tree_to_string()
+        except Exception as e:
+            raise XMLOverrideEngineError(f"Failed to apply overrides: {e}") from e
+    
+    def apply_overrides_tree(self, base_xml: Union[str, ET.Element, ET.ElementTree]) -> ET.ElementTree:
+        """
+        Apply all JSON configuration overrides and return the modified tree.
+        
+        Lets callers that keep working on the tree skip a serialize/parse roundtrip.
+        
+        Args:
+            base_xml: Base XML as string, Element, or ElementTree
+            
+        Returns:
+            Enhanced XML as ElementTree
+            
         Raises:
             XMLOverrideEngineError: If override application fails
         """
@@ -92,26 +226,164 @@ class XMLOverrideEngine:
             self._apply_attribute_overrides()
             self._apply_namespace_prefixes()
             
-            # Convert back to string
-            return self._tree_to_string()
+            return self.xml_tree
             
         except Exception as e:
             raise XMLOverrideEngineError(f"Failed to apply overrides: {e}") from e
     
+    def apply_overrides_and_choices(self, base_xml: Union[str, ET.Element, ET.ElementTree],
+                                    choice_resolver: Optional['ChoiceResolver'] = None) -> ET.ElementTree:
+        """
+        Apply overrides and then choice-based element removal to the same tree.
+        
+        Args:
+            base_xml: Base XML as string, Element, or ElementTree
+            choice_resolver: Resolver whose choices are applied after the overrides (optional)
+            
+        Returns:
+            Enhanced XML as ElementTree
+            
+        Raises:
+            XMLOverrideEngineError: If override application fails. Errors from the
+                choice step propagate unchanged; the overridden tree stays in xml_tree.
+        """
+        xml_tree = self.apply_overrides_tree(base_xml)
+        if choice_resolver is not None:
+            choice_resolver.apply_choices_to_xml(xml_tree)
+        return xml_tree
+    
+    def apply_overrides_streaming(self, source: Union[str, Path, BinaryIO],
+                                  output: Union[str, Path, BinaryIO]) -> None:
+        """
+        Apply all overrides while streaming a large XML file to output.
+        
+        Elements are overridden as the parser completes them, and each child of
+        the root is written out and dropped once its tail is known, so only one
+        top-level subtree is held in memory. Every override depends only on the
+        element's own path, sibling position, name and attributes, so the result
+        matches apply_overrides(); generated values are drawn in document order
+        rather than override order. The root's namespace declarations are
+        repeated on each written child.
+        
+        Args:
+            source: Path or binary file object of the base XML
+            output: Path or binary file object the enhanced XML is written to
+        
+        Raises:
+            XMLOverrideEngineError: If override application fails
+        """
+        self.xml_tree = None
+        self.root = None
+        self._sibling_counts = defaultdict(int)
+        self._element_to_path = {}
+        
+        resolvers = _StreamingResolvers(self)
+        patterns_by_tag: Dict[str, List[int]] = {}
+        open_paths: List[str] = []
+        
+        try:
+            with ET.xmlfile(str(output) if isinstance(output, Path) else output, encoding='utf-8') as xf:
+                xf.write_declaration()
+                root_context = None
+                pending = None  # last completed child of the root, written once its tail is parsed
+                
+                for event, element in ET.iterparse(str(source) if isinstance(source, Path) else source,
+                                                   events=('start', 'end'), remove_comments=True,
+                                                   remove_pis=True, resolve_entities=False):
+                    if event == 'start':
+                        if not open_paths:
+                            self.root = element
+                            self._extract_namespaces()
+                            open_paths.append(_local_name(element.tag))
+                            continue
+                        
+                        if len(open_paths) == 1:
+                            if root_context is None:
+                                # The root's text is parsed by now, so its overrides stick
+                                self._apply_element_overrides(self.root, open_paths[0],
+                                                              f'/{open_paths[0]}', 1, patterns_by_tag, resolvers)
+                                root_context = xf.element(self.root.tag, dict(self.root.attrib), self.root.nsmap)
+                                root_context.__enter__()
+                                if self.root.text:
+                                    xf.write(self.root.text)
+                            if pending is not None:
+                                xf.write(pending)
+                                self.root.remove(pending)
+                                pending = None
+                        
+                        parent_path = open_paths[-1]
+                        element_name = _local_name(element.tag)
+                        current_path = f"{parent_path}/{element_name}"
+                        open_paths.append(current_path)
+                        
+                        sibling_key = (parent_path, element_name)
+                        self._sibling_counts[sibling_key] += 1
+                        continue
+                    
+                    current_path = open_paths.pop()
+                    if not open_paths:
+                        # Root end: a childless root is overridden and written whole
+                        if root_context is None:
+                            self._apply_element_overrides(element, current_path, f'/{current_path}', 1,
+                                                          patterns_by_tag, resolvers)
+                            xf.write(element)
+                        else:
+                            if pending is not None:
+                                xf.write(pending)
+                            root_context.__exit__(None, None, None)
+                        continue
+                    
+                    parent_path, element_name = current_path.rsplit('/', 1)
+                    self._apply_element_overrides(element, element_name, current_path,
+                                                  self._sibling_counts[(parent_path, element_name)],
+                                                  patterns_by_tag, resolvers)
+                    if len(open_paths) == 1:
+                        pending = element
+            
+            self.root = None
+        except Exception as e:
+            raise XMLOverrideEngineError(f"Failed to apply overrides: {e}") from e
+    
+    def _apply_element_overrides(self, element: ET.Element, element_name: str, current_path: str,
+                                 position: int, patterns_by_tag: Dict[str, List[int]],
+                                 resolvers: '_StreamingResolvers') -> None:
+        """Apply every override stage to a single element, in precedence order."""
+        value_matches, pattern_entries = self._element_matches(element_name, current_path, position,
+                                                               patterns_by_tag)
+        value_entries = sorted(value_matches)
+        
+        for entry in value_entries:
+            self._set_value_override(element, entry, resolvers.value(entry))
+        
+        for entry in pattern_entries:
+            resolve = resolvers.pattern(entry)
+            self._set_pattern_override(element, current_path, entry, resolve)
+        
+        for entry in value_entries:
+            template_data = resolvers.template(entry)
+            if template_data is not None:
+                element.text = template_data
+                self._record_override('templates', self._matchers.value_entries[entry][0], None, template_data)
+        
+        for element_part, attr_name, resolve in resolvers.attributes:
+            if (element_part is None or element_part == element_name) and attr_name in element.attrib:
+                self._set_attribute_override(element, current_path, attr_name, resolve)
+    
     def _parse_base_xml(self, base_xml: Union[str, ET.Element, ET.ElementTree]) -> None:
         """Parse base XML into ElementTree structure."""
         if isinstance(base_xml, str):
             try:
-                self.root = ET.fromstring(base_xml)
+                # lxml rejects str input carrying an encoding declaration
+                self.root = ET.fromstring(base_xml.encode('utf-8'), self._parser)
                 self.xml_tree = ET.ElementTree(self.root)
             except ET.ParseError as e:
                 raise XMLOverrideEngineError(f"Invalid XML: {e}")
                 
-        elif isinstance(base_xml, ET.Element):
+        elif isinstance(base_xml, ET._Element):
             self.root = base_xml
             self.xml_tree = ET.ElementTree(self.root)
             
-        elif isinstance(base_xml, ET.ElementTree):
+        elif isinstance(base_xml, ET._ElementTree):
             self.xml_tree = base_xml
             self.root = base_xml.getroot()
             
@@ -123,115 +395,243 @@ class XMLOverrideEngine:
     
     def _extract_namespaces(self) -> None:
         """Extract namespace mappings from XML."""
-        # Get namespaces from root element
-        for prefix, uri in ET._namespace_map.items():
-            if prefix:  # Skip default namespace
-                self.namespace_map[prefix] = uri
-        
-        # Also check root element attributes for namespace declarations
-        for attr_name, attr_value in self.root.attrib.items():
-            if attr_name.startswith('xmlns:'):
-                prefix = attr_name[6:]  # Remove 'xmlns:' prefix
-                self.namespace_map[prefix] = attr_value
-            elif attr_name == 'xmlns':
-                self.namespace_map[''] = attr_value  # Default namespace
+        # lxml keeps the declarations in scope at the root element; rebuilt per document
+        # so prefixes from earlier runs do not carry over
+        self.namespace_map = {prefix: uri for prefix, uri in self.root.nsmap.items() if prefix}
+        default_uri = self.root.nsmap.get(None)
+        if default_uri:
+            self.namespace_map[''] = default_uri  # Default namespace
     
     def _build_element_index(self) -> None:
         """Build index of elements for efficient XPath-like lookups."""
-        self.element_index = {}
+        self._sibling_counts = defaultdict(int)  # (parent path, name) -> siblings seen so far
+        self._element_to_path = {}
+        
+        # Override matches are collected on the same walk, one slot per config entry
+        self._matched_values = [[] for _ in self._matchers.value_entries]
+        self._matched_patterns = [[] for _ in self._matchers.pattern_entries]
+        patterns_by_tag: Dict[str, List[int]] = {}
         
-        def index_element(element, path_components):
+        # Start indexing from root
+        root_name = _local_name(self.root.tag)
+        self._element_to_path[self.root] = f'/{root_name}'
+        self._match_element(self.root, root_name, f'/{root_name}', 1, patterns_by_tag)
+        
+        # One iterative walk; the stack holds the path of each open element
+        open_paths: List[str] = []
+        for event, element in ET.iterwalk(self.root, events=('start', 'end')):
+            if event == 'end':
+                open_paths.pop()
+                continue
+            
+            if not open_paths:
+                open_paths.append(root_name)
+                continue
+            
             # Build full path
-            element_name = self._get_local_name(element.tag)
-            current_path = '/'.join(path_components + [element_name])
+            parent_path = open_paths[-1]
+            element_name = _local_name(element.tag)
+            current_path = f"{parent_path}/{element_name}"
+            open_paths.append(current_path)
+            
+            # Count siblings with same name for indexing; the indexed path ("A/B[2]")
+            # stays a (path, position) pair and is only formatted for override records
+            sibling_key = (parent_path, element_name)
+            self._sibling_counts[sibling_key] += 1
+            
+            self._element_to_path[element] = current_path
+            self._match_element(element, element_name, current_path, self._sibling_counts[sibling_key],
+                                patterns_by_tag)
+    
+    def _compile_matchers(self) -> _OverrideMatchers:
+        """Classify value paths and compile patterns the way the lookups used to resolve them."""
+        matchers = _OverrideMatchers()
+        
+        for entry, (path, value) in enumerate(self.config.values.items()):
+            attr_name = path.split('@')[-1] if '@' in path else None
+            matchers.value_entries.append((path, attr_name, value))
+            if isinstance(value, str) and value.startswith('@'):
+                matchers.template_entries.append(entry)
             
-            # Count siblings with same name for indexing
-            parent_path = '/'.join(path_components) if path_components else ''
-            sibling_count = self.element_index.get(f"{parent_path}_count_{element_name}", 0) + 1
-            self.element_index[f"{parent_path}_count_{element_name}"] = sibling_count
+            # Handle absolute paths
+            if path.startswith('/'):
+                self._add_exact_path(matchers, path.split('@')[0], entry)
             
-            # Store element with indexed path
-            indexed_path = f"{current_path}[{sibling_count}]"
-            self.element_index[current_path] = self.element_index.get(current_path, [])
-            self.element_index[current_path].append(element)
-            self.element_index[indexed_path] = element
+            # Handle dot notation
+            elif '.' in path and not path.startswith('@'):
+                xpath_path = '/' + path.replace('.', '/')
+                self._add_exact_path(matchers, xpath_path.split('@')[0], entry)
             
-            # Recurse to children
-            for child in element:
-                index_element(child, path_components + [element_name])
+            # Handle simple element names: every element with the name
+            else:
+                element_name = path.split('@')[0]
+                if '/' in element_name:
+                    matchers.suffixes.append((f'/{element_name}', entry))
+                else:
+                    matchers.names.setdefault(element_name, []).append(entry)
         
-        # Start indexing from root
-        root_name = self._get_local_name(self.root.tag)
-        self.element_index[f'/{root_name}'] = [self.root]
-        self.element_index[f'/{root_name}[1]'] = self.root
+        for entry, (pattern, value) in enumerate(self.config.patterns.items()):
+            element_test, attr_test = self._compile_override_pattern(pattern)
+            matchers.pattern_entries.append((pattern, value, attr_test))
+            
+            element_pattern = pattern.split('@', 1)[0]
+            if element_test is None:
+                matchers.universal_patterns.append(entry)
+            elif '*' not in element_pattern:
+                matchers.tag_patterns.setdefault(element_pattern, []).append(entry)
+            else:
+                matchers.wildcard_patterns.append((element_test, entry))
         
-        for child in self.root:
-            index_element(child, [root_name])
+        return matchers
+    
+    @staticmethod
+    def _add_exact_path(matchers: _OverrideMatchers, key: str, entry: int) -> None:
+        """Register a value entry under a plain path or, for keys like "A/B[2]", a (path, position) pair."""
+        match = _INDEXED_PATH_RE.match(key)
+        if match:
+            matchers.exact_indexed.setdefault((match.group(1), int(match.group(2))), []).append(entry)
+        else:
+            matchers.exact_paths.setdefault(key, []).append(entry)
+    
+    def _match_element(self, element: ET.Element, element_name: str, current_path: str,
+                       position: int, patterns_by_tag: Dict[str, List[int]]) -> None:
+        """Record which value and pattern overrides an element matches, once per element."""
+        value_matches, pattern_entries = self._element_matches(element_name, current_path, position,
+                                                               patterns_by_tag)
+        for entry in value_matches:
+            self._matched_values[entry].append(element)
+        for entry in pattern_entries:
+            self._matched_patterns[entry].append((element, current_path))
+    
+    def _element_matches(self, element_name: str, current_path: str, position: int,
+                         patterns_by_tag: Dict[str, List[int]]) -> Tuple[List[int], List[int]]:
+        """
+        Look up the overrides matching one element.
+        
+        Returns:
+            Matching value entries, and the pattern entries in configuration order
+        """
+        matchers = self._matchers
+        value_matches = list(matchers.exact_paths.get(current_path, ()))
+        if matchers.exact_indexed:
+            value_matches.extend(matchers.exact_indexed.get((current_path, position), ()))
+        
+        value_matches.extend(matchers.names.get(element_name, ()))
+        value_matches.extend(entry for suffix, entry in matchers.suffixes if current_path.endswith(suffix))
+        
+        # Wildcards are tested once per distinct tag name
+        pattern_entries = patterns_by_tag.get(element_name)
+        if pattern_entries is None:
+            pattern_entries = sorted(
+                matchers.tag_patterns.get(element_name, []) +
+                [entry for matches, entry in matchers.wildcard_patterns if matches(element_name)] +
+                matchers.universal_patterns
+            )
+            patterns_by_tag[element_name] = pattern_entries
+        return value_matches, pattern_entries
     
     def _apply_value_overrides(self) -> None:
         """Apply explicit value overrides from configuration."""
-        for path, value in self.config.values.items():
-            elements = self._find_elements_by_path(path)
-            
-            for element in elements:
-                if '@' in path:
-                    # Attribute override
-                    attr_name = path.split('@')[-1]
-                    resolved_value = self.config._resolve_value(value)
-                    element.set(attr_name, resolved_value)
-                    self.applied_overrides['values'].append(f"{path} = {resolved_value}")
-                else:
-                    # Element text override
-                    resolved_value = self.config._resolve_value(value)
-                    element.text = resolved_value
-                    self.applied_overrides['values'].append(f"{path} = {resolved_value}")
+        for entry, matching_elements in enumerate(self._matched_values):
+            resolve = self._value_resolver(self._matchers.value_entries[entry][2])
+            for element in matching_elements:
+                self._set_value_override(element, entry, resolve)
+    
+    def _set_value_override(self, element: ET.Element, entry: int, resolve: Callable[[], str]) -> None:
+        """Apply one value entry to an element."""
+        path, attr_name, _ = self._matchers.value_entries[entry]
+        resolved_value = resolve()
+        if attr_name is not None:
+            # Attribute override
+            element.set(attr_name, resolved_value)
+        else:
+            # Element text override
+            element.text = resolved_value
+        self._record_override('values', path, None, resolved_value)
     
     def _apply_pattern_overrides(self) -> None:
         """Apply pattern-based overrides to matching elements."""
-        for pattern, value in self.config.patterns.items():
-            matching_elements = self._find_elements_by_pattern(pattern)
-            
+        for entry, matching_elements in enumerate(self._matched_patterns):
+            resolve = self._value_resolver(self._matchers.pattern_entries[entry][1])
             for element, element_path in matching_elements:
-                if '@' in pattern:
-                    # Attribute pattern
-                    attr_pattern = pattern.split('@')[-1]
-                    for attr_name in element.attrib.keys():
-                        if self._pattern_matches(attr_pattern, attr_name):
-                            resolved_value = self.config._resolve_value(value)
-                            element.set(attr_name, resolved_value)
-                            self.applied_overrides['patterns'].append(f"{element_path}@{attr_name} = {resolved_value}")
-                else:
-                    # Element pattern
-                    resolved_value = self.config._resolve_value(value)
-                    element.text = resolved_value
-                    self.applied_overrides['patterns'].append(f"{element_path} = {resolved_value}")
+                self._set_pattern_override(element, element_path, entry, resolve)
+    
+    def _set_pattern_override(self, element: ET.Element, element_path: str, entry: int,
+                              resolve: Callable[[], str]) -> None:
+        """Apply one pattern entry to an element found under element_path."""
+        pattern, _, attr_test = self._matchers.pattern_entries[entry]
+        if '@' in pattern:
+            # Attribute pattern: matched attributes are updated together
+            changes = {attr_name: resolve() for attr_name in element.attrib.keys() if attr_test(attr_name)}
+            if changes:
+                element.attrib.update(changes)
+                self.override_counts['patterns'] += len(changes)
+                if self._audit:
+                    self._applied_raw['patterns'].extend(
+                        (element_path, attr_name, resolved_value) for attr_name, resolved_value in changes.items()
+                    )
+        else:
+            # Element pattern
+            resolved_value = resolve()
+            element.text = resolved_value
+            self._record_override('patterns', element_path, None, resolved_value)
     
     def _apply_template_overrides(self) -> None:
         """Apply template-based data overrides."""
         # This is a simplified implementation
         # Full template engine will be implemented in Phase 2.2
-        for path, value in self.config.values.items():
-            if isinstance(value, str) and value.startswith('@'):
-                elements = self._find_elements_by_path(path)
-                
-                for element in elements:
-                    template_data = self.config._resolve_template_reference(value)
-                    if template_data and template_data != value:
+        for entry in self._matchers.template_entries:
+            path, _, value = self._matchers.value_entries[entry]
+            matching_elements = self._matched_values[entry]
+            if matching_elements:
+                # Template references resolve to the same data every time
+                template_data = self.config._resolve_template_reference(value)
+                if template_data and template_data != value:
+                    for element in matching_elements:
                         # For now, just set as text content
                         # Full template resolution will be enhanced later
                         element.text = template_data
-                        self.applied_overrides['templates'].append(f"{path} = {template_data}")
+                        self._record_override('templates', path, None, template_data)
     
     def _apply_attribute_overrides(self) -> None:
         """Apply dedicated attribute overrides."""
         for attr_selector, value in self.config.attributes.items():
             matching_elements = self._find_elements_by_attribute_selector(attr_selector)
             
+            resolve = self._value_resolver(value)
             for element, attr_name in matching_elements:
-                resolved_value = self.config._resolve_value(value)
-                element.set(attr_name, resolved_value)
-                element_path = self._get_element_path(element)
-                self.applied_overrides['attributes'].append(f"{element_path}@{attr_name} = {resolved_value}")
+                self._set_attribute_override(element, self._get_element_path(element), attr_name, resolve)
+    
+    def _set_attribute_override(self, element: ET.Element, element_path: str, attr_name: str,
+                                resolve: Callable[[], str]) -> None:
+        """Apply one attribute selector match to an element."""
+        resolved_value = resolve()
+        element.set(attr_name, resolved_value)
+        self._record_override('attributes', element_path, attr_name, resolved_value)
+    
+    def _record_override(self, kind: str, path: str, attr_name: Optional[str], resolved_value: str) -> None:
+        """Count an applied override, keeping its record only when auditing."""
+        self.override_counts[kind] += 1
+        if self._audit:
+            self._applied_raw[kind].append((path, attr_name, resolved_value))
+    
+    def _value_resolver(self, value: Any) -> Callable[[], str]:
+        """
+        Return a function giving the resolved value for each application of an override.
+        
+        Generator specs draw a new value every call; anything else resolves
+        to the same string, so it is resolved at most once.
+        """
+        if self.config._value_is_generated(value):
+            return lambda: self.config._resolve_value(value)
+        
+        resolved: List[str] = []
+        
+        def resolve_once() -> str:
+            if not resolved:
+                resolved.append(self.config._resolve_value(value))
+            return resolved[0]
+        return resolve_once
     
     def _apply_namespace_prefixes(self) -> None:
         """Apply namespace prefixes to elements based on configuration."""
@@ -242,143 +642,83 @@ class XMLOverrideEngine:
         # Full namespace support will be enhanced based on requirements
         pass
     
-    def _find_elements_by_path(self, path: str) -> List[ET.Element]:
-        """Find elements matching the given path specification."""
-        elements = []
-        
-        # Handle absolute paths
-        if path.startswith('/'):
-            # Remove attribute part if present
-            element_path = path.split('@')[0]
-            if element_path in self.element_index:
-                result = self.element_index[element_path]
-                if isinstance(result, list):
-                    elements.extend(result)
-                else:
-                    elements.append(result)
-        
-        # Handle dot notation
-        elif '.' in path and not path.startswith('@'):
-            xpath_path = '/' + path.replace('.', '/')
-            element_path = xpath_path.split('@')[0]
-            if element_path in self.element_index:
-                result = self.element_index[element_path]
-                if isinstance(result, list):
-                    elements.extend(result)
-                else:
-                    elements.append(result)
-        
-        # Handle simple element names
-        else:
-            element_name = path.split('@')[0]
-            # Find all elements with this name
-            for indexed_path, element_or_list in self.element_index.items():
-                if indexed_path.endswith(f'/{element_name}') or indexed_path.endswith(f'/{element_name}[1]'):
-                    if isinstance(element_or_list, list):
-                        elements.extend(element_or_list)
-                    else:
-                        elements.append(element_or_list)
-        
-        return elements
-    
-    def _find_elements_by_pattern(self, pattern: str) -> List[Tuple[ET.Element, str]]:
-        """Find elements matching the given pattern."""
-        matching_elements = []
-        
-        # Convert wildcard pattern to regex
+    def _compile_override_pattern(self, pattern: str) -> Tuple[Optional[Callable[[str], Any]], Optional[Callable[[str], Any]]]:
+        """Compile a pattern key into (element test, attribute test); None matches anything."""
         if '@' in pattern:
             # Attribute pattern handling
             element_pattern, attr_pattern = pattern.split('@', 1)
-            element_regex = element_pattern.replace('*', '.*') if element_pattern else '.*'
-            
-            for path, element_or_list in self.element_index.items():
-                elements = element_or_list if isinstance(element_or_list, list) else [element_or_list]
-                
-                for element in elements:
-                    element_name = self._get_local_name(element.tag)
-                    if re.match(f'^{element_regex}$', element_name) or element_pattern == '*':
-                        matching_elements.append((element, path))
-        else:
-            # Element pattern
-            element_regex = pattern.replace('*', '.*')
-            
-            for path, element_or_list in self.element_index.items():
-                elements = element_or_list if isinstance(element_or_list, list) else [element_or_list]
-                
-                for element in elements:
-                    element_name = self._get_local_name(element.tag)
-                    if re.match(f'^{element_regex}$', element_name):
-                        matching_elements.append((element, path))
+            element_test = None
+            if element_pattern and element_pattern != '*':
+                element_test = _glob_tester(element_pattern)
+            return element_test, _glob_tester(attr_pattern)
         
-        return matching_elements
+        # Element pattern
+        return _glob_tester(pattern), None
     
     def _find_elements_by_attribute_selector(self, selector: str) -> List[Tuple[ET.Element, str]]:
         """Find elements matching XPath-style attribute selector."""
-        matching_elements = []
-        
-        # Parse selector: //*[@AttributeName] or //Element/@Attribute
-        if selector.startswith('//'):
-            if '@' in selector:
-                parts = selector.split('@')
-                element_part = parts[0].strip('/')
-                attr_part = parts[1].strip('[]')
-                
-                for path, element_or_list in self.element_index.items():
-                    elements = element_or_list if isinstance(element_or_list, list) else [element_or_list]
-                    
-                    for element in elements:
-                        element_name = self._get_local_name(element.tag)
-                        
-                        # Check element match
-                        element_matches = (element_part == '*' or 
-                                         element_part == '' or 
-                                         element_part == element_name)
-                        
-                        if element_matches and attr_part in element.attrib:
-                            matching_elements.append((element, attr_part))
+        parsed = parse_attribute_selector(selector)
+        if parsed is None:
+            return []
+        element_part, attr_part = parsed
         
-        return matching_elements
+        selector_xpath = self._xpath_cache.get(selector)
+        if selector_xpath is None:
+            selector_xpath = self._xpath_cache[selector] = self._compile_attribute_selector(element_part, attr_part)
+        xpath, variables = selector_xpath
+        
+        return [(element, attr_part) for element in xpath(self.root, **variables)]
+    
+    def _compile_attribute_selector(self, element_part: Optional[str], attr_part: str) -> Tuple[ET.XPath, Dict[str, str]]:
+        """Compile a parsed attribute selector into an XPath over local names plus its variables."""
+        # Attribute names match like keys of element.attrib: plain, or {uri}local
+        attr_ns = ''
+        attr_name = attr_part
+        if attr_part.startswith('{') and '}' in attr_part:
+            attr_ns, attr_name = attr_part[1:].split('}', 1)
+        variables = {'attr_ns': attr_ns, 'attr': attr_name}
+        
+        attr_test = "@*[namespace-uri() = $attr_ns and local-name() = $attr]"
+        if element_part is None:
+            return ET.XPath(f"//*[{attr_test}]"), variables
+        
+        variables['name'] = element_part
+        return ET.XPath(f"//*[local-name() = $name][{attr_test}]"), variables
     
     def _pattern_matches(self, pattern: str, text: str) -> bool:
         """Check if pattern matches text."""
-        regex_pattern = pattern.replace('*', '.*')
-        return bool(re.match(f'^{regex_pattern}$', text))
-    
-    def _get_local_name(self, tag: str) -> str:
-        """Extract local name from potentially namespaced tag."""
-        if '}' in tag:
-            return tag.split('}')[1]
-        return tag
+        return bool(_glob_tester(pattern)(text))
     
     def _get_element_path(self, element: ET.Element) -> str:
         """Get the full path of an element in the tree."""
-        # This is a simplified implementation
-        # A full implementation would traverse up the tree
-        element_name = self._get_local_name(element.tag)
-        
-        # Try to find the path in our index
-        for path, indexed_element in self.element_index.items():
-            if isinstance(indexed_element, ET.Element) and indexed_element is element:
-                return path
-            elif isinstance(indexed_element, list) and element in indexed_element:
-                return path
-        
-        return element_name
+        # Paths are recorded while indexing; elements added since fall back to their name
+        element_path = self._element_to_path.get(element)
+        if element_path is not None:
+            return element_path
+        return _local_name(element.tag)
     
     def _tree_to_string(self) -> str:
         """Convert ElementTree back to XML string."""
-        # Register namespaces for proper output
-        for prefix, uri in self.namespace_map.items():
-            if prefix:  # Don't register empty prefix
-                ET.register_namespace(prefix, uri)
-        
-        return ET.tostring(self.root, encoding='unicode', xml_declaration=True)
+        # lxml only writes a declaration for byte output
+        return ET.tostring(self.root, encoding='utf-8', xml_declaration=True).decode('utf-8')
     
-    def get_override_summary(self) -> Dict[str, List[str]]:
-        """Get summary of applied overrides for debugging."""
-        return self.applied_overrides.copy()
+    def get_override_summary(self) -> Dict[str, Union[List[str], int]]:
+        """
+        Get summary of applied overrides for debugging.
+        
+        Returns:
+            Formatted "path@attribute = value" records per stage when auditing,
+            otherwise the number of overrides applied per stage
+        """
+        if not self._audit:
+            return self.override_counts.copy()
+        return {
+            kind: [f"{path}@{attr_name} = {value}" if attr_name is not None else f"{path} = {value}"
+                   for path, attr_name, value in records]
+            for kind, records in self._applied_raw.items()
+        }
     
     def __repr__(self) -> str:
         """String representation of override engine."""
-        total_overrides = sum(len(overrides) for overrides in self.applied_overrides.values())
+        total_overrides = sum(self.override_counts.values())
         return f"XMLOverrideEngine(config='{self.config.schema}', overrides_applied={total_overrides})"
\ No newline at end of file
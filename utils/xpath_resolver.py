@@ -22,37 +22,172 @@ Architecture:
 """
 
 import re
+import sys
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Union, Tuple, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
+from lxml import etree as LET
 
-class PathType(Enum):
-    """Types of path expressions supported."""
-    ABSOLUTE = "absolute"           # /Root/Element/Child
-    DOT_NOTATION = "dot_notation"   # Parent.Child.Element
-    SIMPLE = "simple"               # Element
-    PATTERN = "pattern"             # *ID, */Address
-    ATTRIBUTE = "attribute"         # Element@attr, /Root@attr
-    NAMESPACE_QUALIFIED = "ns_qualified"  # {ns}Element
 
+# Path parsing regex patterns, shared by every resolver
+_RE_ABSOLUTE = re.compile(r'^/[\w\[\]/@{}\.:-]+$')
+_RE_DOT = re.compile(r'^[\w@{}]+(?:\.[\w\[\]@{}]+)*$')
+_RE_SIMPLE = re.compile(r'^[\w@{}\[\]]+$')
+_RE_INDEX = re.compile(r'(\w+)\[(\d+)\]')
+_RE_ATTR = re.compile(r'(.+)@(\w+)$')
+_RE_PATTERN = re.compile(r'[*]')
 
-@dataclass
+# Simple-name lookup for lxml trees, evaluated by libxml2 from the root; the name is passed as a variable
+_LXML_BY_LOCAL_NAME = LET.XPath('descendant-or-self::*[local-name() = $name]')
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a wildcard pattern where '*' matches any run of characters and all else is literal."""
+    return re.compile('^' + re.escape(pattern).replace(r'\*', '.*') + '$')
+
+
+# Slotted dataclasses drop the per-instance __dict__ (dataclass(slots=...) needs Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class PathType(IntEnum):
+    """Types of path expressions supported (int-valued, so dispatch hashes in C)."""
+    ABSOLUTE = 1                    # /Root/Element/Child
+    DOT_NOTATION = 2                # Parent.Child.Element
+    SIMPLE = 3                      # Element
+    PATTERN = 4                     # *ID, */Address
+    ATTRIBUTE = 5                   # Element@attr, /Root@attr
+    NAMESPACE_QUALIFIED = 6         # {ns}Element
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class PathExpression:
-    """Parsed representation of a path expression."""
+    """Parsed representation of a path expression (immutable, so parses can be shared)."""
     original: str
     path_type: PathType
-    components: List[str]
+    components: Tuple[str, ...]
     attribute: Optional[str] = None
     namespace_prefix: Optional[str] = None
     has_index: bool = False
-    indices: List[int] = None
+    indices: Tuple[int, ...] = ()
     is_pattern: bool = False
+
+
+# Characters that make a path anything other than a plain element name
+_PATH_SYNTAX_CHARS = frozenset('@{/.*[')
+
+# Precedence order: absolute > namespace > dot_notation > simple > attribute > pattern
+_PATH_TYPE_PRECEDENCE = {
+    PathType.ABSOLUTE: 1000,
+    PathType.DOT_NOTATION: 800,
+    PathType.SIMPLE: 600,
+    PathType.ATTRIBUTE: 400,
+    PathType.PATTERN: 200,
+    PathType.NAMESPACE_QUALIFIED: 900
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> PathExpression:
+    """Parse a path expression; results are shared, so repeated paths are parsed once."""
+    # Plain element names are the common case and need none of the analysis below
+    if _PATH_SYNTAX_CHARS.isdisjoint(path):
+        return PathExpression(original=path, path_type=PathType.SIMPLE, components=(path,), indices=(1,))
+    
+    original_path = path
     
-    def __post_init__(self):
-        if self.indices is None:
-            self.indices = []
+    # Check for attribute specification
+    attribute = None
+    if '@' in path:
+        path_part, attribute = path.rsplit('@', 1)
+        path = path_part
+    
+    # Check for namespace qualification
+    namespace_prefix = None
+    if path.startswith('{'):
+        # "{ns}" followed by at least one word character
+        end = path.find('}')
+        name_end = end + 1
+        while name_end < len(path) and (path[name_end].isalnum() or path[name_end] == '_'):
+            name_end += 1
+        if end > 1 and name_end > end + 1:
+            namespace_prefix = path[1:end]
+            # A bare "{ns}Name" keeps its local name as the single component
+            path = path[name_end:] or path[end + 1:name_end]
+    
+    # Check for patterns
+    is_pattern = '*' in path
+    
+    # Determine path type
+    if path.startswith('/'):
+        path_type = PathType.ABSOLUTE
+        components = [c for c in path.strip('/').split('/') if c]
+    elif '.' in path and not is_pattern:
+        path_type = PathType.DOT_NOTATION
+        components = path.split('.')
+    elif is_pattern:
+        path_type = PathType.PATTERN
+        components = _parse_pattern_components(path)
+    else:
+        path_type = PathType.SIMPLE
+        components = [path] if path else []
+    
+    # Handle special cases
+    if attribute:
+        path_type = PathType.ATTRIBUTE if path_type == PathType.SIMPLE else path_type
+    
+    if namespace_prefix:
+        path_type = PathType.NAMESPACE_QUALIFIED
+    
+    # Parse indices in components
+    indices = []
+    has_index = False
+    processed_components = []
+    
+    for component in components:
+        # Most components carry no index; skip the regex for those
+        index_match = _RE_INDEX.search(component) if '[' in component else None
+        if index_match:
+            element_name = index_match.group(1)
+            index = int(index_match.group(2))
+            processed_components.append(element_name)
+            indices.append(index)
+            has_index = True
+        else:
+            processed_components.append(component)
+            indices.append(1)  # Default to first occurrence
+    
+    return PathExpression(
+        original=original_path,
+        path_type=path_type,
+        components=tuple(processed_components),
+        attribute=attribute,
+        namespace_prefix=namespace_prefix,
+        has_index=has_index,
+        indices=tuple(indices),
+        is_pattern=is_pattern
+    )
+
+
+@lru_cache(maxsize=4096)
+def _local_name(tag: str) -> str:
+    """Extract local name from potentially namespaced tag (a document has few distinct tags)."""
+    return tag.rpartition('}')[2]
+
+
+def _parse_pattern_components(pattern_path: str) -> List[str]:
+    """Parse pattern path into components."""
+    if '/' in pattern_path:
+        return [c for c in pattern_path.strip('/').split('/') if c]
+    elif '.' in pattern_path:
+        return pattern_path.split('.')
+    else:
+        return [pattern_path]
 
 
 class XPathResolverError(Exception):
@@ -69,6 +204,15 @@ class XPathResolver:
     path formats with namespace awareness and efficient matching.
     """
     
+    PATH_PATTERNS = MappingProxyType({
+        'absolute': _RE_ABSOLUTE,
+        'dot_notation': _RE_DOT,
+        'simple': _RE_SIMPLE,
+        'index': _RE_INDEX,
+        'attribute': _RE_ATTR,
+        'pattern': _RE_PATTERN,
+    })
+    
     def __init__(self, namespace_map: Optional[Dict[str, str]] = None):
         """
         Initialize XPath resolver.
@@ -77,18 +221,9 @@ class XPathResolver:
             namespace_map: Mapping of namespace prefixes to URIs
         """
         self.namespace_map = namespace_map or {}
-        self.compiled_patterns = {}
         
-        # Path parsing regex patterns
-        self.path_patterns = {
-            'absolute': re.compile(r'^/[\w\[\]/@{}\.:-]+$'),
-            'dot_notation': re.compile(r'^[\w@{}]+(?:\.[\w\[\]@{}]+)*$'),
-            'simple': re.compile(r'^[\w@{}\[\]]+$'),
-            'namespace': re.compile(r'\{([^}]+)\}(\w+)'),
-            'index': re.compile(r'(\w+)\[(\d+)\]'),
-            'attribute': re.compile(r'(.+)@(\w+)$'),
-            'pattern': re.compile(r'[*]'),
-        }
+        # Selectors compiled once per path string
+        self._selectors: Dict[str, Callable[[ET.ElementTree], List[ET.Element]]] = {}
     
     def parse_path(self, path: str) -> PathExpression:
         """
@@ -106,73 +241,7 @@ class XPathResolver:
         if not path or not isinstance(path, str):
             raise XPathResolverError(f"Invalid path: {path}")
         
-        original_path = path
-        
-        # Check for attribute specification
-        attribute = None
-        if '@' in path:
-            path_part, attribute = path.rsplit('@', 1)
-            path = path_part
-        
-        # Check for namespace qualification
-        namespace_prefix = None
-        if path.startswith('{') and '}' in path:
-            ns_match = self.path_patterns['namespace'].match(path)
-            if ns_match:
-                namespace_prefix = ns_match.group(1)
-                path = path[len(ns_match.group(0)):]
-        
-        # Check for patterns
-        is_pattern = '*' in path
-        
-        # Determine path type
-        if path.startswith('/'):
-            path_type = PathType.ABSOLUTE
-            components = [c for c in path.strip('/').split('/') if c]
-        elif '.' in path and not is_pattern:
-            path_type = PathType.DOT_NOTATION
-            components = path.split('.')
-        elif is_pattern:
-            path_type = PathType.PATTERN
-            components = self._parse_pattern_components(path)
-        else:
-            path_type = PathType.SIMPLE
-            components = [path] if path else []
-        
-        # Handle special cases
-        if attribute:
-            path_type = PathType.ATTRIBUTE if path_type == PathType.SIMPLE else path_type
-        
-        if namespace_prefix:
-            path_type = PathType.NAMESPACE_QUALIFIED
-        
-        # Parse indices in components
-        indices = []
-        has_index = False
-        processed_components = []
-        
-        for component in components:
-            index_match = self.path_patterns['index'].search(component)
-            if index_match:
-                element_name = index_match.group(1)
-                index = int(index_match.group(2))
-                processed_components.append(element_name)
-                indices.append(index)
-                has_index = True
-            else:
-                processed_components.append(component)
-                indices.append(1)  # Default to first occurrence
-        
-        return PathExpression(
-            original=original_path,
-            path_type=path_type,
-            components=processed_components,
-            attribute=attribute,
-            namespace_prefix=namespace_prefix,
-            has_index=has_index,
-            indices=indices,
-            is_pattern=is_pattern
-        )
+        return _parse_path(path)
     
     def find_elements(self, xml_tree: ET.ElementTree, path_expression: PathExpression) -> List[ET.Element]:
         """
@@ -185,18 +254,10 @@ class XPathResolver:
         Returns:
             List of matching elements
         """
-        if path_expression.path_type == PathType.ABSOLUTE:
-            return self._find_by_absolute_path(xml_tree, path_expression)
-        elif path_expression.path_type == PathType.DOT_NOTATION:
-            return self._find_by_dot_notation(xml_tree, path_expression)
-        elif path_expression.path_type == PathType.SIMPLE:
-            return self._find_by_simple_name(xml_tree, path_expression)
-        elif path_expression.path_type == PathType.PATTERN:
-            return self._find_by_pattern(xml_tree, path_expression)
-        elif path_expression.path_type == PathType.NAMESPACE_QUALIFIED:
-            return self._find_by_namespace(xml_tree, path_expression)
-        else:
+        finder = self._FINDERS.get(path_expression.path_type)
+        if finder is None:
             return []
+        return finder(self, xml_tree, path_expression)
     
     def resolve_path(self, xml_tree: ET.ElementTree, path: str) -> List[ET.Element]:
         """
@@ -209,9 +270,87 @@ class XPathResolver:
         Returns:
             List of matching elements
         """
+        try:
+            return self.compile(path)(xml_tree)
+        except Exception as e:
+            raise XPathResolverError(f"Failed to resolve path '{path}': {e}") from e
+    
+    def compile(self, path: str) -> Callable[[ET.ElementTree], List[ET.Element]]:
+        """
+        Compile a path string into a selector over XML trees.
+        
+        The path type is dispatched once, and selectors are cached per path
+        string, so repeated queries skip both parsing and dispatch.
+        
+        Args:
+            path: Path string to compile
+            
+        Returns:
+            Function taking an XML tree and returning the matching elements
+            
+        Raises:
+            XPathResolverError: If path syntax is invalid
+        """
+        selector = self._selectors.get(path)
+        if selector is None:
+            selector = self._selectors[path] = self._make_selector(self.parse_path(path))
+        return selector
+    
+    def _make_selector(self, path_expr: PathExpression) -> Callable[[ET.ElementTree], List[ET.Element]]:
+        """Bind a parsed path expression to the finder for its path type."""
+        finder = self._FINDERS.get(path_expr.path_type)
+        if finder is None:
+            return lambda xml_tree: []
+        return lambda xml_tree: finder(self, xml_tree, path_expr)
+    
+    def resolve_in_file(self, source: Union[str, BinaryIO], path: str) -> List[ET.Element]:
+        """
+        Resolve a path against an XML file without keeping the whole document.
+        
+        Simple-name and pattern paths are matched while streaming; subtrees that
+        cannot belong to a match are cleared as soon as they are parsed, so the
+        matches come back complete but detached from cleared ancestors. Other
+        path types need the full tree and are resolved as in resolve_path.
+        
+        Args:
+            source: File path or binary file object of the XML document
+            path: Path string to resolve
+        
+        Returns:
+            List of matching elements in document order
+        """
         try:
             path_expr = self.parse_path(path)
-            return self.find_elements(xml_tree, path_expr)
+            if path_expr.path_type not in (PathType.SIMPLE, PathType.NAMESPACE_QUALIFIED, PathType.PATTERN):
+                return self.find_elements(ET.parse(source), path_expr)
+            if not path_expr.components:
+                return []
+            
+            # Each test takes the element's full tag
+            element_name = path_expr.components[0]
+            if path_expr.path_type == PathType.PATTERN:
+                pattern = _compile_glob(element_name)
+                matches = lambda tag: pattern.match(_local_name(tag))
+            elif path_expr.path_type == PathType.NAMESPACE_QUALIFIED:
+                namespace_uri = self.namespace_map.get(path_expr.namespace_prefix, path_expr.namespace_prefix)
+                matches = f"{{{namespace_uri}}}{element_name}".__eq__
+            else:
+                matches = lambda tag: _local_name(tag) == element_name
+            
+            matching_elements = []
+            open_matches = 0  # matched elements currently open; their subtrees are kept
+            for event, element in ET.iterparse(source, events=('start', 'end')):
+                is_match = matches(element.tag)
+                if event == 'start':
+                    if is_match:
+                        matching_elements.append(element)
+                        open_matches += 1
+                elif is_match:
+                    open_matches -= 1
+                elif not open_matches:
+                    element.clear()
+            
+            return matching_elements
         except Exception as e:
             raise XPathResolverError(f"Failed to resolve path '{path}': {e}") from e
     
@@ -226,12 +365,7 @@ class XPathResolver:
         Returns:
             True if pattern matches
         """
-        # Compile pattern if not already cached
-        if pattern not in self.compiled_patterns:
-            regex_pattern = pattern.replace('*', '.*')
-            self.compiled_patterns[pattern] = re.compile(f'^{regex_pattern}$')
-        
-        return bool(self.compiled_patterns[pattern].match(element_name))
+        return _compile_glob(pattern).match(element_name) is not None
     
     def get_element_path(self, element: ET.Element, root: ET.Element) -> str:
         """
@@ -263,51 +397,38 @@ class XPathResolver:
     def _find_by_absolute_path(self, xml_tree: ET.ElementTree, path_expr: PathExpression) -> List[ET.Element]:
         """Find elements by absolute path."""
         root = xml_tree.getroot()
-        current_elements = [root]
         
         # Skip root component if it matches
         components = path_expr.components[:]
         if components and self._get_local_name(root.tag) == components[0]:
             components = components[1:]
         
-        # Traverse each component
+        # Chain one lazy step per component; only the final level is materialized
+        current_elements: Iterable[ET.Element] = (root,)
         for i, component in enumerate(components):
-            next_elements = []
             target_index = path_expr.indices[i] if i < len(path_expr.indices) else 1
-            
-            for element in current_elements:
-                matching_children = []
-                for child in element:
-                    if self._get_local_name(child.tag) == component:
-                        matching_children.append(child)
-                
-                # Apply index if specified
-                if path_expr.has_index and target_index <= len(matching_children):
-                    next_elements.append(matching_children[target_index - 1])
-                else:
-                    next_elements.extend(matching_children)
-            
-            current_elements = next_elements
-            if not current_elements:
-                break
+            current_elements = self._step_children(current_elements, component, target_index, path_expr.has_index)
         
-        return current_elements
+        return list(current_elements)
+    
+    def _step_children(self, parents: Iterable[ET.Element], component: str, target_index: int,
+                       has_index: bool) -> Iterator[ET.Element]:
+        """Yield the children named component of each parent, or only the indexed one when in range."""
+        for element in parents:
+            # Children are read from the live tree on every query, so edits are always seen
+            matching_children = [child for child in element
+                                 if isinstance(child.tag, str) and _local_name(child.tag) == component]
+            
+            # Apply index if specified; an out-of-range index keeps every match
+            if has_index and target_index <= len(matching_children):
+                yield matching_children[target_index - 1]
+            else:
+                yield from matching_children
     
     def _find_by_dot_notation(self, xml_tree: ET.ElementTree, path_expr: PathExpression) -> List[ET.Element]:
         """Find elements by dot notation path."""
-        # Convert dot notation to absolute path and reuse logic
-        absolute_path = '/' + '/'.join(path_expr.components)
-        absolute_expr = PathExpression(
-            original=absolute_path,
-            path_type=PathType.ABSOLUTE,
-            components=path_expr.components,
-            attribute=path_expr.attribute,
-            namespace_prefix=path_expr.namespace_prefix,
-            has_index=path_expr.has_index,
-            indices=path_expr.indices,
-            is_pattern=path_expr.is_pattern
-        )
-        return self._find_by_absolute_path(xml_tree, absolute_expr)
+        # Absolute-path matching only reads components and indices
+        return self._find_by_absolute_path(xml_tree, path_expr)
     
     def _find_by_simple_name(self, xml_tree: ET.ElementTree, path_expr: PathExpression) -> List[ET.Element]:
         """Find elements by simple name throughout the tree."""
@@ -315,52 +436,39 @@ class XPathResolver:
             return []
         
         element_name = path_expr.components[0]
-        matching_elements = []
-        
-        def find_recursive(element):
-            if self._get_local_name(element.tag) == element_name:
-                matching_elements.append(element)
-            for child in element:
-                find_recursive(child)
-        
-        find_recursive(xml_tree.getroot())
-        return matching_elements
+        if isinstance(xml_tree, LET._ElementTree):
+            return _LXML_BY_LOCAL_NAME(xml_tree.getroot(), name=element_name)
+        return [element for element in xml_tree.getroot().iter()
+                if _local_name(element.tag) == element_name]
     
     def _find_by_pattern(self, xml_tree: ET.ElementTree, path_expr: PathExpression) -> List[ET.Element]:
         """Find elements by pattern matching."""
-        matching_elements = []
-        pattern = path_expr.components[0] if path_expr.components else '*'
-        
-        def find_recursive(element):
-            element_name = self._get_local_name(element.tag)
-            if self.match_pattern(element_name, pattern):
-                matching_elements.append(element)
-            for child in element:
-                find_recursive(child)
-        
-        find_recursive(xml_tree.getroot())
-        return matching_elements
+        pattern = _compile_glob(path_expr.components[0] if path_expr.components else '*')
+        return [element for element in xml_tree.getroot().iter()
+                if pattern.match(_local_name(element.tag))]
     
     def _find_by_namespace(self, xml_tree: ET.ElementTree, path_expr: PathExpression) -> List[ET.Element]:
         """Find elements by namespace-qualified name."""
-        # This is a simplified implementation
-        # Full namespace support would require more sophisticated handling
-        return self._find_by_simple_name(xml_tree, path_expr)
-    
-    def _parse_pattern_components(self, pattern_path: str) -> List[str]:
-        """Parse pattern path into components."""
-        if '/' in pattern_path:
-            return [c for c in pattern_path.strip('/').split('/') if c]
-        elif '.' in pattern_path:
-            return pattern_path.split('.')
-        else:
-            return [pattern_path]
+        if not path_expr.components:
+            return []
+        
+        # The braces hold a namespace URI or a prefix from the resolver's namespace map;
+        # iter() then filters on the full "{uri}local" tag in C
+        namespace_uri = self.namespace_map.get(path_expr.namespace_prefix, path_expr.namespace_prefix)
+        return list(xml_tree.getroot().iter(f"{{{namespace_uri}}}{path_expr.components[0]}"))
+    
+    # Finder for each path type; attribute-only paths select no elements
+    _FINDERS = MappingProxyType({
+        PathType.ABSOLUTE: _find_by_absolute_path,
+        PathType.DOT_NOTATION: _find_by_dot_notation,
+        PathType.SIMPLE: _find_by_simple_name,
+        PathType.PATTERN: _find_by_pattern,
+        PathType.NAMESPACE_QUALIFIED: _find_by_namespace,
+    })
     
     def _get_local_name(self, tag: str) -> str:
         """Extract local name from potentially namespaced tag."""
-        if '}' in tag:
-            return tag.split('}')[1]
-        return tag
+        return _local_name(tag)
     
     def validate_path_syntax(self, path: str) -> bool:
         """
@@ -391,74 +499,72 @@ class XPathResolver:
         try:
             path_expr = self.parse_path(path)
             
-            # Rebuild path in normalized format
+            # Only absolute and dot paths are rebuilt; other forms keep their
+            # original text, which already carries indices, attribute and namespace
             if path_expr.path_type == PathType.ABSOLUTE:
-                normalized = '/' + '/'.join(path_expr.components)
+                separator = '/'
             elif path_expr.path_type == PathType.DOT_NOTATION:
-                normalized = '.'.join(path_expr.components)
+                separator = '.'
             else:
-                normalized = path_expr.original
+                return path_expr.original
             
-            # Add indices if present
+            # Rebuild path in normalized format, with non-default indices in one pass
+            components = path_expr.components
             if path_expr.has_index:
-                components = normalized.split('/' if normalized.startswith('/') else '.')
-                for i, index in enumerate(path_expr.indices):
-                    if i < len(components) and index != 1:
-                        components[i] = f"{components[i]}[{index}]"
-                
-                separator = '/' if normalized.startswith('/') else '.'
-                normalized = separator.join(components)
-                if normalized.startswith('/'):
-                    normalized = '/' + normalized.lstrip('/')
+                components = [f"{component}[{index}]" if index != 1 else component
+                              for component, index in zip(components, path_expr.indices)]
+            normalized = separator.join(components)
+            if separator == '/':
+                normalized = '/' + normalized
             
             # Add attribute if present
             if path_expr.attribute:
                 normalized = f"{normalized}@{path_expr.attribute}"
             
-            # Add namespace if present
-            if path_expr.namespace_prefix:
-                normalized = f"{{{path_expr.namespace_prefix}}}{normalized}"
-            
             return normalized
             
         except XPathResolverError:
             return path  # Return original if can't normalize
     
-    def get_path_precedence(self, path: str) -> int:
+    def precedence_key(self, path: str) -> int:
         """
-        Get precedence score for path (higher = higher precedence).
+        Get a sort key ranking paths by precedence (higher = higher precedence).
+        
+        The key is the precedence score itself, so sorting with ``key=`` orders
+        paths exactly as get_path_precedence ranks them, with one call per path.
         
         Args:
-            path: Path to score
+            path: Path to rank
             
         Returns:
             Precedence score
         """
         try:
             path_expr = self.parse_path(path)
-            
-            # Precedence order: absolute > dot_notation > simple > pattern
-            precedence_map = {
-                PathType.ABSOLUTE: 1000,
-                PathType.DOT_NOTATION: 800,
-                PathType.SIMPLE: 600,
-                PathType.ATTRIBUTE: 400,
-                PathType.PATTERN: 200,
-                PathType.NAMESPACE_QUALIFIED: 900
-            }
-            
-            base_score = precedence_map.get(path_expr.path_type, 0)
-            
-            # Bonus for specificity
-            component_bonus = len(path_expr.components) * 50
-            index_bonus = 100 if path_expr.has_index else 0
-            attribute_bonus = 150 if path_expr.attribute else 0
-            
-            return base_score + component_bonus + index_bonus + attribute_bonus
-            
         except XPathResolverError:
             return 0
+        
+        base_score = _PATH_TYPE_PRECEDENCE.get(path_expr.path_type, 0)
+        
+        # Bonus for specificity
+        component_bonus = len(path_expr.components) * 50
+        index_bonus = 100 if path_expr.has_index else 0
+        attribute_bonus = 150 if path_expr.attribute else 0
+        
+        return base_score + component_bonus + index_bonus + attribute_bonus
+    
+    def get_path_precedence(self, path: str) -> int:
+        """
+        Get precedence score for path (higher = higher precedence).
+        
+        Args:
+            path: Path to score
+            
+        Returns:
+            Precedence score
+        """
+        return self.precedence_key(path)
     
     def __repr__(self) -> str:
         """String representation of resolver."""
-        return f"XPathResolver(namespaces={len(self.namespace_map)}, patterns_cached={len(self.compiled_patterns)})"
\ No newline at end of file
+        return f"XPathResolver(namespaces={len(self.namespace_map)}, patterns_cached={_compile_glob.cache_info().currsize})"
\ No newline at end of file